@@ -0,0 +1,40 @@
+"""Add url_hash column to documents for duplicate-URL lookups.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "documents",
+        sa.Column("url_hash", sa.BigInteger(), nullable=True),
+    )
+    # Same value as src.document.domain.mapper.url_hash: the first 8 bytes of
+    # the URL's MD5 digest as a signed big-endian 64-bit integer.
+    op.execute(
+        "UPDATE documents SET url_hash = ('x' || substr(md5(url), 1, 16))::bit(64)::bigint"
+    )
+    op.alter_column("documents", "url_hash", nullable=False)
+    op.create_index(
+        "ix_documents_notebook_url_hash",
+        "documents",
+        ["notebook_id", "url_hash"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_documents_notebook_url_hash", table_name="documents")
+    op.drop_column("documents", "url_hash")
@@ -0,0 +1,38 @@
+"""Store evaluation chunk id and score lists as JSONB.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_LIST_COLUMNS = (
+    ("evaluation_test_cases", "ground_truth_chunk_ids"),
+    ("evaluation_test_case_results", "retrieved_chunk_ids"),
+    ("evaluation_test_case_results", "retrieved_scores"),
+)
+
+
+def upgrade() -> None:
+    for table, column in _LIST_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb "
+            f"USING to_jsonb({column}::json)"
+        )
+
+
+def downgrade() -> None:
+    for table, column in _LIST_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE text "
+            f"USING {column}::text"
+        )
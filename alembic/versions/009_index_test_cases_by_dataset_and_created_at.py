@@ -0,0 +1,38 @@
+"""Index evaluation test cases by dataset and creation time.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_evaluation_test_cases_dataset_id_created_at",
+        "evaluation_test_cases",
+        ["dataset_id", "created_at"],
+    )
+    # The composite index's leading column covers plain dataset_id lookups
+    op.drop_index("ix_evaluation_test_cases_dataset_id", table_name="evaluation_test_cases")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_evaluation_test_cases_dataset_id",
+        "evaluation_test_cases",
+        ["dataset_id"],
+    )
+    op.drop_index(
+        "ix_evaluation_test_cases_dataset_id_created_at",
+        table_name="evaluation_test_cases",
+    )
@@ -0,0 +1,34 @@
+"""Index evaluation datasets and runs by parent and creation time.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, parent column) pairs whose listings filter by parent and order by created_at
+_LISTINGS = (
+    ("evaluation_datasets", "notebook_id"),
+    ("evaluation_runs", "dataset_id"),
+)
+
+
+def upgrade() -> None:
+    for table, column in _LISTINGS:
+        op.create_index(f"ix_{table}_{column}_created_at", table, [column, "created_at"])
+        op.drop_index(f"ix_{table}_{column}", table_name=table)
+
+
+def downgrade() -> None:
+    for table, column in _LISTINGS:
+        op.create_index(f"ix_{table}_{column}", table, [column])
+        op.drop_index(f"ix_{table}_{column}_created_at", table_name=table)
@@ -33,13 +33,19 @@ class ChunkRepository:
         return self._mapper.to_entity(merged)
 
     async def save_batch(self, entities: list[model.Chunk]) -> list[model.Chunk]:
-        """Save multiple chunks efficiently."""
+        """Insert multiple new chunks with one batched INSERT.
+
+        Unlike save, rows are not merged: every chunk must be new, as after
+        delete_by_document. The driver sends the rows as multi-row VALUES
+        batches instead of a SELECT and INSERT per chunk.
+        """
         if not entities:
             return []
 
-        records = [self._mapper.to_record(entity) for entity in entities]
-        for record in records:
-            await self._session.merge(record)
+        await self._session.execute(
+            sqlalchemy.insert(chunk_schema.ChunkSchema),
+            [self._mapper.to_values(entity) for entity in entities],
+        )
         await self._session.flush()
         return entities
 
@@ -1,16 +1,28 @@
 """Mapper between Chunk entity and ORM schema."""
 
+from collections.abc import Iterable
+from typing import Any
+
+import pgvector
+
 from src.chunk.domain import model
 from src.infrastructure.models import chunk as chunk_schema
 
 
+def _to_float_list(embedding: pgvector.HalfVector | Iterable[float]) -> list[float]:
+    """Convert a halfvec loaded from the database, or the list it was set from, to floats."""
+    if isinstance(embedding, pgvector.HalfVector):
+        return embedding.to_list()
+    return list(embedding)
+
+
 class ChunkMapper:
     """Maps between Chunk domain entity and ORM schema."""
 
     @staticmethod
     def to_entity(record: chunk_schema.ChunkSchema) -> model.Chunk:
         """Convert ORM record to domain entity."""
-        embedding = list(record.embedding) if record.embedding is not None else None
+        embedding = _to_float_list(record.embedding) if record.embedding is not None else None
         return model.Chunk(
             id=record.id,
             document_id=record.document_id,
@@ -23,17 +35,22 @@ class ChunkMapper:
             created_at=record.created_at,
         )
 
+    @staticmethod
+    def to_values(entity: model.Chunk) -> dict[str, Any]:
+        """Convert domain entity to column values for a bulk insert."""
+        return {
+            "id": entity.id,
+            "document_id": entity.document_id,
+            "content": entity.content,
+            "char_start": entity.char_start,
+            "char_end": entity.char_end,
+            "chunk_index": entity.chunk_index,
+            "token_count": entity.token_count,
+            "embedding": entity.embedding,
+            "created_at": entity.created_at,
+        }
+
     @staticmethod
     def to_record(entity: model.Chunk) -> chunk_schema.ChunkSchema:
         """Convert domain entity to ORM record."""
-        return chunk_schema.ChunkSchema(
-            id=entity.id,
-            document_id=entity.document_id,
-            content=entity.content,
-            char_start=entity.char_start,
-            char_end=entity.char_end,
-            chunk_index=entity.chunk_index,
-            token_count=entity.token_count,
-            embedding=entity.embedding,
-            created_at=entity.created_at,
-        )
+        return chunk_schema.ChunkSchema(**ChunkMapper.to_values(entity))
@@ -128,6 +128,8 @@ async def _run_evaluation(
             rag_agent = deps._build_rag_agent()
             llm_judge = judge_module.LLMJudge(
                 eval_model=settings_module.settings.eval_model,
+                max_concurrency=settings_module.settings.eval_max_concurrency,
+                response_cache=deps._build_response_cache(),
             )
 
         handler = deps.build_run_evaluation_handler(
@@ -1,10 +1,13 @@
 """CLI dependency factory functions for building handlers from a session."""
 
+import functools
+
 import sqlalchemy.ext.asyncio
 
 from src import settings as settings_module
 from src.chunk.adapter import repository as chunk_repository_module
 from src.chunk.adapter.embedding import openai_embedding
+from src.common import cache
 from src.conversation.adapter import repository as conversation_repository_module
 from src.conversation.handler import handlers as conversation_handlers
 from src.crawl.adapter import repository as crawl_repository_module
@@ -19,6 +22,7 @@ from src.document.service.chunking import service as chunking_service_module
 from src.evaluation.adapter import generator as generator_module
 from src.evaluation.adapter import judge as judge_module
 from src.evaluation.adapter import repository as evaluation_repository_module
+from src.evaluation.adapter import response_cache as response_cache_module
 from src.evaluation.handler import handlers as evaluation_handlers
 from src.notebook.adapter import repository as notebook_repository_module
 from src.notebook.handler import handlers as notebook_handlers
@@ -55,7 +59,32 @@ def _build_background_ingestion_service() -> ingestion_module.BackgroundIngestio
         embedding_provider=embedding_provider,
         chunking_service=chunking_service,
     )
-    return ingestion_module.BackgroundIngestionService(pipeline=pipeline)
+    return ingestion_module.BackgroundIngestionService(
+        pipeline=pipeline,
+        max_workers=settings_module.settings.ingestion_max_workers,
+        max_queue_size=settings_module.settings.ingestion_queue_size,
+    )
+
+
+@functools.cache
+def _build_source_totals_cache() -> cache.TTLCache[str, int]:
+    """Build the cache of per-notebook source totals.
+
+    Built once and shared, so every handler that adds sources invalidates
+    the totals the list handler reads.
+    """
+    return cache.TTLCache(
+        maxsize=settings_module.settings.source_total_cache_size,
+        ttl_seconds=settings_module.settings.source_total_cache_ttl_seconds,
+    )
+
+
+def _build_response_cache() -> response_cache_module.ResponseCache | None:
+    """Build the evaluation LLM response cache, if one is configured."""
+    return response_cache_module.build_response_cache(
+        directory=settings_module.settings.eval_response_cache_dir,
+        ttl_seconds=settings_module.settings.eval_response_cache_ttl_seconds,
+    )
 
 
 def _build_background_crawl_service(
@@ -68,6 +97,7 @@ def _build_background_crawl_service(
         document_repository=document_repository_module.DocumentRepository(session),
         link_discovery=link_discovery_module.LinkDiscoveryService(),
         background_ingestion=background_ingestion,
+        source_totals=_build_source_totals_cache(),
     )
     return crawl_service_module.BackgroundCrawlService(crawl_service=crawl_service)
 
@@ -124,8 +154,8 @@ def build_add_source_handler(
     background_ingestion = _build_background_ingestion_service()
     handler = document_handlers.AddSourceHandler(
         document_repository=document_repository_module.DocumentRepository(session),
-        notebook_repository=notebook_repository_module.NotebookRepository(session),
         background_ingestion=background_ingestion,
+        source_totals=_build_source_totals_cache(),
     )
     return handler, background_ingestion
 
@@ -145,7 +175,7 @@ def build_list_sources_handler(
     """Build ListSourcesHandler."""
     return document_handlers.ListSourcesHandler(
         document_repository=document_repository_module.DocumentRepository(session),
-        notebook_repository=notebook_repository_module.NotebookRepository(session),
+        source_totals=_build_source_totals_cache(),
     )
 
 
@@ -276,6 +306,8 @@ def build_generate_dataset_handler(
         dataset_repository=evaluation_repository_module.DatasetRepository(session),
         test_generator=generator_module.SyntheticTestGenerator(
             eval_model=settings_module.settings.eval_model,
+            max_concurrency=settings_module.settings.eval_max_concurrency,
+            response_cache=_build_response_cache(),
         ),
     )
 
@@ -302,6 +334,7 @@ def build_run_evaluation_handler(
         retrieval_service=_build_retrieval_service(session),
         rag_agent=rag_agent,
         llm_judge=llm_judge,
+        max_concurrency=settings_module.settings.eval_max_concurrency,
     )
 
 
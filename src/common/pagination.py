@@ -1,19 +1,30 @@
 """Pagination utilities."""
 
+import base64
+import datetime
 from typing import Generic, TypeVar
 
 import pydantic
 
+from src import exceptions
+
 T = TypeVar("T")
 
+_CURSOR_SEPARATOR = "|"
+
 
 class ListQuery(pydantic.BaseModel):
-    """Base query for paginated list operations."""
+    """Base query for paginated list operations.
+
+    Repositories that support keyset pagination use cursor instead of the
+    page offset when it is set.
+    """
 
     model_config = pydantic.ConfigDict(extra="forbid")
 
     page: int = pydantic.Field(default=1, ge=1)
     size: int = pydantic.Field(default=10, ge=1, le=100)
+    cursor: str | None = None
 
     @property
     def offset(self) -> int:
@@ -22,16 +33,27 @@ class ListQuery(pydantic.BaseModel):
 
 
 class PaginationSchema(pydantic.BaseModel, Generic[T]):
-    """Generic pagination response schema."""
+    """Generic pagination response schema.
+
+    page is None for pages fetched by cursor.
+    """
 
     items: list[T]
     total: int
-    page: int
+    page: int | None
     size: int
     pages: int
+    next_cursor: str | None = None
 
     @classmethod
-    def create(cls, items: list[T], total: int, page: int, size: int) -> "PaginationSchema[T]":
+    def create(
+        cls,
+        items: list[T],
+        total: int,
+        page: int | None,
+        size: int,
+        next_cursor: str | None = None,
+    ) -> "PaginationSchema[T]":
         """Create pagination response."""
         pages = (total + size - 1) // size if size > 0 else 0
         return cls(
@@ -40,4 +62,21 @@ class PaginationSchema(pydantic.BaseModel, Generic[T]):
             page=page,
             size=size,
             pages=pages,
+            next_cursor=next_cursor,
         )
+
+
+def encode_cursor(created_at: datetime.datetime, id: str) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor."""
+    raw = f"{created_at.isoformat()}{_CURSOR_SEPARATOR}{id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime.datetime, str]:
+    """Decode a cursor produced by encode_cursor into (created_at, id)."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, id = raw.split(_CURSOR_SEPARATOR, 1)
+        return datetime.datetime.fromisoformat(created_at), id
+    except ValueError as exc:
+        raise exceptions.ValidationError(f"Invalid cursor: {cursor}") from exc
@@ -0,0 +1,20 @@
+"""Text utilities."""
+
+TRUNCATION_MARKER = "\n...[truncated]...\n"
+# Per-chunk cap on content inlined into LLM prompts. About twice a regular
+# chunk (chunk_size tokens at ~4 chars each), so only runaway chunks are clipped.
+MAX_CHUNK_CHARS = 8000
+
+
+def clip_middle(text: str, max_chars: int) -> str:
+    """Clip text to at most max_chars by cutting out its middle.
+
+    The head and tail are kept, since both tend to carry context (a
+    heading and a conclusion), and a marker shows where text was removed.
+    """
+    if len(text) <= max_chars:
+        return text
+    keep = max(max_chars - len(TRUNCATION_MARKER), 0)
+    head = (keep + 1) // 2
+    tail = keep - head
+    return text[:head] + TRUNCATION_MARKER + (text[-tail:] if tail else "")
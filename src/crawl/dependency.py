@@ -36,6 +36,7 @@ class CrawlServiceContainer(containers.DeclarativeContainer):
         document_repository=document_adapter.repository,
         link_discovery=link_discovery,
         background_ingestion=document_service.background_ingestion,
+        source_totals=document_service.source_totals,
     )
 
     background_crawl = providers.Singleton(
@@ -4,6 +4,7 @@ import asyncio
 import collections
 import logging
 
+from src.common import cache
 from src.crawl.adapter import repository as crawl_repo_module
 from src.crawl.domain import model
 from src.crawl.service import link_discovery as link_discovery_module
@@ -23,11 +24,13 @@ class CrawlService:
         document_repository: doc_repo_module.DocumentRepository,
         link_discovery: link_discovery_module.LinkDiscoveryService,
         background_ingestion: ingestion_module.BackgroundIngestionService,
+        source_totals: cache.TTLCache[str, int],
     ) -> None:
         self._crawl_repository = crawl_repository
         self._document_repository = document_repository
         self._link_discovery = link_discovery
         self._background_ingestion = background_ingestion
+        self._source_totals = source_totals
 
     async def execute(self, crawl_job_id: str) -> model.CrawlJob:
         """Execute a crawl job using BFS traversal."""
@@ -119,9 +122,10 @@ class CrawlService:
             url=url,
         )
         saved_doc = await self._document_repository.save(document)
+        self._source_totals.invalidate(notebook_id)
 
         # Trigger background ingestion
-        self._background_ingestion.trigger_ingestion(saved_doc)
+        await self._background_ingestion.trigger_ingestion(saved_doc)
 
         # Record discovered URL
         discovered = model.DiscoveredUrl.create(url=url, depth=depth)
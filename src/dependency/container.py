@@ -33,7 +33,6 @@ class ApplicationContainer(containers.DeclarativeContainer):
     document = providers.Container(
         DocumentContainer,
         db_session=db_session,
-        notebook_adapter=notebook.adapter,
     )
 
     query = providers.Container(
@@ -8,6 +8,7 @@ from src.document.domain import mapper as document_mapper_module
 from src.document.domain import model
 from src.document.domain import status as document_status_module
 from src.infrastructure.models import document as document_schema
+from src.infrastructure.models import notebook as notebook_schema
 
 
 class DocumentRepository:
@@ -31,9 +32,14 @@ class DocumentRepository:
     async def find_by_notebook_and_url(
         self, notebook_id: str, url: str
     ) -> model.Document | None:
-        """Find document by notebook ID and URL."""
+        """Find document by notebook ID and URL.
+
+        Looks up by the indexed url_hash; the url comparison guards against
+        hash collisions.
+        """
         stmt = sqlalchemy.select(document_schema.DocumentSchema).where(
             document_schema.DocumentSchema.notebook_id == notebook_id,
+            document_schema.DocumentSchema.url_hash == document_mapper_module.url_hash(url),
             document_schema.DocumentSchema.url == url,
         )
         result = await self._session.execute(stmt)
@@ -58,6 +64,33 @@ class DocumentRepository:
         await self._session.flush()
         return result.rowcount > 0
 
+    async def url_exists_in_notebook(self, notebook_id: str, url: str) -> bool | None:
+        """Check whether a URL is already a source of a notebook.
+
+        Notebook existence and the duplicate-URL lookup share one query.
+
+        Returns:
+            None if the notebook does not exist, otherwise whether the URL exists.
+        """
+        stmt = (
+            sqlalchemy.select(document_schema.DocumentSchema.id)
+            .select_from(notebook_schema.NotebookSchema)
+            .outerjoin(
+                document_schema.DocumentSchema,
+                sqlalchemy.and_(
+                    document_schema.DocumentSchema.notebook_id == notebook_schema.NotebookSchema.id,
+                    document_schema.DocumentSchema.url_hash == document_mapper_module.url_hash(url),
+                    document_schema.DocumentSchema.url == url,
+                ),
+            )
+            .where(notebook_schema.NotebookSchema.id == notebook_id)
+        )
+        result = await self._session.execute(stmt)
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return row.id is not None
+
     async def list_by_notebook(
         self, notebook_id: str, query: pagination.ListQuery
     ) -> pagination.PaginationSchema[model.Document]:
@@ -70,24 +103,99 @@ class DocumentRepository:
         )
         count_result = await self._session.execute(count_stmt)
         total = count_result.scalar_one()
+        return await self._fetch_page(notebook_id, query, total)
+
+    async def list_by_notebook_verified(
+        self,
+        notebook_id: str,
+        query: pagination.ListQuery,
+        known_total: int | None = None,
+    ) -> pagination.PaginationSchema[model.Document] | None:
+        """List documents for a notebook, checking the notebook exists.
 
-        # Fetch page
+        Notebook existence, the total count and the page are fetched in one
+        round-trip: the page is a CTE left-joined to the notebook row, so a
+        missing notebook yields no rows and an empty page yields one row of
+        NULLs. When the caller already knows the total, the COUNT is skipped.
+
+        Returns:
+            None if the notebook does not exist, otherwise the requested page.
+        """
+        if known_total is None:
+            total_column = (
+                sqlalchemy.select(sqlalchemy.func.count())
+                .select_from(document_schema.DocumentSchema)
+                .where(document_schema.DocumentSchema.notebook_id == notebook_id)
+                .scalar_subquery()
+            )
+        else:
+            total_column = sqlalchemy.literal(known_total)
+        page = self._page_statement(notebook_id, query).cte("page")
         stmt = (
-            sqlalchemy.select(document_schema.DocumentSchema)
-            .where(document_schema.DocumentSchema.notebook_id == notebook_id)
-            .order_by(document_schema.DocumentSchema.created_at.desc())
-            .offset(query.offset)
-            .limit(query.size)
+            sqlalchemy.select(total_column.label("total"), *page.c)
+            .select_from(notebook_schema.NotebookSchema)
+            .outerjoin(page, sqlalchemy.true())
+            .where(notebook_schema.NotebookSchema.id == notebook_id)
+            .order_by(page.c.created_at.desc(), page.c.id.desc())
         )
         result = await self._session.execute(stmt)
-        records = result.scalars().all()
+        rows = result.tuples().all()
+        if not rows:
+            return None
+        total = rows[0][0]
+        page_rows = [row[1:] for row in rows if row[1] is not None]
+        return self._build_page(self._mapper.rows_to_entities(page_rows), query, total)
+
+    async def _fetch_page(
+        self, notebook_id: str, query: pagination.ListQuery, total: int
+    ) -> pagination.PaginationSchema[model.Document]:
+        """Fetch one page of a notebook's documents, newest first."""
+        result = await self._session.execute(self._page_statement(notebook_id, query))
+        items = self._mapper.rows_to_entities(result.tuples().all())
+        return self._build_page(items, query, total)
+
+    def _page_statement(
+        self, notebook_id: str, query: pagination.ListQuery
+    ) -> sqlalchemy.Select:
+        """Build the query for one page of a notebook's documents, newest first.
+
+        With a cursor, rows are sought by (created_at, id) keyset instead of
+        skipping an offset. One row past the page is fetched to tell whether
+        another page follows.
+        """
+        created_at_column = document_schema.DocumentSchema.created_at
+        id_column = document_schema.DocumentSchema.id
+        stmt = sqlalchemy.select(*document_mapper_module.ROW_COLUMNS).where(
+            document_schema.DocumentSchema.notebook_id == notebook_id
+        )
+        if query.cursor is not None:
+            cursor_created_at, cursor_id = pagination.decode_cursor(query.cursor)
+            stmt = stmt.where(
+                sqlalchemy.tuple_(created_at_column, id_column)
+                < (cursor_created_at, cursor_id)
+            )
+        else:
+            stmt = stmt.offset(query.offset)
+        return stmt.order_by(created_at_column.desc(), id_column.desc()).limit(query.size + 1)
+
+    def _build_page(
+        self, items: list[model.Document], query: pagination.ListQuery, total: int
+    ) -> pagination.PaginationSchema[model.Document]:
+        """Wrap a page of documents fetched with one extra row.
 
-        items = [self._mapper.to_entity(record) for record in records]
+        Only a page followed by more rows carries the cursor of its last item,
+        and a cursor page has no page number.
+        """
+        next_cursor = None
+        if len(items) > query.size:
+            items = items[: query.size]
+            next_cursor = pagination.encode_cursor(items[-1].created_at, items[-1].id)
         return pagination.PaginationSchema.create(
             items=items,
             total=total,
-            page=query.page,
+            page=query.page if query.cursor is None else None,
             size=query.size,
+            next_cursor=next_cursor,
         )
 
     async def list_by_status(
@@ -3,6 +3,7 @@
 from dependency_injector import containers, providers
 
 from src.chunk.adapter.embedding import openai_embedding
+from src.common import cache
 from src.document.adapter.extractor import composite
 from src.document.adapter import repository as document_repository_module
 from src.document.handler import handlers
@@ -46,6 +47,14 @@ class DocumentServiceContainer(containers.DeclarativeContainer):
     background_ingestion = providers.Singleton(
         ingestion_pipeline_module.BackgroundIngestionService,
         pipeline=ingestion_pipeline,
+        max_workers=settings_module.settings.ingestion_max_workers,
+        max_queue_size=settings_module.settings.ingestion_queue_size,
+    )
+
+    source_totals = providers.Singleton(
+        cache.TTLCache,
+        maxsize=settings_module.settings.source_total_cache_size,
+        ttl_seconds=settings_module.settings.source_total_cache_ttl_seconds,
     )
 
 
@@ -53,14 +62,13 @@ class DocumentHandlerContainer(containers.DeclarativeContainer):
     """Container for document handlers."""
 
     adapter = providers.DependenciesContainer()
-    notebook_adapter = providers.DependenciesContainer()
     service = providers.DependenciesContainer()
 
     add_source_handler = providers.Factory(
         handlers.AddSourceHandler,
         document_repository=adapter.repository,
-        notebook_repository=notebook_adapter.repository,
         background_ingestion=service.background_ingestion,
+        source_totals=service.source_totals,
     )
 
     get_document_handler = providers.Factory(
@@ -71,7 +79,7 @@ class DocumentHandlerContainer(containers.DeclarativeContainer):
     list_sources_handler = providers.Factory(
         handlers.ListSourcesHandler,
         document_repository=adapter.repository,
-        notebook_repository=notebook_adapter.repository,
+        source_totals=service.source_totals,
     )
 
 
@@ -79,7 +87,6 @@ class DocumentContainer(containers.DeclarativeContainer):
     """Root document container."""
 
     db_session = providers.Dependency()
-    notebook_adapter = providers.DependenciesContainer()
 
     adapter = providers.Container(
         DocumentAdapterContainer,
@@ -94,6 +101,5 @@ class DocumentContainer(containers.DeclarativeContainer):
     handler = providers.Container(
         DocumentHandlerContainer,
         adapter=adapter,
-        notebook_adapter=notebook_adapter,
         service=service,
     )
@@ -1,9 +1,41 @@
 """Mapper between Document entity and ORM schema."""
 
+import hashlib
+from collections.abc import Sequence
+from typing import Any
+
 from src.document.domain import model
 from src.document.domain.status import DocumentStatus
 from src.infrastructure.models import document as document_schema
 
+# Column order shared by row-based list queries and DocumentMapper.rows_to_entities.
+ROW_COLUMNS = (
+    document_schema.DocumentSchema.id,
+    document_schema.DocumentSchema.notebook_id,
+    document_schema.DocumentSchema.url,
+    document_schema.DocumentSchema.title,
+    document_schema.DocumentSchema.status,
+    document_schema.DocumentSchema.error_message,
+    document_schema.DocumentSchema.content_hash,
+    document_schema.DocumentSchema.created_at,
+    document_schema.DocumentSchema.updated_at,
+)
+
+_ROW_FIELDS = tuple(column.key for column in ROW_COLUMNS)
+_STATUS_INDEX = _ROW_FIELDS.index("status")
+_STATUS_LOOKUP = {status.value: status for status in DocumentStatus}
+_URL_HASH_BYTES = 8
+
+
+def url_hash(url: str) -> int:
+    """Hash a URL to a signed 64-bit integer for indexed duplicate lookups.
+
+    Uses the first 8 bytes of the MD5 digest so the value can also be
+    computed in SQL (see migration 006). Not a security hash.
+    """
+    digest = hashlib.md5(url.encode(), usedforsecurity=False).digest()
+    return int.from_bytes(digest[:_URL_HASH_BYTES], "big", signed=True)
+
 
 class DocumentMapper:
     """Maps between Document domain entity and ORM schema."""
@@ -23,6 +55,23 @@ class DocumentMapper:
             updated_at=record.updated_at,
         )
 
+    @staticmethod
+    def rows_to_entities(rows: Sequence[Sequence[Any]]) -> list[model.Document]:
+        """Convert column tuples selected with ROW_COLUMNS to domain entities.
+
+        Rows come straight from the database, so entities are built column-wise
+        with model_construct instead of re-validating every field per row.
+        """
+        if not rows:
+            return []
+
+        columns = list(zip(*rows))
+        columns[_STATUS_INDEX] = [_STATUS_LOOKUP[status] for status in columns[_STATUS_INDEX]]
+        return [
+            model.Document.model_construct(**dict(zip(_ROW_FIELDS, values)))
+            for values in zip(*columns)
+        ]
+
     @staticmethod
     def to_record(entity: model.Document) -> document_schema.DocumentSchema:
         """Convert domain entity to ORM record."""
@@ -30,6 +79,7 @@ class DocumentMapper:
             id=entity.id,
             notebook_id=entity.notebook_id,
             url=entity.url,
+            url_hash=url_hash(entity.url),
             title=entity.title,
             status=entity.status.value,
             error_message=entity.error_message,
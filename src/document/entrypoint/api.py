@@ -39,12 +39,16 @@ async def list_sources(
     notebook_id: str,
     page: int = fastapi.Query(1, ge=1),
     size: int = fastapi.Query(10, ge=1, le=100),
+    cursor: str | None = fastapi.Query(None, description="next_cursor of the previous page"),
     handler: handlers.ListSourcesHandler = fastapi.Depends(
         Provide[container_module.ApplicationContainer.document.handler.list_sources_handler]
     ),
 ) -> pagination.PaginationSchema[response.DocumentDetail]:
-    """List sources in a notebook with pagination."""
-    qry = query.ListSources(notebook_id=notebook_id, page=page, size=size)
+    """List sources in a notebook with pagination.
+
+    Pass the previous page's next_cursor as cursor to page by keyset instead of offset.
+    """
+    qry = query.ListSources(notebook_id=notebook_id, page=page, size=size, cursor=cursor)
     return await handler.handle(qry)
 
 
@@ -1,12 +1,11 @@
 """Document command and query handlers."""
 
 from src import exceptions
-from src.common import pagination
+from src.common import cache, pagination
 from src.document.adapter import repository as document_repository_module
 from src.document.domain import model
 from src.document.schema import command, query, response
 from src.document.service import ingestion_pipeline
-from src.notebook.adapter import repository as notebook_repository_module
 
 
 class AddSourceHandler:
@@ -15,28 +14,25 @@ class AddSourceHandler:
     def __init__(
         self,
         document_repository: document_repository_module.DocumentRepository,
-        notebook_repository: notebook_repository_module.NotebookRepository,
         background_ingestion: ingestion_pipeline.BackgroundIngestionService,
+        source_totals: cache.TTLCache[str, int],
     ) -> None:
         self._document_repository = document_repository
-        self._notebook_repository = notebook_repository
         self._background_ingestion = background_ingestion
+        self._source_totals = source_totals
 
     async def handle(
         self, notebook_id: str, cmd: command.AddSource
     ) -> response.DocumentId:
         """Add a source URL to a notebook and trigger async ingestion."""
-        # Verify notebook exists
-        notebook = await self._notebook_repository.find_by_id(notebook_id)
-        if notebook is None:
-            raise exceptions.NotFoundError(f"Notebook not found: {notebook_id}")
-
-        # Check for duplicate URL
+        # Verify notebook exists and check for duplicate URL in one query
         url_str = str(cmd.url)
-        existing = await self._document_repository.find_by_notebook_and_url(
+        url_exists = await self._document_repository.url_exists_in_notebook(
             notebook_id, url_str
         )
-        if existing is not None:
+        if url_exists is None:
+            raise exceptions.NotFoundError(f"Notebook not found: {notebook_id}")
+        if url_exists:
             raise exceptions.ValidationError(
                 f"Source URL already exists in notebook: {url_str}"
             )
@@ -48,11 +44,12 @@ class AddSourceHandler:
             title=cmd.title,
         )
         saved = await self._document_repository.save(document)
+        self._source_totals.invalidate(notebook_id)
 
         # Trigger async ingestion (fire and forget)
-        self._background_ingestion.trigger_ingestion(saved)
+        await self._background_ingestion.trigger_ingestion(saved)
 
-        return response.DocumentId(id=saved.id)
+        return response.DocumentId.model_construct(id=saved.id)
 
 
 class GetDocumentHandler:
@@ -75,24 +72,36 @@ class ListSourcesHandler:
     def __init__(
         self,
         document_repository: document_repository_module.DocumentRepository,
-        notebook_repository: notebook_repository_module.NotebookRepository,
+        source_totals: cache.TTLCache[str, int],
     ) -> None:
         self._document_repository = document_repository
-        self._notebook_repository = notebook_repository
+        self._source_totals = source_totals
 
     async def handle(
         self, qry: query.ListSources
     ) -> pagination.PaginationSchema[response.DocumentDetail]:
-        """List sources for a notebook with pagination."""
-        # Verify notebook exists
-        notebook = await self._notebook_repository.find_by_id(qry.notebook_id)
-        if notebook is None:
+        """List sources for a notebook with pagination.
+
+        The total is counted on the first page and reused from a short-lived
+        cache for the following pages of the same notebook.
+        """
+        is_first_page = qry.page == 1 and qry.cursor is None
+        known_total = None if is_first_page else self._source_totals.get(qry.notebook_id)
+
+        # Verify notebook exists alongside the total count
+        result = await self._document_repository.list_by_notebook_verified(
+            qry.notebook_id, qry, known_total=known_total
+        )
+        if result is None:
             raise exceptions.NotFoundError(f"Notebook not found: {qry.notebook_id}")
+        if known_total is None:
+            # Only a fresh count starts a new TTL, so a cached total still expires
+            self._source_totals.set(qry.notebook_id, result.total)
 
-        result = await self._document_repository.list_by_notebook(qry.notebook_id, qry)
         return pagination.PaginationSchema.create(
             items=[response.DocumentDetail.from_entity(item) for item in result.items],
             total=result.total,
             page=result.page,
             size=result.size,
+            next_cursor=result.next_cursor,
         )
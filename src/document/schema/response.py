@@ -28,8 +28,12 @@ class DocumentDetail(pydantic.BaseModel):
 
     @classmethod
     def from_entity(cls, entity: model.Document) -> Self:
-        """Create response from domain entity."""
-        return cls(
+        """Create response from domain entity.
+
+        The entity is already validated, so fields are assigned without
+        re-running validation.
+        """
+        return cls.model_construct(
             id=entity.id,
             notebook_id=entity.notebook_id,
             url=entity.url,
@@ -1,10 +1,31 @@
 """Chunking service implementation."""
 
+import bisect
+import collections
+import functools
+import itertools
+import re
+
 import tiktoken
 
 from src.document.service.chunking import types as chunking_types
 from src import settings as settings_module
 
+ENCODING_CACHE_SIZE = 8
+# cl100k_base averages well over 2 characters per token, so content shorter
+# than chunk_size * 2 characters is likely to fit in a single chunk
+SHORT_CONTENT_CHARS_PER_TOKEN = 2
+_WORD_BOUNDARY_CHARS = (" ", "\n", "\t")
+# A line with its "\n", or a final unterminated line. Only "\n" ends a line;
+# str.splitlines would also break on "\r", form feeds and other separators.
+_LINE_RE = re.compile(r"[^\n]*\n|[^\n]+")
+
+
+@functools.lru_cache(maxsize=ENCODING_CACHE_SIZE)
+def _get_encoding(encoding_name: str) -> tiktoken.Encoding:
+    """Return a shared tiktoken encoding, built once per encoding name."""
+    return tiktoken.get_encoding(encoding_name)
+
 
 class ChunkingService:
     """Service for splitting content into chunks with position tracking.
@@ -21,7 +42,7 @@ class ChunkingService:
     ) -> None:
         self._chunk_size = chunk_size or settings_module.settings.chunk_size
         self._chunk_overlap = chunk_overlap or settings_module.settings.chunk_overlap
-        self._encoding = tiktoken.get_encoding(encoding_name)
+        self._encoding = _get_encoding(encoding_name)
 
     def chunk(self, content: str) -> list[chunking_types.ChunkedContent]:
         """Split content into chunks with accurate position tracking.
@@ -35,112 +56,188 @@ class ChunkingService:
         Returns:
             List of ChunkedContent with accurate position information.
         """
+        return self.chunk_batch([content])[0]
+
+    def chunk_batch(self, contents: list[str]) -> list[list[chunking_types.ChunkedContent]]:
+        """Split several contents into chunks with a single tokenizer call.
+
+        Content short enough for a single chunk is encoded once and returned
+        whole. Segments from the remaining contents are tokenized together by
+        one encode_batch call, which runs across tiktoken's worker threads,
+        and then assembled into chunks per content.
+
+        Args:
+            contents: The text contents to chunk.
+
+        Returns:
+            One list of ChunkedContent per content, in input order.
+        """
+        results = [self._chunk_short(content) for content in contents]
+        long_indices = [index for index, chunks in enumerate(results) if chunks is None]
+        long_chunks = self._chunk_long([contents[index] for index in long_indices])
+        for index, chunks in zip(long_indices, long_chunks):
+            results[index] = chunks
+        return results
+
+    def _chunk_short(self, content: str) -> list[chunking_types.ChunkedContent] | None:
+        """Chunk content that fits in one chunk without splitting it into segments.
+
+        Returns None when the content may need more than one chunk.
+        """
         if not content.strip():
             return []
+        if len(content) >= self._chunk_size * SHORT_CONTENT_CHARS_PER_TOKEN:
+            return None
+        if len(self._encoding.encode(content)) > self._chunk_size:
+            return None
+        return [self._create_chunk(content=content, char_start=0, chunk_index=0)]
+
+    def _chunk_long(self, contents: list[str]) -> list[list[chunking_types.ChunkedContent]]:
+        """Chunk contents segment by segment, tokenizing all segments in one call."""
+        # Split into sentences/paragraphs for natural boundaries
+        segments_per_content = [self._split_into_segments(content) for content in contents]
+        token_ids = self._encoding.encode_batch(
+            [text for segments in segments_per_content for _, text in segments]
+        )
+
+        results: list[list[chunking_types.ChunkedContent]] = []
+        offset = 0
+        for content, segments in zip(contents, segments_per_content):
+            segment_token_ids = token_ids[offset : offset + len(segments)]
+            offset += len(segments)
+            results.append(self._assemble_chunks(content, segments, segment_token_ids))
+        return results
 
+    def _assemble_chunks(
+        self,
+        content: str,
+        segments: list[tuple[int, str]],
+        segment_token_ids: list[list[int]],
+    ) -> list[chunking_types.ChunkedContent]:
+        """Group tokenized segments into chunks with overlap.
+
+        Segment token counts are prefix-summed once, so each chunk's last
+        segment is found with a binary search rather than a per-segment size
+        check. Only the trailing chunk_overlap token IDs are gathered for the
+        overlap, so no text is re-encoded.
+        """
         chunks: list[chunking_types.ChunkedContent] = []
+        if not segments:
+            return chunks
 
-        # Split into sentences/paragraphs for natural boundaries
-        segments = self._split_into_segments(content)
-
-        current_chunk_text = ""
-        current_chunk_start = 0
-        chunk_index = 0
-
-        for segment_start, segment_text in segments:
-            segment_tokens = len(self._encoding.encode(segment_text))
-            current_tokens = len(self._encoding.encode(current_chunk_text))
-
-            # If adding this segment exceeds chunk size, finalize current chunk
-            if current_tokens + segment_tokens > self._chunk_size and current_chunk_text:
-                chunk = self._create_chunk(
-                    content=current_chunk_text,
-                    char_start=current_chunk_start,
-                    chunk_index=chunk_index,
+        # cumulative_tokens[i] is the token count of segments[:i]
+        cumulative_tokens = list(itertools.accumulate(map(len, segment_token_ids), initial=0))
+        overlap_token_ids: collections.deque[int] = collections.deque(
+            maxlen=self._chunk_overlap
+        )
+        chunk_start = segments[0][0]
+        first = 0
+
+        while True:
+            # A chunk takes at least one new segment, then as many as still fit
+            budget = self._chunk_size - len(overlap_token_ids) + cumulative_tokens[first]
+            end = max(bisect.bisect_right(cumulative_tokens, budget, lo=first + 1) - 1, first + 1)
+            if end == len(segments):
+                break
+
+            segment_start = segments[end][0]
+            chunks.append(
+                self._create_chunk(
+                    content=content[chunk_start:segment_start],
+                    char_start=chunk_start,
+                    chunk_index=len(chunks),
                 )
-                chunks.append(chunk)
-                chunk_index += 1
+            )
 
-                # Calculate overlap start position
-                overlap_text, overlap_start = self._calculate_overlap(
-                    content, current_chunk_start, segment_start
-                )
-                current_chunk_text = overlap_text + segment_text
-                current_chunk_start = overlap_start
-            else:
-                if not current_chunk_text:
-                    current_chunk_start = segment_start
-                current_chunk_text += segment_text
+            chunk_tokens = len(overlap_token_ids) + cumulative_tokens[end] - cumulative_tokens[first]
+            overlap_token_ids = self._trailing_token_ids(
+                overlap_token_ids, segment_token_ids, cumulative_tokens, first, end
+            )
+            chunk_start = self._calculate_overlap_start(
+                content, chunk_start, segment_start, chunk_tokens, overlap_token_ids
+            )
+            first = end
 
         # Add final chunk
-        if current_chunk_text.strip():
-            chunk = self._create_chunk(
-                content=current_chunk_text,
-                char_start=current_chunk_start,
-                chunk_index=chunk_index,
+        final_text = content[chunk_start:]
+        if final_text.strip():
+            chunks.append(
+                self._create_chunk(
+                    content=final_text,
+                    char_start=chunk_start,
+                    chunk_index=len(chunks),
+                )
             )
-            chunks.append(chunk)
 
         return chunks
 
+    def _trailing_token_ids(
+        self,
+        carried_token_ids: collections.deque[int],
+        segment_token_ids: list[list[int]],
+        cumulative_tokens: list[int],
+        first: int,
+        end: int,
+    ) -> collections.deque[int]:
+        """Return the last chunk_overlap token IDs of a finished chunk.
+
+        The chunk is the carried overlap followed by segments[first:end]; only
+        the segments that reach into the overlap window are visited.
+        """
+        trailing = collections.deque(carried_token_ids, maxlen=self._chunk_overlap)
+        window_start = cumulative_tokens[end] - self._chunk_overlap
+        lo = max(bisect.bisect_right(cumulative_tokens, window_start, first, end) - 1, first)
+        for tokens in segment_token_ids[lo:end]:
+            trailing.extend(tokens)
+        return trailing
+
     def _split_into_segments(self, content: str) -> list[tuple[int, str]]:
-        """Split content into segments at natural boundaries.
+        """Split content into line segments, keeping each line ending.
 
         Returns list of (start_position, segment_text) tuples.
         """
-        segments: list[tuple[int, str]] = []
-
-        # Split by paragraph boundaries first
-        current_pos = 0
-        paragraph_delimiters = ["\n\n", "\n"]
+        segments = _LINE_RE.findall(content)
+        starts = itertools.accumulate(map(len, segments), initial=0)
+        return list(zip(starts, segments))
 
-        lines = content.split("\n")
-        for i, line in enumerate(lines):
-            # Include the newline in the segment (except for last line)
-            if i < len(lines) - 1:
-                segment = line + "\n"
-            else:
-                segment = line
-
-            if segment:  # Skip empty segments
-                segments.append((current_pos, segment))
-
-            current_pos += len(line) + (1 if i < len(lines) - 1 else 0)
-
-        return segments
-
-    def _calculate_overlap(
-        self, content: str, chunk_start: int, segment_start: int
-    ) -> tuple[str, int]:
-        """Calculate overlap text and start position for next chunk.
-
-        Returns (overlap_text, overlap_start_position).
+    def _calculate_overlap_start(
+        self,
+        content: str,
+        chunk_start: int,
+        segment_start: int,
+        chunk_token_count: int,
+        trailing_token_ids: collections.deque[int],
+    ) -> int:
+        """Calculate where the next chunk starts so it overlaps the finished one.
+
+        trailing_token_ids holds the last chunk_overlap token IDs of the
+        finished chunk, so its text is never re-encoded.
+
+        Returns the overlap start position; the overlap text is
+        content[overlap_start:segment_start].
         """
         if self._chunk_overlap == 0:
-            return "", segment_start
-
-        # Get the text we need to potentially include as overlap
-        previous_text = content[chunk_start:segment_start]
-
-        # Count tokens from the end to determine overlap
-        tokens = self._encoding.encode(previous_text)
+            return segment_start
 
-        if len(tokens) <= self._chunk_overlap:
-            return previous_text, chunk_start
+        if chunk_token_count <= self._chunk_overlap:
+            return chunk_start
 
         # Take only the last overlap_tokens worth of text
-        overlap_tokens = tokens[-self._chunk_overlap :]
-        overlap_text = self._encoding.decode(overlap_tokens)
+        overlap_text = self._encoding.decode(list(trailing_token_ids))
 
         # Find where this overlap text starts in the original
-        overlap_start = segment_start - len(overlap_text.encode().decode())
-
-        # Ensure we start at a word boundary
-        while overlap_start > chunk_start and content[overlap_start - 1] not in " \n\t":
-            overlap_start -= 1
+        overlap_start = segment_start - len(overlap_text)
+
+        # Ensure we start at a word boundary: just after the last whitespace
+        # before overlap_start, or at the chunk start if there is none
+        if overlap_start > chunk_start:
+            boundary = max(
+                content.rfind(whitespace, chunk_start, overlap_start)
+                for whitespace in _WORD_BOUNDARY_CHARS
+            )
+            overlap_start = boundary + 1 if boundary >= chunk_start else chunk_start
 
-        overlap_text = content[overlap_start:segment_start]
-        return overlap_text, overlap_start
+        return overlap_start
 
     def _create_chunk(
         self, content: str, char_start: int, chunk_index: int
@@ -1,16 +1,18 @@
 """Chunking types."""
 
-import pydantic
+import dataclasses
 
 
-class ChunkedContent(pydantic.BaseModel):
+@dataclasses.dataclass(frozen=True, slots=True)
+class ChunkedContent:
     """A chunk of content with position information.
 
     CRITICAL: char_start and char_end must be accurate for citation navigation.
     The original content[char_start:char_end] MUST equal this chunk's content.
-    """
 
-    model_config = pydantic.ConfigDict(frozen=True, extra="forbid")
+    A plain dataclass rather than a pydantic model: chunks are built internally
+    by ChunkingService, thousands per document, and never parsed from input.
+    """
 
     content: str
     char_start: int
@@ -31,11 +31,13 @@ class IngestionPipeline:
         embedding_provider: embedding_port.EmbeddingProviderPort,
         chunking_service: chunking_service_module.ChunkingService,
         batch_size: int = 10,
+        max_concurrency: int = 4,
     ) -> None:
         self._content_extractor = content_extractor
         self._embedding_provider = embedding_provider
         self._chunking_service = chunking_service
         self._batch_size = batch_size
+        self._max_concurrency = max_concurrency
 
     async def process(self, document_id: str) -> model.Document | None:
         """Process a document through the complete ingestion pipeline.
@@ -70,7 +72,10 @@ class IngestionPipeline:
 
                 # Step 2: Chunk content
                 logger.info(f"Chunking content: {extracted.word_count} words")
-                chunked_contents = self._chunking_service.chunk(extracted.content)
+                # Tokenization releases the GIL, so concurrent ingestions chunk in parallel
+                chunked_contents = await asyncio.to_thread(
+                    self._chunking_service.chunk, extracted.content
+                )
                 logger.info(f"Created {len(chunked_contents)} chunks")
 
                 # Step 3: Create chunk entities
@@ -123,59 +128,98 @@ class IngestionPipeline:
                 return document
 
     async def _generate_embeddings(self, chunks: list[chunk_model.Chunk]) -> list[chunk_model.Chunk]:
-        """Generate embeddings for chunks in batches."""
+        """Generate embeddings for chunks in concurrent batches.
+
+        At most max_concurrency batch requests are in flight at once to stay
+        within provider rate limits.
+        """
         if not chunks:
             return []
 
-        result: list[chunk_model.Chunk] = []
-
-        # Process in batches
-        for i in range(0, len(chunks), self._batch_size):
-            batch = chunks[i : i + self._batch_size]
-            texts = [chunk.content for chunk in batch]
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        batches = [
+            chunks[i : i + self._batch_size] for i in range(0, len(chunks), self._batch_size)
+        ]
+        batch_embeddings = await asyncio.gather(
+            *(self._embed_batch(batch, semaphore) for batch in batches)
+        )
 
-            embeddings = await self._embedding_provider.embed_batch(texts)
+        return [
+            chunk.with_embedding(embedding)
+            for batch, embeddings in zip(batches, batch_embeddings)
+            for chunk, embedding in zip(batch, embeddings)
+        ]
 
-            for chunk, embedding in zip(batch, embeddings):
-                result.append(chunk.with_embedding(embedding))
-
-        return result
+    async def _embed_batch(
+        self, batch: list[chunk_model.Chunk], semaphore: asyncio.Semaphore
+    ) -> list[list[float]]:
+        """Embed one batch of chunks while holding a concurrency slot."""
+        async with semaphore:
+            return await self._embedding_provider.embed_batch([chunk.content for chunk in batch])
 
 
 class BackgroundIngestionService:
-    """Service for triggering background ingestion of documents."""
+    """Service for triggering background ingestion of documents.
+
+    Documents are queued and processed by at most max_workers worker tasks,
+    so a burst of new sources cannot flood the event loop or the database
+    pool. Workers exit once the queue drains and are restarted on demand.
+    """
 
-    def __init__(self, pipeline: IngestionPipeline) -> None:
+    def __init__(
+        self,
+        pipeline: IngestionPipeline,
+        max_workers: int = 4,
+        max_queue_size: int = 1000,
+    ) -> None:
         self._pipeline = pipeline
-        self._tasks: dict[str, asyncio.Task] = {}  # type: ignore[type-arg]
+        self._max_workers = max_workers
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=max_queue_size)
+        self._workers: list[asyncio.Task] = []  # type: ignore[type-arg]
+        self._pending: set[str] = set()
 
-    def trigger_ingestion(self, document: model.Document) -> None:
-        """Trigger async ingestion for a document.
+    async def trigger_ingestion(self, document: model.Document) -> None:
+        """Queue a document for background ingestion.
 
-        Creates an asyncio task to process the document in the background.
-        The task uses its own database session, independent of the request.
+        Each worker uses its own database session, independent of the request.
+        When the queue is full this waits for a free slot, so callers are
+        slowed down rather than documents being left unqueued.
         """
-        if document.id in self._tasks:
-            # Already processing
+        if document.id in self._pending:
+            # Already queued or processing
             return
 
-        task = asyncio.create_task(self._process_with_cleanup(document.id))
-        self._tasks[document.id] = task
-
-    async def _process_with_cleanup(self, document_id: str) -> None:
-        """Process document and cleanup task reference."""
+        self._pending.add(document.id)
         try:
-            await self._pipeline.process(document_id)
-        except Exception as e:
-            logger.error(f"Background ingestion error for {document_id}: {e}")
-        finally:
-            self._tasks.pop(document_id, None)
+            await self._queue.put(document.id)
+        except asyncio.CancelledError:
+            self._pending.discard(document.id)
+            raise
+        self._ensure_workers()
+
+    def _ensure_workers(self) -> None:
+        """Start workers until max_workers are running or every item has one."""
+        self._workers = [worker for worker in self._workers if not worker.done()]
+        missing = min(self._max_workers, self._queue.qsize()) - len(self._workers)
+        for _ in range(missing):
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    async def _worker(self) -> None:
+        """Process queued documents until the queue is empty."""
+        while not self._queue.empty():
+            document_id = self._queue.get_nowait()
+            try:
+                await self._pipeline.process(document_id)
+            except Exception as e:
+                logger.error(f"Background ingestion error for {document_id}: {e}")
+            finally:
+                self._pending.discard(document_id)
+                self._queue.task_done()
 
     async def wait_for_all(self) -> None:
-        """Wait for all pending ingestion tasks to complete."""
-        if self._tasks:
-            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        """Wait for all queued ingestion work to complete."""
+        await self._queue.join()
 
     def is_processing(self, document_id: str) -> bool:
-        """Check if a document is currently being processed."""
-        return document_id in self._tasks
+        """Check if a document is queued or currently being processed."""
+        return document_id in self._pending
@@ -1,16 +1,29 @@
 """Synthetic test case generator using LLM."""
 
-import json
+import asyncio
+import itertools
 import logging
+import math
 import random
+import re
+from collections.abc import Iterable, Sized
 
+import pydantic
 import pydantic_ai
 
+from src import settings as settings_module
 from src.chunk.domain import model as chunk_model
+from src.common import text
+from src.evaluation.adapter import response_cache as response_cache_module
+from src.evaluation.adapter import retry as retry_module
 from src.evaluation.domain import model
 
 logger = logging.getLogger(__name__)
 
+QUESTION_MAX_TOKENS = 1024
+_SMALLEST_UNIT_RANDOM = 2.0**-53
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
 SYSTEM_PROMPT = """You are a test data generator for a retrieval evaluation system.
 Your task is to generate diverse, realistic questions that can be answered from the given passage.
 
@@ -19,7 +32,6 @@ Rules:
 - Do not generate yes/no questions
 - Generate diverse question types and classify each by difficulty
 - Questions should require information specifically from the passage to answer
-- Return valid JSON only
 
 Difficulty classifications:
 - factual: Direct information recall from the passage
@@ -27,25 +39,72 @@ Difficulty classifications:
 - inferential: Requires drawing conclusions beyond explicit text
 - paraphrased: Rewording of passage content"""
 
-USER_PROMPT_TEMPLATE = """Based on the following passage, generate exactly {count} questions that can be answered using the information in this passage.
+
+def format_question_prompt(count: int, content: str) -> str:
+    """Format the question generation prompt for one passage."""
+    return f"""Based on the following passage, generate exactly {count} questions that can be answered using the information in this passage.
 
 Passage:
-{content}
+{content}"""
+
+
+def _open_unit_random() -> float:
+    """Return a uniform random float in the open interval (0, 1)."""
+    return random.random() or _SMALLEST_UNIT_RANDOM
+
+
+def _reservoir_skip(weight: float) -> int:
+    """Draw how many items Algorithm L skips before the next replacement."""
+    return math.floor(math.log(_open_unit_random()) / math.log1p(-weight))
+
+
+def normalize_question(question: str) -> str:
+    """Normalize a question for duplicate detection.
 
-Return your response as a JSON object with this exact format:
-{{"questions": [{{"text": "question 1", "difficulty": "factual"}}, ...]}}
+    Case, punctuation and whitespace differences are ignored.
+    """
+    return " ".join(_PUNCTUATION_RE.sub(" ", question.lower()).split())
 
-Valid difficulty values: factual, analytical, inferential, paraphrased"""
+
+class GeneratedQuestion(pydantic.BaseModel):
+    """A generated question with its difficulty classification."""
+
+    text: str
+    difficulty: model.QuestionDifficulty | None = None
+
+
+class GeneratedQuestions(pydantic.BaseModel):
+    """Structured output of the question generator."""
+
+    questions: list[GeneratedQuestion]
 
 
 class SyntheticTestGenerator:
     """Generates synthetic test cases from document chunks using LLM."""
 
-    def __init__(self, eval_model: str = "openai:gpt-4o-mini") -> None:
+    def __init__(
+        self,
+        eval_model: str = "openai:gpt-4o-mini",
+        max_concurrency: int | None = None,
+        response_cache: response_cache_module.ResponseCache | None = None,
+        retry_policy: retry_module.RetryPolicy | None = None,
+    ) -> None:
         self._agent = pydantic_ai.Agent(
-            model=eval_model,
+            model=retry_module.infer_model(eval_model),
             system_prompt=SYSTEM_PROMPT,
+            output_type=GeneratedQuestions,
+            model_settings=pydantic_ai.ModelSettings(
+                temperature=0.0,
+                top_p=1.0,
+                max_tokens=QUESTION_MAX_TOKENS,
+            ),
+        )
+        self._eval_model = eval_model
+        self._max_concurrency = (
+            max_concurrency or settings_module.settings.eval_max_concurrency
         )
+        self._response_cache = response_cache
+        self._retry_policy = retry_policy or retry_module.RetryPolicy()
 
     async def generate_questions(
         self,
@@ -61,100 +120,112 @@ class SyntheticTestGenerator:
         Returns:
             List of (question_text, difficulty) tuples.
         """
-        prompt = USER_PROMPT_TEMPLATE.format(
-            count=count,
-            content=chunk.content,
-        )
+        prompt = self._question_prompt(chunk, count)
 
         try:
-            result = await self._agent.run(prompt)
-            return self._parse_questions(result.output, count)
+            output = await self._run(prompt)
+            return self._question_tuples(output)
         except Exception as exc:
             logger.warning("Failed to generate questions for chunk %s: %s", chunk.id, exc)
             return []
 
-    def _parse_questions(
-        self,
-        output: str,
-        expected_count: int,
-    ) -> list[tuple[str, model.QuestionDifficulty | None]]:
-        """Parse LLM output into a list of (question, difficulty) tuples."""
-        try:
-            cleaned = self._strip_markdown_code_block(output)
-            data = json.loads(cleaned)
-            questions = data.get("questions", [])
-            if isinstance(questions, list):
-                return self._extract_question_tuples(questions)
-        except (json.JSONDecodeError, AttributeError):
-            logger.warning("Failed to parse LLM output as JSON: %s", output[:200])
+    @staticmethod
+    def _question_prompt(chunk: chunk_model.Chunk, count: int) -> str:
+        """Build the question generation prompt for a chunk."""
+        return format_question_prompt(
+            count=count,
+            content=text.clip_middle(chunk.content, text.MAX_CHUNK_CHARS),
+        )
 
-        return []
+    async def _run(self, prompt: str) -> GeneratedQuestions:
+        """Run the agent, retrying transient provider failures."""
+        return await self._retry_policy.run(lambda: self._run_once(prompt))
+
+    async def _run_once(self, prompt: str) -> GeneratedQuestions:
+        """Run the agent, going through the response cache when configured."""
+        if self._response_cache is None:
+            result = await self._agent.run(prompt)
+            return result.output
+        return await self._response_cache.run(
+            self._agent, self._eval_model, SYSTEM_PROMPT, prompt
+        )
 
     @staticmethod
-    def _strip_markdown_code_block(output: str) -> str:
-        """Remove markdown code block markers from output."""
-        cleaned = output.strip()
-        if cleaned.startswith("```"):
-            lines = cleaned.split("\n")
-            cleaned = "\n".join(lines[1:-1]) if len(lines) > 2 else cleaned
-        return cleaned
-
-    def _extract_question_tuples(
-        self,
-        questions: list[dict[str, str] | str],
+    def _question_tuples(
+        output: GeneratedQuestions,
     ) -> list[tuple[str, model.QuestionDifficulty | None]]:
-        """Extract (text, difficulty) tuples from parsed question items."""
-        results: list[tuple[str, model.QuestionDifficulty | None]] = []
-        for item in questions:
-            if isinstance(item, str) and item.strip():
-                results.append((item, None))
-            elif isinstance(item, dict):
-                text = item.get("text", "")
-                if not text or not text.strip():
-                    continue
-                difficulty = self._parse_difficulty(item.get("difficulty"))
-                results.append((text, difficulty))
-        return results
-
-    def _parse_difficulty(
-        self,
-        raw_value: str | None,
-    ) -> model.QuestionDifficulty | None:
-        """Parse a difficulty string into a QuestionDifficulty enum."""
-        if raw_value is None:
-            return None
-        try:
-            return model.QuestionDifficulty(raw_value.lower())
-        except ValueError:
-            logger.warning("Unknown difficulty value: %s", raw_value)
-            return None
+        """Convert generated questions to (text, difficulty) tuples, skipping blank ones."""
+        return [
+            (question.text, question.difficulty)
+            for question in output.questions
+            if question.text.strip()
+        ]
 
     @staticmethod
     def sample_chunks(
-        chunks: list[chunk_model.Chunk],
+        chunks: Iterable[chunk_model.Chunk],
         max_sample: int,
     ) -> list[chunk_model.Chunk]:
         """Sample chunks for test generation.
 
         Args:
-            chunks: All available chunks.
+            chunks: All available chunks; may be a one-shot iterable.
             max_sample: Maximum number of chunks to sample.
 
         Returns:
             Sampled list of chunks.
         """
-        if len(chunks) <= max_sample:
-            return chunks
-        return random.sample(chunks, max_sample)
+        if isinstance(chunks, Sized) and len(chunks) <= max_sample:
+            return list(chunks)
+        return SyntheticTestGenerator.sample_chunks_stream(chunks, max_sample)
+
+    @staticmethod
+    def sample_chunks_stream(
+        chunks: Iterable[chunk_model.Chunk],
+        max_sample: int,
+    ) -> list[chunk_model.Chunk]:
+        """Uniformly sample up to max_sample chunks in a single pass.
+
+        Uses reservoir sampling (Algorithm L): only the reservoir is held in
+        memory, and the number of items to skip before the next replacement
+        is drawn from a geometric distribution instead of rolling per item.
+
+        Args:
+            chunks: Chunks to sample from, consumed once.
+            max_sample: Reservoir size.
+
+        Returns:
+            Sampled chunks; all of them if there are at most max_sample.
+        """
+        if max_sample <= 0:
+            return []
+        iterator = iter(chunks)
+        reservoir = list(itertools.islice(iterator, max_sample))
+        if len(reservoir) < max_sample:
+            return reservoir
+
+        weight = math.exp(math.log(_open_unit_random()) / max_sample)
+        skip = _reservoir_skip(weight)
+        for chunk in iterator:
+            if skip > 0:
+                skip -= 1
+                continue
+            reservoir[random.randrange(max_sample)] = chunk
+            weight *= math.exp(math.log(_open_unit_random()) / max_sample)
+            skip = _reservoir_skip(weight)
+        return reservoir
 
     async def generate_test_cases(
         self,
-        chunks: list[chunk_model.Chunk],
+        chunks: Iterable[chunk_model.Chunk],
         questions_per_chunk: int = 2,
         max_chunks_sample: int = 50,
     ) -> list[model.TestCase]:
         """Generate test cases from a list of chunks.
 
+        Questions for the sampled chunks are requested concurrently, with at
+        most max_concurrency LLM calls in flight.
+
         Args:
             chunks: Available chunks to generate questions from.
             questions_per_chunk: Number of questions per chunk.
@@ -164,17 +235,54 @@ class SyntheticTestGenerator:
             List of generated TestCase entities.
         """
         sampled = self.sample_chunks(chunks, max_chunks_sample)
-        test_cases: list[model.TestCase] = []
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        question_lists = await asyncio.gather(
+            *(
+                self._generate_questions_bounded(chunk, questions_per_chunk, semaphore)
+                for chunk in sampled
+            )
+        )
+
+        return self._build_test_cases(sampled, question_lists)
+
+    @staticmethod
+    def _build_test_cases(
+        chunks: list[chunk_model.Chunk],
+        question_lists: list[list[tuple[str, model.QuestionDifficulty | None]]],
+    ) -> list[model.TestCase]:
+        """Create a TestCase per distinct generated question, grounded in its chunks.
 
-        for chunk in sampled:
-            questions = await self.generate_questions(chunk, questions_per_chunk)
+        Questions that normalize to the same text are collapsed into the first
+        one generated, and the chunks of the duplicates join its ground truth,
+        so each question is retrieved and judged only once.
+        """
+        first_seen: dict[str, tuple[str, model.QuestionDifficulty | None, str]] = {}
+        ground_truth: dict[str, list[str]] = {}
+        for chunk, questions in zip(chunks, question_lists):
             for question_text, difficulty in questions:
-                test_case = model.TestCase.create(
-                    question=question_text,
-                    ground_truth_chunk_ids=(chunk.id,),
-                    source_chunk_id=chunk.id,
-                    difficulty=difficulty,
-                )
-                test_cases.append(test_case)
-
-        return test_cases
+                key = normalize_question(question_text)
+                if key not in first_seen:
+                    first_seen[key] = (question_text, difficulty, chunk.id)
+                    ground_truth[key] = [chunk.id]
+                elif chunk.id not in ground_truth[key]:
+                    ground_truth[key].append(chunk.id)
+
+        return [
+            model.TestCase.create(
+                question=question_text,
+                ground_truth_chunk_ids=tuple(ground_truth[key]),
+                source_chunk_id=source_chunk_id,
+                difficulty=difficulty,
+            )
+            for key, (question_text, difficulty, source_chunk_id) in first_seen.items()
+        ]
+
+    async def _generate_questions_bounded(
+        self,
+        chunk: chunk_model.Chunk,
+        count: int,
+        semaphore: asyncio.Semaphore,
+    ) -> list[tuple[str, model.QuestionDifficulty | None]]:
+        """Generate questions for one chunk while holding a concurrency slot."""
+        async with semaphore:
+            return await self.generate_questions(chunk, count)
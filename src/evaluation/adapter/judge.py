@@ -1,46 +1,57 @@
 """LLM-as-Judge for evaluating generation quality."""
 
-import json
+import asyncio
 import logging
 
+import pydantic
 import pydantic_ai
+import pydantic_ai.exceptions
 
+from src import settings as settings_module
 from src.chunk.domain import model as chunk_model
+from src.common import cache, text
+from src.evaluation.adapter import response_cache as response_cache_module
+from src.evaluation.adapter import retry as retry_module
+from src.evaluation.domain import model
 
 logger = logging.getLogger(__name__)
 
-FAITHFULNESS_SYSTEM_PROMPT = """You are an evaluation agent that assesses whether a generated answer is grounded in the provided context chunks.
+EVALUATION_CACHE_SIZE = 256
+EVALUATION_CACHE_TTL_SECONDS = 3600.0
+# Output budgets: the combined evaluation carries an unbounded per-claim
+# analysis (roughly 80 tokens a claim), while citation support is a single
+# score with a short justification.
+EVALUATION_MAX_TOKENS = 8192
+CITATION_MAX_TOKENS = 256
 
-Your task: Score faithfulness on a scale of 0.0 to 1.0:
+EVALUATION_SYSTEM_PROMPT = """You are an evaluation agent that assesses a generated answer against the question it answers and the provided context chunks.
+
+Your task: Score each metric on a scale of 0.0 to 1.0.
+
+faithfulness - whether the answer is grounded in the context:
 - 1.0: Answer is fully grounded in the context, no hallucinations
 - 0.5: Answer is partially grounded, contains some unsupported claims
 - 0.0: Answer contradicts context or is entirely hallucinated
 
-Return only valid JSON: {"score": <float>, "reasoning": "<brief explanation>"}"""
-
-FAITHFULNESS_USER_TEMPLATE = """Question: {question}
-
-Generated Answer: {answer}
-
-Context Chunks:
-{context}
-
-Score the faithfulness of the answer based on the context."""
-
-RELEVANCY_SYSTEM_PROMPT = """You are an evaluation agent that assesses whether a generated answer is relevant to the question.
-
-Your task: Score answer relevancy on a scale of 0.0 to 1.0:
+relevancy - whether the answer is relevant to the question:
 - 1.0: Answer directly and completely addresses the question
 - 0.5: Answer is partially relevant but incomplete or tangential
 - 0.0: Answer does not address the question
 
-Return only valid JSON: {"score": <float>, "reasoning": "<brief explanation>"}"""
-
-RELEVANCY_USER_TEMPLATE = """Question: {question}
+completeness - how comprehensively the answer uses the relevant information from the context:
+- 1.0: Answer comprehensively uses all relevant information from context
+- 0.5: Answer uses some relevant information but misses key details
+- 0.0: Answer fails to use relevant context information
 
-Generated Answer: {answer}
+Also decompose the answer into atomic claims and verify each against the context.
+For each claim, classify as:
+- "supported": Claim is directly supported by context
+- "partially_supported": Claim is partially supported
+- "contradicted": Claim contradicts the context
+- "fabricated": Claim has no basis in context
+- "unverifiable": Cannot be verified from context
 
-Score the relevancy of the answer to the question."""
+For each claim, list the indices of the supporting context chunks and give brief reasoning."""
 
 CITATION_SUPPORT_SYSTEM_PROMPT = """You are an evaluation agent that assesses whether a cited source genuinely supports the claim it is cited for.
 
@@ -49,120 +60,253 @@ Your task: Score citation support on a scale of 0.0 to 1.0:
 - 0.5: The cited source partially supports or is tangentially related
 - 0.0: The cited source does not support the claim at all
 
-Return only valid JSON: {"score": <float>, "reasoning": "<brief explanation>"}"""
+Give a brief explanation of your score."""
+
+_EvaluationKey = tuple[str, str, tuple[str, ...]]
+
+
+def format_evaluation_prompt(question: str, answer: str, context: str) -> str:
+    """Format the combined evaluation prompt for one answer."""
+    # Context comes first so that answers evaluated against the same chunks share
+    # a long identical prompt prefix, which provider prompt caching can reuse.
+    return f"""Context Chunks:
+{context}
+
+Question: {question}
+
+Generated Answer: {answer}
+
+Score the faithfulness, relevancy and completeness of the answer, and verify each of its claims against the context."""
+
 
-CITATION_SUPPORT_USER_TEMPLATE = """Claim: {claim}
+def format_citation_support_prompt(claim: str, chunk_content: str) -> str:
+    """Format the citation support prompt for one claim."""
+    return f"""Cited Source Content: {chunk_content}
 
-Cited Source Content: {chunk_content}
+Claim: {claim}
 
 Score how well the cited source supports the claim."""
 
-HALLUCINATION_SYSTEM_PROMPT = """You are an evaluation agent that performs claim-level hallucination analysis.
 
-Your task: Decompose the answer into atomic claims and verify each against the context.
-For each claim, classify as:
-- "supported": Claim is directly supported by context
-- "partially_supported": Claim is partially supported
-- "contradicted": Claim contradicts the context
-- "fabricated": Claim has no basis in context
-- "unverifiable": Cannot be verified from context
+def _deterministic_settings(max_tokens: int) -> pydantic_ai.ModelSettings:
+    """Greedy decoding settings, so repeated judgements agree and stay cacheable."""
+    return pydantic_ai.ModelSettings(temperature=0.0, top_p=1.0, max_tokens=max_tokens)
 
-Return only valid JSON: {"claims": [{"claim_text": "<text>", "verdict": "<verdict>", "supporting_chunks": [<indices>], "reasoning": "<brief>"}, ...]}"""
 
-HALLUCINATION_USER_TEMPLATE = """Question: {question}
+class ScoreOutput(pydantic.BaseModel):
+    """Structured output of a single-score judge."""
 
-Generated Answer: {answer}
+    score: float
+    reasoning: str = ""
 
-Context Chunks:
-{context}
 
-Decompose the answer into atomic claims and verify each against the context."""
+class ClaimOutput(pydantic.BaseModel):
+    """One atomic claim of an answer and its verdict against the context."""
 
-COMPLETENESS_SYSTEM_PROMPT = """You are an evaluation agent that assesses how comprehensively an answer uses the relevant information from the provided context.
+    claim_text: str
+    verdict: model.ClaimVerdict
+    supporting_chunks: list[int] = []
+    reasoning: str = ""
 
-Your task: Score answer completeness on a scale of 0.0 to 1.0:
-- 1.0: Answer comprehensively uses all relevant information from context
-- 0.5: Answer uses some relevant information but misses key details
-- 0.0: Answer fails to use relevant context information
 
-Return only valid JSON: {"score": <float>, "reasoning": "<brief explanation>"}"""
+class EvaluationOutput(pydantic.BaseModel):
+    """Structured output of the combined answer evaluation."""
 
-COMPLETENESS_USER_TEMPLATE = """Question: {question}
+    faithfulness: float
+    relevancy: float
+    completeness: float
+    claims: list[ClaimOutput] = []
 
-Generated Answer: {answer}
 
-Context Chunks:
-{context}
+class AnswerEvaluation(pydantic.BaseModel):
+    """Generation scores and claim analysis for one answer."""
+
+    model_config = pydantic.ConfigDict(frozen=True)
 
-Score how comprehensively the answer uses the relevant information from the context."""
+    faithfulness: float = 0.0
+    answer_relevancy: float = 0.0
+    answer_completeness: float = 0.0
+    claims: tuple[dict[str, object], ...] = ()
+
+    def to_case_metrics(self) -> model.GenerationCaseMetrics:
+        """Convert to per-case generation metrics."""
+        return model.GenerationCaseMetrics(
+            faithfulness=self.faithfulness,
+            answer_relevancy=self.answer_relevancy,
+            answer_completeness=self.answer_completeness,
+        )
+
+    def claim_verdicts(self) -> list[model.ClaimVerdict]:
+        """Verdict of each analyzed claim, in answer order."""
+        return [model.ClaimVerdict(str(claim["verdict"])) for claim in self.claims]
 
 
 class LLMJudge:
     """LLM-as-Judge for evaluating generation quality."""
 
-    def __init__(self, eval_model: str) -> None:
-        self._faithfulness_agent = pydantic_ai.Agent(
-            model=eval_model,
-            system_prompt=FAITHFULNESS_SYSTEM_PROMPT,
+    def __init__(
+        self,
+        eval_model: str,
+        max_concurrency: int | None = None,
+        response_cache: response_cache_module.ResponseCache | None = None,
+        retry_policy: retry_module.RetryPolicy | None = None,
+    ) -> None:
+        self._eval_model = eval_model
+        self._max_concurrency = (
+            max_concurrency or settings_module.settings.eval_max_concurrency
         )
-        self._relevancy_agent = pydantic_ai.Agent(
-            model=eval_model,
-            system_prompt=RELEVANCY_SYSTEM_PROMPT,
+        self._response_cache = response_cache
+        self._retry_policy = retry_policy or retry_module.RetryPolicy()
+        # Both agents share one model, and with it one provider client and
+        # connection pool.
+        shared_model = retry_module.infer_model(eval_model)
+        self._evaluation_agent = pydantic_ai.Agent(
+            model=shared_model,
+            system_prompt=EVALUATION_SYSTEM_PROMPT,
+            output_type=EvaluationOutput,
+            model_settings=_deterministic_settings(EVALUATION_MAX_TOKENS),
         )
         self._citation_agent = pydantic_ai.Agent(
-            model=eval_model,
+            model=shared_model,
             system_prompt=CITATION_SUPPORT_SYSTEM_PROMPT,
+            output_type=ScoreOutput,
+            model_settings=_deterministic_settings(CITATION_MAX_TOKENS),
         )
-        self._hallucination_agent = pydantic_ai.Agent(
-            model=eval_model,
-            system_prompt=HALLUCINATION_SYSTEM_PROMPT,
+        self._evaluations: cache.TTLCache[
+            _EvaluationKey, asyncio.Task[AnswerEvaluation]
+        ] = cache.TTLCache(
+            maxsize=EVALUATION_CACHE_SIZE,
+            ttl_seconds=EVALUATION_CACHE_TTL_SECONDS,
         )
-        self._completeness_agent = pydantic_ai.Agent(
-            model=eval_model,
-            system_prompt=COMPLETENESS_SYSTEM_PROMPT,
+        self._contexts: cache.TTLCache[tuple[str, ...], str] = cache.TTLCache(
+            maxsize=EVALUATION_CACHE_SIZE,
+            ttl_seconds=EVALUATION_CACHE_TTL_SECONDS,
         )
 
-    async def score_faithfulness(
+    async def score_all(
         self,
         question: str,
         answer: str,
         context_chunks: list[chunk_model.Chunk],
-    ) -> float:
-        """Score answer faithfulness (grounding in context)."""
-        context_text = "\n\n".join(
-            f"[{i + 1}] {chunk.content}"
-            for i, chunk in enumerate(context_chunks)
-        )
-        prompt = FAITHFULNESS_USER_TEMPLATE.format(
-            question=question,
-            answer=answer,
-            context=context_text,
-        )
+    ) -> AnswerEvaluation:
+        """Score faithfulness, relevancy and completeness and analyze claims.
+
+        All four come from a single LLM call. Calls are memoized per
+        (question, answer, context chunk IDs), and concurrent callers for the
+        same answer share one in-flight call. A caller being cancelled does not
+        cancel the shared call, and failed or cancelled calls are not cached.
+        """
+        key = (question, answer, tuple(chunk.id for chunk in context_chunks))
+        task = self._evaluations.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._evaluate(question, answer, context_chunks))
+            self._evaluations.set(key, task)
+            task.add_done_callback(lambda done: self._forget_unsuccessful(key, done))
 
         try:
-            result = await self._faithfulness_agent.run(prompt)
-            return self._parse_score(result.output)
+            return await asyncio.shield(task)
         except Exception as exc:
-            logger.warning("Failed to score faithfulness: %s", exc)
-            return 0.0
+            self._forget_unsuccessful(key, task)
+            if isinstance(exc, pydantic_ai.exceptions.IncompleteToolCall):
+                logger.warning(
+                    "Evaluation output exceeded %d tokens and was truncated",
+                    EVALUATION_MAX_TOKENS,
+                )
+            else:
+                logger.warning("Failed to evaluate answer: %s", exc)
+            return AnswerEvaluation()
+
+    def _forget_unsuccessful(
+        self, key: _EvaluationKey, task: asyncio.Task[AnswerEvaluation]
+    ) -> None:
+        """Drop a cached evaluation that failed or was cancelled."""
+        if not task.done() or (not task.cancelled() and task.exception() is None):
+            return
+        if self._evaluations.get(key) is task:
+            self._evaluations.invalidate(key)
+
+    async def _evaluate(
+        self,
+        question: str,
+        answer: str,
+        context_chunks: list[chunk_model.Chunk],
+    ) -> AnswerEvaluation:
+        """Run the combined evaluation prompt for one answer."""
+        prompt = self._evaluation_prompt(question, answer, context_chunks)
+        output = await self._run(self._evaluation_agent, EVALUATION_SYSTEM_PROMPT, prompt)
+        return self._to_answer_evaluation(output)
 
-    async def score_answer_relevancy(
+    def _evaluation_prompt(
         self,
         question: str,
         answer: str,
-    ) -> float:
-        """Score answer relevancy to question."""
-        prompt = RELEVANCY_USER_TEMPLATE.format(
+        context_chunks: list[chunk_model.Chunk],
+    ) -> str:
+        """Build the combined evaluation prompt for one answer."""
+        return format_evaluation_prompt(
             question=question,
             answer=answer,
+            context=self._format_context(context_chunks),
         )
 
-        try:
-            result = await self._relevancy_agent.run(prompt)
-            return self._parse_score(result.output)
-        except Exception as exc:
-            logger.warning("Failed to score relevancy: %s", exc)
-            return 0.0
+    def _format_context(self, context_chunks: list[chunk_model.Chunk]) -> str:
+        """Number and join the context chunks, reusing the text for repeated chunk sets.
+
+        Answers judged against the same chunks get byte-identical context, so
+        their prompts keep sharing a cacheable prefix.
+        """
+        key = tuple(chunk.id for chunk in context_chunks)
+        context_text = self._contexts.get(key)
+        if context_text is None:
+            context_text = "\n\n".join(
+                f"[{i + 1}] {text.clip_middle(chunk.content, text.MAX_CHUNK_CHARS)}"
+                for i, chunk in enumerate(context_chunks)
+            )
+            self._contexts.set(key, context_text)
+        return context_text
+
+    async def _run(
+        self,
+        agent: pydantic_ai.Agent[None, response_cache_module.OutputT],
+        system_prompt: str,
+        prompt: str,
+    ) -> response_cache_module.OutputT:
+        """Run an agent, retrying transient provider failures."""
+        return await self._retry_policy.run(
+            lambda: self._run_once(agent, system_prompt, prompt)
+        )
+
+    async def _run_once(
+        self,
+        agent: pydantic_ai.Agent[None, response_cache_module.OutputT],
+        system_prompt: str,
+        prompt: str,
+    ) -> response_cache_module.OutputT:
+        """Run an agent, going through the response cache when configured."""
+        if self._response_cache is None:
+            result = await agent.run(prompt)
+            return result.output
+        return await self._response_cache.run(agent, self._eval_model, system_prompt, prompt)
+
+    async def score_faithfulness(
+        self,
+        question: str,
+        answer: str,
+        context_chunks: list[chunk_model.Chunk],
+    ) -> float:
+        """Score answer faithfulness (grounding in context)."""
+        evaluation = await self.score_all(question, answer, context_chunks)
+        return evaluation.faithfulness
+
+    async def score_answer_relevancy(
+        self,
+        question: str,
+        answer: str,
+        context_chunks: list[chunk_model.Chunk],
+    ) -> float:
+        """Score answer relevancy to question."""
+        evaluation = await self.score_all(question, answer, context_chunks)
+        return evaluation.answer_relevancy
 
     async def score_citation_support(
         self,
@@ -170,14 +314,16 @@ class LLMJudge:
         cited_chunk_content: str,
     ) -> float:
         """Score whether a cited source supports the claim."""
-        prompt = CITATION_SUPPORT_USER_TEMPLATE.format(
+        prompt = format_citation_support_prompt(
             claim=claim_with_citation,
-            chunk_content=cited_chunk_content,
+            chunk_content=text.clip_middle(cited_chunk_content, text.MAX_CHUNK_CHARS),
         )
 
         try:
-            result = await self._citation_agent.run(prompt)
-            return self._parse_score(result.output)
+            output = await self._run(
+                self._citation_agent, CITATION_SUPPORT_SYSTEM_PROMPT, prompt
+            )
+            return self._clamp_score(output.score)
         except Exception as exc:
             logger.warning("Failed to score citation support: %s", exc)
             return 0.0
@@ -189,22 +335,8 @@ class LLMJudge:
         context_chunks: list[chunk_model.Chunk],
     ) -> dict[str, list[dict[str, object]]]:
         """Decompose answer into claims and verify against context."""
-        context_text = "\n\n".join(
-            f"[{i + 1}] {chunk.content}"
-            for i, chunk in enumerate(context_chunks)
-        )
-        prompt = HALLUCINATION_USER_TEMPLATE.format(
-            question=question,
-            answer=answer,
-            context=context_text,
-        )
-
-        try:
-            result = await self._hallucination_agent.run(prompt)
-            return self._parse_claims(result.output)
-        except Exception as exc:
-            logger.warning("Failed to analyze hallucinations: %s", exc)
-            return {"claims": []}
+        evaluation = await self.score_all(question, answer, context_chunks)
+        return {"claims": list(evaluation.claims)}
 
     async def score_answer_completeness(
         self,
@@ -213,59 +345,56 @@ class LLMJudge:
         context_chunks: list[chunk_model.Chunk],
     ) -> float:
         """Score how completely the answer uses relevant context."""
-        context_text = "\n\n".join(
-            f"[{i + 1}] {chunk.content}"
-            for i, chunk in enumerate(context_chunks)
-        )
-        prompt = COMPLETENESS_USER_TEMPLATE.format(
-            question=question,
-            answer=answer,
-            context=context_text,
-        )
+        evaluation = await self.score_all(question, answer, context_chunks)
+        return evaluation.answer_completeness
 
-        try:
-            result = await self._completeness_agent.run(prompt)
-            return self._parse_score(result.output)
-        except Exception as exc:
-            logger.warning("Failed to score answer completeness: %s", exc)
-            return 0.0
-
-    def _parse_score(self, output: str) -> float:
-        """Parse LLM output to extract score."""
-        try:
-            cleaned = self._strip_markdown_code_block(output)
-            data = json.loads(cleaned)
-            score = float(data.get("score", 0.0))
-            return max(0.0, min(1.0, score))
-        except (json.JSONDecodeError, ValueError, TypeError):
-            logger.warning(
-                "Failed to parse score from output: %s", output[:200]
+    async def score_batch(
+        self,
+        cases: list[tuple[str, str, list[chunk_model.Chunk]]],
+    ) -> list[model.GenerationCaseMetrics]:
+        """Score faithfulness, relevancy and completeness for many answers.
+
+        Cases are scored concurrently, one combined judge call each, with at
+        most max_concurrency LLM calls in flight.
+
+        Args:
+            cases: (question, answer, context_chunks) tuples to score.
+
+        Returns:
+            One GenerationCaseMetrics per case, in input order.
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        return list(
+            await asyncio.gather(
+                *(
+                    self._score_case(question, answer, context_chunks, semaphore)
+                    for question, answer, context_chunks in cases
+                )
             )
-            return 0.0
+        )
 
-    def _parse_claims(
-        self, output: str,
-    ) -> dict[str, list[dict[str, object]]]:
-        """Parse LLM output to extract claims data."""
-        try:
-            cleaned = self._strip_markdown_code_block(output)
-            data = json.loads(cleaned)
-            claims = data.get("claims", [])
-            if not isinstance(claims, list):
-                return {"claims": []}
-            return {"claims": claims}
-        except (json.JSONDecodeError, ValueError, TypeError):
-            logger.warning(
-                "Failed to parse claims from output: %s", output[:200]
-            )
-            return {"claims": []}
+    async def _score_case(
+        self,
+        question: str,
+        answer: str,
+        context_chunks: list[chunk_model.Chunk],
+        semaphore: asyncio.Semaphore,
+    ) -> model.GenerationCaseMetrics:
+        """Score one case while holding a concurrency slot."""
+        async with semaphore:
+            evaluation = await self.score_all(question, answer, context_chunks)
+        return evaluation.to_case_metrics()
+
+    def _to_answer_evaluation(self, output: EvaluationOutput) -> AnswerEvaluation:
+        """Convert structured judge output, clamping scores to [0.0, 1.0]."""
+        return AnswerEvaluation(
+            faithfulness=self._clamp_score(output.faithfulness),
+            answer_relevancy=self._clamp_score(output.relevancy),
+            answer_completeness=self._clamp_score(output.completeness),
+            claims=tuple(claim.model_dump(mode="json") for claim in output.claims),
+        )
 
     @staticmethod
-    def _strip_markdown_code_block(output: str) -> str:
-        """Remove markdown code block markers from output."""
-        cleaned = output.strip()
-        if cleaned.startswith("```"):
-            lines = cleaned.split("\n")
-            if len(lines) > 2:
-                cleaned = "\n".join(lines[1:-1])
-        return cleaned
+    def _clamp_score(value: float) -> float:
+        """Clamp a score to [0.0, 1.0]."""
+        return max(0.0, min(1.0, value))
@@ -1,12 +1,110 @@
 """Evaluation repository implementations."""
 
+import json
+
 import sqlalchemy
+import sqlalchemy.dialects.postgresql
+import sqlalchemy.dialects.sqlite
 import sqlalchemy.ext.asyncio
+import sqlalchemy.orm
 
+from src.common import pagination
 from src.evaluation.domain import mapper as evaluation_mapper_module
 from src.evaluation.domain import model
 from src.infrastructure.models import evaluation as evaluation_schema
 
+# Rows per upsert statement; bounds statement size for large datasets and runs.
+UPSERT_BATCH_SIZE = 500
+# Fresh result sets above this size are loaded with COPY on asyncpg.
+COPY_THRESHOLD_ROWS = 100
+# Parent rows fetched per batch when streaming list queries; each batch's
+# children arrive in one selectin query.
+LIST_YIELD_PER = 100
+
+# Children arrive in one batched IN query per statement; any other lazy load
+# raises instead of silently issuing a query per row.
+_DATASET_LOAD_OPTIONS = (
+    sqlalchemy.orm.selectinload(evaluation_schema.EvaluationDatasetSchema.test_cases),
+    sqlalchemy.orm.raiseload("*"),
+)
+_RUN_LOAD_OPTIONS = (
+    sqlalchemy.orm.selectinload(evaluation_schema.EvaluationRunSchema.results),
+    sqlalchemy.orm.raiseload("*"),
+)
+
+# Hot lookups are built once with bind parameters, so each call only binds the
+# id instead of rebuilding the statement and its cache key.
+_FIND_DATASET_BY_ID = (
+    sqlalchemy.select(evaluation_schema.EvaluationDatasetSchema)
+    .where(evaluation_schema.EvaluationDatasetSchema.id == sqlalchemy.bindparam("dataset_id"))
+    .options(*_DATASET_LOAD_OPTIONS)
+)
+_FIND_RUN_BY_ID = (
+    sqlalchemy.select(evaluation_schema.EvaluationRunSchema)
+    .where(evaluation_schema.EvaluationRunSchema.id == sqlalchemy.bindparam("run_id"))
+    .options(*_RUN_LOAD_OPTIONS)
+)
+
+
+async def _upsert_rows(
+    session: sqlalchemy.ext.asyncio.AsyncSession,
+    table: sqlalchemy.Table,
+    rows: list[dict[str, object]],
+) -> None:
+    """Insert rows, updating those whose id already exists, in batched statements.
+
+    One INSERT ... ON CONFLICT (id) DO UPDATE per batch replaces a SELECT and
+    INSERT/UPDATE round-trip per row with session.merge.
+    """
+    if not rows:
+        return
+    if session.get_bind().dialect.name == "postgresql":
+        stmt = sqlalchemy.dialects.postgresql.insert(table)
+    else:
+        stmt = sqlalchemy.dialects.sqlite.insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.id],
+        set_={column.name: stmt.excluded[column.name] for column in table.columns if column.name != "id"},
+    )
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        await session.execute(stmt, rows[start:start + UPSERT_BATCH_SIZE])
+
+
+def _supports_copy(session: sqlalchemy.ext.asyncio.AsyncSession) -> bool:
+    """Whether the session's driver can bulk-load rows with COPY."""
+    dialect = session.get_bind().dialect
+    return dialect.name == "postgresql" and dialect.driver == "asyncpg"
+
+
+async def _copy_rows(
+    session: sqlalchemy.ext.asyncio.AsyncSession,
+    table: sqlalchemy.Table,
+    rows: list[dict[str, object]],
+) -> None:
+    """Bulk-load new rows with COPY on the session's asyncpg connection.
+
+    COPY checks locks, permissions and types once for the whole load rather
+    than per statement, but cannot resolve conflicts: every row must be new.
+    JSON values are encoded here, as asyncpg's jsonb codec takes text.
+    """
+    columns = [column.name for column in table.columns]
+    json_columns = {
+        column.name for column in table.columns if isinstance(column.type, sqlalchemy.JSON)
+    }
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        table.name,
+        records=[
+            tuple(
+                json.dumps(row[column]) if column in json_columns else row[column]
+                for column in columns
+            )
+            for row in rows
+        ],
+        columns=columns,
+    )
+
 
 class DatasetRepository:
     """Repository for EvaluationDataset persistence."""
@@ -17,10 +115,7 @@ class DatasetRepository:
 
     async def find_by_id(self, dataset_id: str) -> model.EvaluationDataset | None:
         """Find dataset by ID."""
-        stmt = sqlalchemy.select(evaluation_schema.EvaluationDatasetSchema).where(
-            evaluation_schema.EvaluationDatasetSchema.id == dataset_id
-        )
-        result = await self._session.execute(stmt)
+        result = await self._session.execute(_FIND_DATASET_BY_ID, {"dataset_id": dataset_id})
         record = result.scalar_one_or_none()
         if record is None:
             return None
@@ -36,39 +131,92 @@ class DatasetRepository:
     async def save_with_test_cases(
         self, entity: model.EvaluationDataset
     ) -> model.EvaluationDataset:
-        """Save dataset with all test cases."""
+        """Save dataset with all test cases.
+
+        Every field is set client-side, so the saved entity is returned as is
+        rather than re-read from the database.
+        """
         record = self._mapper.to_record(entity)
         await self._session.merge(record)
         await self._session.flush()
 
-        for test_case in entity.test_cases:
-            tc_record = self._mapper.test_case_to_record(test_case, entity.id)
-            await self._session.merge(tc_record)
-        await self._session.flush()
-
-        # Re-fetch to get the full entity with test cases
-        return await self.find_by_id(entity.id)  # type: ignore[return-value]
+        await _upsert_rows(
+            self._session,
+            evaluation_schema.EvaluationTestCaseSchema.__table__,
+            [self._mapper.test_case_to_values(tc, entity.id) for tc in entity.test_cases],
+        )
+        return entity
 
     async def list_by_notebook(
         self, notebook_id: str
     ) -> list[model.EvaluationDataset]:
-        """List datasets for a notebook."""
+        """List datasets for a notebook.
+
+        Rows are streamed in batches of LIST_YIELD_PER and mapped as they
+        arrive, so the ORM records of the whole listing are never held at once.
+        """
         stmt = (
             sqlalchemy.select(evaluation_schema.EvaluationDatasetSchema)
             .where(evaluation_schema.EvaluationDatasetSchema.notebook_id == notebook_id)
+            .options(*_DATASET_LOAD_OPTIONS)
             .order_by(evaluation_schema.EvaluationDatasetSchema.created_at.desc())
+            .execution_options(yield_per=LIST_YIELD_PER)
+        )
+        records = await self._session.stream_scalars(stmt)
+        return [self._mapper.to_entity(record) async for record in records]
+
+    async def list_page_by_notebook(
+        self, notebook_id: str, query: pagination.ListQuery
+    ) -> pagination.PaginationSchema[model.EvaluationDataset]:
+        """List one page of a notebook's datasets, newest first.
+
+        Only the page's datasets and their test cases are loaded.
+        """
+        total = await self.count_by_notebook(notebook_id)
+        stmt = (
+            sqlalchemy.select(evaluation_schema.EvaluationDatasetSchema)
+            .where(evaluation_schema.EvaluationDatasetSchema.notebook_id == notebook_id)
+            .options(*_DATASET_LOAD_OPTIONS)
+            .order_by(
+                evaluation_schema.EvaluationDatasetSchema.created_at.desc(),
+                evaluation_schema.EvaluationDatasetSchema.id.desc(),
+            )
+            .offset(query.offset)
+            .limit(query.size)
         )
         result = await self._session.execute(stmt)
         records = result.scalars().all()
-        return [self._mapper.to_entity(record) for record in records]
+
+        items = [self._mapper.to_entity(record) for record in records]
+        return pagination.PaginationSchema.create(
+            items=items,
+            total=total,
+            page=query.page,
+            size=query.size,
+        )
+
+    async def count_by_notebook(self, notebook_id: str) -> int:
+        """Count datasets in a notebook without loading them."""
+        stmt = (
+            sqlalchemy.select(sqlalchemy.func.count())
+            .select_from(evaluation_schema.EvaluationDatasetSchema)
+            .where(evaluation_schema.EvaluationDatasetSchema.notebook_id == notebook_id)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one()
 
     async def delete(self, dataset_id: str) -> bool:
-        """Delete dataset by ID."""
-        stmt = sqlalchemy.delete(evaluation_schema.EvaluationDatasetSchema).where(
-            evaluation_schema.EvaluationDatasetSchema.id == dataset_id
+        """Delete dataset by ID.
+
+        Runs as a single Core DELETE; the session is not synchronized, so a
+        copy of the dataset already loaded in it is left as is.
+        """
+        stmt = (
+            sqlalchemy.delete(evaluation_schema.EvaluationDatasetSchema)
+            .where(evaluation_schema.EvaluationDatasetSchema.id == dataset_id)
+            .execution_options(synchronize_session=False)
         )
         result = await self._session.execute(stmt)
-        await self._session.flush()
         return result.rowcount > 0
 
 
@@ -81,10 +229,7 @@ class RunRepository:
 
     async def find_by_id(self, run_id: str) -> model.EvaluationRun | None:
         """Find run by ID."""
-        stmt = sqlalchemy.select(evaluation_schema.EvaluationRunSchema).where(
-            evaluation_schema.EvaluationRunSchema.id == run_id
-        )
-        result = await self._session.execute(stmt)
+        result = await self._session.execute(_FIND_RUN_BY_ID, {"run_id": run_id})
         record = result.scalar_one_or_none()
         if record is None:
             return None
@@ -100,31 +245,54 @@ class RunRepository:
     async def save_with_results(
         self, entity: model.EvaluationRun
     ) -> model.EvaluationRun:
-        """Save run with all test case results."""
+        """Save run with all test case results.
+
+        Every field is set client-side, so the saved entity is returned as is
+        rather than re-read from the database.
+        """
         record = self._mapper.to_record(entity)
         await self._session.merge(record)
         await self._session.flush()
 
-        for result in entity.results:
-            r_record = self._mapper.result_to_record(result, entity.id)
-            await self._session.merge(r_record)
-        await self._session.flush()
+        await self._write_results(entity)
+        return entity
 
-        # Re-fetch to get the full entity with results
-        return await self.find_by_id(entity.id)  # type: ignore[return-value]
+    async def _write_results(self, entity: model.EvaluationRun) -> None:
+        """Write a run's results, using COPY for large result sets of a fresh run."""
+        table = evaluation_schema.EvaluationTestCaseResultSchema.__table__
+        rows = [self._mapper.result_to_values(result, entity.id) for result in entity.results]
+        if (
+            len(rows) > COPY_THRESHOLD_ROWS
+            and _supports_copy(self._session)
+            and not await self._has_results(entity.id)
+        ):
+            await _copy_rows(self._session, table, rows)
+            return
+        await _upsert_rows(self._session, table, rows)
+
+    async def _has_results(self, run_id: str) -> bool:
+        """Whether any results are already stored for a run."""
+        stmt = sqlalchemy.select(
+            sqlalchemy.exists().where(
+                evaluation_schema.EvaluationTestCaseResultSchema.run_id == run_id
+            )
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one()
 
     async def list_by_dataset(
         self, dataset_id: str
     ) -> list[model.EvaluationRun]:
-        """List runs for a dataset."""
+        """List runs for a dataset, streamed like DatasetRepository.list_by_notebook."""
         stmt = (
             sqlalchemy.select(evaluation_schema.EvaluationRunSchema)
             .where(evaluation_schema.EvaluationRunSchema.dataset_id == dataset_id)
+            .options(*_RUN_LOAD_OPTIONS)
             .order_by(evaluation_schema.EvaluationRunSchema.created_at.desc())
+            .execution_options(yield_per=LIST_YIELD_PER)
         )
-        result = await self._session.execute(stmt)
-        records = result.scalars().all()
-        return [self._mapper.to_entity(record) for record in records]
+        records = await self._session.stream_scalars(stmt)
+        return [self._mapper.to_entity(record) async for record in records]
 
     async def list_by_ids(
         self, run_ids: list[str]
@@ -135,6 +303,7 @@ class RunRepository:
         stmt = (
             sqlalchemy.select(evaluation_schema.EvaluationRunSchema)
             .where(evaluation_schema.EvaluationRunSchema.id.in_(run_ids))
+            .options(*_RUN_LOAD_OPTIONS)
             .order_by(evaluation_schema.EvaluationRunSchema.created_at.asc())
         )
         result = await self._session.execute(stmt)
@@ -0,0 +1,135 @@
+"""Persistent cache of LLM responses for evaluation prompts."""
+
+import asyncio
+import contextlib
+import functools
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import tempfile
+import time
+from typing import Any, TypeVar
+
+import pydantic
+import pydantic_ai
+
+logger = logging.getLogger(__name__)
+
+_KEY_SEPARATOR = b"\x00"
+_TYPE_ADAPTER_CACHE_SIZE = 16
+
+OutputT = TypeVar("OutputT")
+
+
+@functools.lru_cache(maxsize=_TYPE_ADAPTER_CACHE_SIZE)
+def _type_adapter(output_type: Any) -> pydantic.TypeAdapter[Any]:
+    """Return a shared TypeAdapter for serializing an agent's output type."""
+    return pydantic.TypeAdapter(output_type)
+
+
+@functools.lru_cache(maxsize=_TYPE_ADAPTER_CACHE_SIZE)
+def _output_schema(output_type: Any) -> str:
+    """Return an agent output type's JSON schema as a canonical string."""
+    return json.dumps(_type_adapter(output_type).json_schema(), sort_keys=True)
+
+
+class ResponseCache:
+    """Exact-match disk cache of LLM outputs keyed by model, settings and prompts.
+
+    Evaluation prompts are re-sent verbatim across reruns, so a stored
+    output is returned instead of calling the model again. Entries expire
+    after ttl_seconds.
+    """
+
+    def __init__(self, directory: str, ttl_seconds: float) -> None:
+        self._directory = pathlib.Path(directory)
+        self._ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def make_key(
+        model: str,
+        system_prompt: str,
+        prompt: str,
+        model_settings: str = "",
+        output_schema: str = "",
+    ) -> str:
+        """Hash the model, its settings, the prompts and the output schema into a cache key.
+
+        A change to any of them, such as a new temperature or an added output
+        field, makes earlier entries unreachable instead of serving them.
+        """
+        digest = hashlib.blake2b(digest_size=32)
+        for part in (model, model_settings, system_prompt, prompt, output_schema):
+            digest.update(part.encode())
+            digest.update(_KEY_SEPARATOR)
+        return digest.hexdigest()
+
+    async def run(
+        self,
+        agent: pydantic_ai.Agent[None, OutputT],
+        model: str,
+        system_prompt: str,
+        prompt: str,
+    ) -> OutputT:
+        """Return the cached output for the prompt, calling the agent on a miss.
+
+        Outputs are stored as JSON and validated back into the agent's
+        output type on a hit.
+        """
+        adapter = _type_adapter(agent.output_type)
+        key = self.make_key(
+            model,
+            system_prompt,
+            prompt,
+            model_settings=json.dumps(agent.model_settings or {}, sort_keys=True),
+            output_schema=_output_schema(agent.output_type),
+        )
+        cached = await asyncio.to_thread(self._read, key)
+        if cached is not None:
+            try:
+                return adapter.validate_json(cached)
+            except pydantic.ValidationError:
+                logger.warning("Discarding LLM response cache entry that no longer validates")
+
+        result = await agent.run(prompt)
+        await asyncio.to_thread(self._write, key, adapter.dump_json(result.output).decode())
+        return result.output
+
+    def _path(self, key: str) -> pathlib.Path:
+        return self._directory / f"{key}.json"
+
+    def _read(self, key: str) -> str | None:
+        """Read an unexpired entry, treating unreadable files as misses."""
+        try:
+            entry = json.loads(self._path(key).read_text())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("expires_at", 0) <= time.time():
+            return None
+        output = entry.get("output")
+        return output if isinstance(output, str) else None
+
+    def _write(self, key: str, output: str) -> None:
+        """Write an entry atomically so concurrent readers never see partial files."""
+        entry = {"expires_at": time.time() + self._ttl_seconds, "output": output}
+        tmp_path: str | None = None
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as tmp_file:
+                json.dump(entry, tmp_file)
+            os.replace(tmp_path, self._path(key))
+        except OSError as exc:
+            if tmp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_path)
+            logger.warning("Failed to write LLM response cache entry: %s", exc)
+
+
+def build_response_cache(directory: str | None, ttl_seconds: float) -> ResponseCache | None:
+    """Create a response cache, or None when no cache directory is configured."""
+    if not directory:
+        return None
+    return ResponseCache(directory=directory, ttl_seconds=ttl_seconds)
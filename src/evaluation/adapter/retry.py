@@ -0,0 +1,98 @@
+"""Retry of transient LLM provider failures."""
+
+import asyncio
+import logging
+import random
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+import openai
+import pydantic
+import pydantic_ai.exceptions
+import pydantic_ai.models
+import pydantic_ai.providers
+import pydantic_ai.providers.openai
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_INITIAL_DELAY_SECONDS = 1.0
+DEFAULT_MAX_DELAY_SECONDS = 30.0
+_BACKOFF_FACTOR = 2.0
+# Request timeout and rate limit; 5xx responses are always retried.
+_RETRYABLE_STATUS_CODES = frozenset({408, 429})
+_SERVER_ERROR_STATUS = 500
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Whether an LLM call failure is worth retrying.
+
+    Rate limits, timeouts, connection failures and server errors are
+    transient; invalid requests and unparseable outputs are not.
+    """
+    if isinstance(exc, pydantic_ai.exceptions.ModelHTTPError):
+        return exc.status_code in _RETRYABLE_STATUS_CODES or exc.status_code >= _SERVER_ERROR_STATUS
+    return isinstance(
+        exc,
+        (
+            pydantic_ai.exceptions.ModelAPIError,
+            openai.RateLimitError,
+            openai.APITimeoutError,
+            openai.APIConnectionError,
+        ),
+    )
+
+
+def _provider_without_sdk_retries(provider_name: str) -> pydantic_ai.providers.Provider[Any]:
+    """Infer a provider, turning off the OpenAI SDK's own retries.
+
+    RetryPolicy is the only retry layer; the SDK's default of two retries
+    would multiply every policy attempt into three HTTP requests.
+    """
+    provider = pydantic_ai.providers.infer_provider(provider_name)
+    if isinstance(provider, pydantic_ai.providers.openai.OpenAIProvider):
+        return pydantic_ai.providers.openai.OpenAIProvider(
+            openai_client=provider.client.with_options(max_retries=0)
+        )
+    return provider
+
+
+def infer_model(eval_model: str) -> pydantic_ai.models.Model:
+    """Build the model for an eval model name, leaving retries to RetryPolicy."""
+    return pydantic_ai.models.infer_model(
+        eval_model, provider_factory=_provider_without_sdk_retries
+    )
+
+
+class RetryPolicy(pydantic.BaseModel):
+    """Exponential backoff with jitter for transient LLM failures."""
+
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    initial_delay_seconds: float = DEFAULT_INITIAL_DELAY_SECONDS
+    max_delay_seconds: float = DEFAULT_MAX_DELAY_SECONDS
+
+    async def run(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Await call(), retrying transient failures with exponential backoff.
+
+        Non-transient failures, and the last transient one, are re-raised.
+        """
+        delay = self.initial_delay_seconds
+        for attempt in range(1, self.max_attempts):
+            try:
+                return await call()
+            except Exception as exc:
+                if not is_transient(exc):
+                    raise
+                logger.warning(
+                    "Transient LLM failure (attempt %d/%d), retrying: %s",
+                    attempt,
+                    self.max_attempts,
+                    exc,
+                )
+            await asyncio.sleep(random.uniform(delay / _BACKOFF_FACTOR, delay))
+            delay = min(delay * _BACKOFF_FACTOR, self.max_delay_seconds)
+        return await call()
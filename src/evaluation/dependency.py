@@ -6,6 +6,7 @@ from src import settings as settings_module
 from src.evaluation.adapter import generator as generator_module
 from src.evaluation.adapter import judge as judge_module
 from src.evaluation.adapter import repository as evaluation_repository_module
+from src.evaluation.adapter import response_cache as response_cache_module
 from src.evaluation.handler import handlers
 
 
@@ -24,14 +25,24 @@ class EvaluationAdapterContainer(containers.DeclarativeContainer):
         session=db_session,
     )
 
+    response_cache = providers.Singleton(
+        response_cache_module.build_response_cache,
+        directory=settings_module.settings.eval_response_cache_dir,
+        ttl_seconds=settings_module.settings.eval_response_cache_ttl_seconds,
+    )
+
     test_generator = providers.Singleton(
         generator_module.SyntheticTestGenerator,
         eval_model=settings_module.settings.eval_model,
+        max_concurrency=settings_module.settings.eval_max_concurrency,
+        response_cache=response_cache,
     )
 
     llm_judge = providers.Singleton(
         judge_module.LLMJudge,
         eval_model=settings_module.settings.eval_model,
+        max_concurrency=settings_module.settings.eval_max_concurrency,
+        response_cache=response_cache,
     )
 
 
@@ -61,6 +72,7 @@ class EvaluationHandlerContainer(containers.DeclarativeContainer):
         retrieval_service=query_service.retrieval_service,
         rag_agent=query_adapter.rag_agent,
         llm_judge=adapter.llm_judge,
+        max_concurrency=settings_module.settings.eval_max_concurrency,
     )
 
     get_dataset_handler = providers.Factory(
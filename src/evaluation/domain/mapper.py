@@ -1,27 +1,56 @@
 """Mapper between Evaluation entities and ORM schemas."""
 
-import json
+import operator
 
 from src.evaluation.domain import model
 from src.infrastructure.models import evaluation as evaluation_schema
 
+_DIFFICULTY_LOOKUP = {difficulty.value: difficulty for difficulty in model.QuestionDifficulty}
+
+# Result columns copied onto TestCaseResult unchanged, read in one attrgetter call.
+_RESULT_FIELDS = (
+    "id",
+    "test_case_id",
+    "precision",
+    "recall",
+    "hit",
+    "reciprocal_rank",
+    "generated_answer",
+    "faithfulness",
+    "answer_relevancy",
+    "citation_precision",
+    "citation_recall",
+    "phantom_citation_count",
+    "citation_support_score",
+    "hallucination_rate",
+    "contradiction_count",
+    "fabrication_count",
+    "total_claims",
+    "answer_completeness",
+)
+_get_result_fields = operator.attrgetter(*_RESULT_FIELDS)
+
 
 class DatasetMapper:
     """Maps between EvaluationDataset domain entity and ORM schema."""
 
     @staticmethod
     def to_entity(record: evaluation_schema.EvaluationDatasetSchema) -> model.EvaluationDataset:
-        """Convert ORM record to domain entity."""
+        """Convert ORM record to domain entity.
+
+        Test case rows come straight from the database, so they are built with
+        model_construct instead of re-validating every field per row.
+        """
         test_cases = tuple(
-            model.TestCase(
+            model.TestCase.model_construct(
                 id=tc.id,
                 question=tc.question,
-                ground_truth_chunk_ids=tuple(json.loads(tc.ground_truth_chunk_ids)),
+                ground_truth_chunk_ids=tuple(tc.ground_truth_chunk_ids),
                 source_chunk_id=tc.source_chunk_id,
-                difficulty=model.QuestionDifficulty(tc.difficulty) if tc.difficulty else None,
+                difficulty=_DIFFICULTY_LOOKUP[tc.difficulty] if tc.difficulty else None,
                 created_at=tc.created_at,
             )
-            for tc in sorted(record.test_cases, key=lambda t: t.created_at)
+            for tc in record.test_cases
         )
 
         return model.EvaluationDataset(
@@ -63,15 +92,22 @@ class DatasetMapper:
     ) -> evaluation_schema.EvaluationTestCaseSchema:
         """Convert TestCase to ORM record."""
         return evaluation_schema.EvaluationTestCaseSchema(
-            id=test_case.id,
-            dataset_id=dataset_id,
-            question=test_case.question,
-            ground_truth_chunk_ids=json.dumps(list(test_case.ground_truth_chunk_ids)),
-            source_chunk_id=test_case.source_chunk_id,
-            difficulty=test_case.difficulty.value if test_case.difficulty else None,
-            created_at=test_case.created_at,
+            **DatasetMapper.test_case_to_values(test_case, dataset_id)
         )
 
+    @staticmethod
+    def test_case_to_values(test_case: model.TestCase, dataset_id: str) -> dict[str, object]:
+        """Convert TestCase to a column-value dict for Core inserts."""
+        return {
+            "id": test_case.id,
+            "dataset_id": dataset_id,
+            "question": test_case.question,
+            "ground_truth_chunk_ids": list(test_case.ground_truth_chunk_ids),
+            "source_chunk_id": test_case.source_chunk_id,
+            "difficulty": test_case.difficulty.value if test_case.difficulty else None,
+            "created_at": test_case.created_at,
+        }
+
 
 class RunMapper:
     """Maps between EvaluationRun domain entity and ORM schema."""
@@ -79,33 +115,7 @@ class RunMapper:
     @staticmethod
     def to_entity(record: evaluation_schema.EvaluationRunSchema) -> model.EvaluationRun:
         """Convert ORM record to domain entity."""
-        results = tuple(
-            model.TestCaseResult(
-                id=r.id,
-                test_case_id=r.test_case_id,
-                retrieved_chunk_ids=tuple(json.loads(r.retrieved_chunk_ids)),
-                retrieved_scores=tuple(json.loads(r.retrieved_scores)),
-                precision=r.precision,
-                recall=r.recall,
-                hit=r.hit,
-                reciprocal_rank=r.reciprocal_rank,
-                generated_answer=r.generated_answer,
-                faithfulness=r.faithfulness,
-                answer_relevancy=r.answer_relevancy,
-                ndcg=r.ndcg if r.ndcg is not None else 0.0,
-                map_score=r.map_score if r.map_score is not None else 0.0,
-                citation_precision=r.citation_precision,
-                citation_recall=r.citation_recall,
-                phantom_citation_count=r.phantom_citation_count,
-                citation_support_score=r.citation_support_score,
-                hallucination_rate=r.hallucination_rate,
-                contradiction_count=r.contradiction_count,
-                fabrication_count=r.fabrication_count,
-                total_claims=r.total_claims,
-                answer_completeness=r.answer_completeness,
-            )
-            for r in record.results
-        )
+        results = tuple(RunMapper.result_to_entity(r) for r in record.results)
 
         return model.EvaluationRun(
             id=record.id,
@@ -135,6 +145,19 @@ class RunMapper:
             updated_at=record.updated_at,
         )
 
+    @staticmethod
+    def result_to_entity(
+        record: evaluation_schema.EvaluationTestCaseResultSchema,
+    ) -> model.TestCaseResult:
+        """Convert a result row to a TestCaseResult without re-validating it."""
+        return model.TestCaseResult.model_construct(
+            **dict(zip(_RESULT_FIELDS, _get_result_fields(record))),
+            retrieved_chunk_ids=tuple(record.retrieved_chunk_ids),
+            retrieved_scores=tuple(record.retrieved_scores),
+            ndcg=record.ndcg if record.ndcg is not None else 0.0,
+            map_score=record.map_score if record.map_score is not None else 0.0,
+        )
+
     @staticmethod
     def to_record(entity: model.EvaluationRun) -> evaluation_schema.EvaluationRunSchema:
         """Convert domain entity to ORM record."""
@@ -172,27 +195,34 @@ class RunMapper:
     ) -> evaluation_schema.EvaluationTestCaseResultSchema:
         """Convert TestCaseResult to ORM record."""
         return evaluation_schema.EvaluationTestCaseResultSchema(
-            id=result.id,
-            run_id=run_id,
-            test_case_id=result.test_case_id,
-            retrieved_chunk_ids=json.dumps(list(result.retrieved_chunk_ids)),
-            retrieved_scores=json.dumps(list(result.retrieved_scores)),
-            precision=result.precision,
-            recall=result.recall,
-            hit=result.hit,
-            reciprocal_rank=result.reciprocal_rank,
-            generated_answer=result.generated_answer,
-            faithfulness=result.faithfulness,
-            answer_relevancy=result.answer_relevancy,
-            ndcg=result.ndcg,
-            map_score=result.map_score,
-            citation_precision=result.citation_precision,
-            citation_recall=result.citation_recall,
-            phantom_citation_count=result.phantom_citation_count,
-            citation_support_score=result.citation_support_score,
-            hallucination_rate=result.hallucination_rate,
-            contradiction_count=result.contradiction_count,
-            fabrication_count=result.fabrication_count,
-            total_claims=result.total_claims,
-            answer_completeness=result.answer_completeness,
+            **RunMapper.result_to_values(result, run_id)
         )
+
+    @staticmethod
+    def result_to_values(result: model.TestCaseResult, run_id: str) -> dict[str, object]:
+        """Convert TestCaseResult to a column-value dict for Core inserts."""
+        return {
+            "id": result.id,
+            "run_id": run_id,
+            "test_case_id": result.test_case_id,
+            "retrieved_chunk_ids": list(result.retrieved_chunk_ids),
+            "retrieved_scores": list(result.retrieved_scores),
+            "precision": result.precision,
+            "recall": result.recall,
+            "hit": result.hit,
+            "reciprocal_rank": result.reciprocal_rank,
+            "generated_answer": result.generated_answer,
+            "faithfulness": result.faithfulness,
+            "answer_relevancy": result.answer_relevancy,
+            "ndcg": result.ndcg,
+            "map_score": result.map_score,
+            "citation_precision": result.citation_precision,
+            "citation_recall": result.citation_recall,
+            "phantom_citation_count": result.phantom_citation_count,
+            "citation_support_score": result.citation_support_score,
+            "hallucination_rate": result.hallucination_rate,
+            "contradiction_count": result.contradiction_count,
+            "fabrication_count": result.fabrication_count,
+            "total_claims": result.total_claims,
+            "answer_completeness": result.answer_completeness,
+        }
@@ -3,7 +3,33 @@
 Pure functions with no external dependencies.
 """
 
+import itertools
 import math
+import operator
+
+from src.evaluation.domain import model
+
+# Rank discounts 1/log2(rank + 1) and their prefix sums (ideal DCG) are
+# tabulated for the ranks evaluations use; deeper ranks are computed on demand.
+_DISCOUNT_TABLE_SIZE = 128
+_DISCOUNTS = tuple(1.0 / math.log2(i + 2) for i in range(_DISCOUNT_TABLE_SIZE))
+_IDEAL_DCGS = tuple(itertools.accumulate(_DISCOUNTS))
+
+
+def _discount(index: int) -> float:
+    """NDCG discount for the 0-based rank index."""
+    if index < _DISCOUNT_TABLE_SIZE:
+        return _DISCOUNTS[index]
+    return 1.0 / math.log2(index + 2)
+
+
+def _ideal_dcg(relevant_count: int) -> float:
+    """DCG of a ranking whose first relevant_count results are all relevant."""
+    if relevant_count <= 0:
+        return 0.0
+    if relevant_count <= _DISCOUNT_TABLE_SIZE:
+        return _IDEAL_DCGS[relevant_count - 1]
+    return sum(_discount(i) for i in range(relevant_count))
 
 
 def precision_at_k(
@@ -23,7 +49,7 @@ def precision_at_k(
     """
     if k <= 0:
         return 0.0
-    top_k = retrieved_ids[:k]
+    top_k = retrieved_ids if len(retrieved_ids) <= k else retrieved_ids[:k]
     if not top_k:
         return 0.0
     relevant_count = sum(1 for rid in top_k if rid in relevant_ids)
@@ -47,7 +73,7 @@ def recall_at_k(
     """
     if not relevant_ids or k <= 0:
         return 0.0
-    top_k = retrieved_ids[:k]
+    top_k = retrieved_ids if len(retrieved_ids) <= k else retrieved_ids[:k]
     relevant_count = sum(1 for rid in top_k if rid in relevant_ids)
     return relevant_count / len(relevant_ids)
 
@@ -69,8 +95,9 @@ def hit_at_k(
     """
     if not relevant_ids or k <= 0:
         return False
-    top_k = retrieved_ids[:k]
-    return any(rid in relevant_ids for rid in top_k)
+    top_k = retrieved_ids if len(retrieved_ids) <= k else retrieved_ids[:k]
+    # isdisjoint stops at the first shared ID without a Python-level loop
+    return not relevant_ids.isdisjoint(top_k)
 
 
 def reciprocal_rank(
@@ -90,13 +117,58 @@ def reciprocal_rank(
     """
     if not relevant_ids or k <= 0:
         return 0.0
-    top_k = retrieved_ids[:k]
+    top_k = retrieved_ids if len(retrieved_ids) <= k else retrieved_ids[:k]
     for rank, rid in enumerate(top_k, start=1):
         if rid in relevant_ids:
             return 1.0 / rank
     return 0.0
 
 
+def case_metrics(
+    retrieved_ids: list[str],
+    relevant_ids: set[str],
+    k: int,
+) -> model.CaseMetrics:
+    """Calculate every per-case retrieval metric in one pass over the top-k.
+
+    Equivalent to calling precision_at_k, recall_at_k, hit_at_k,
+    reciprocal_rank, ndcg_at_k and average_precision_at_k separately, but
+    each retrieved ID is looked up in relevant_ids only once.
+
+    Args:
+        retrieved_ids: Ordered list of retrieved chunk IDs.
+        relevant_ids: Set of relevant (ground truth) chunk IDs.
+        k: Number of top results to consider.
+
+    Returns:
+        The case's precision, recall, hit, reciprocal rank, NDCG and AP at k.
+    """
+    if k <= 0 or not retrieved_ids or not relevant_ids:
+        return model.CaseMetrics(precision=0.0, recall=0.0, hit=False, reciprocal_rank=0.0)
+    # Retrievers usually return exactly k results; only copy when some are cut
+    top_k = retrieved_ids if len(retrieved_ids) <= k else retrieved_ids[:k]
+
+    relevant_count = 0
+    first_rank = 0
+    dcg = 0.0
+    precision_sum = 0.0
+    for rank, rid in enumerate(top_k, start=1):
+        if rid in relevant_ids:
+            relevant_count += 1
+            first_rank = first_rank or rank
+            dcg += _discount(rank - 1)
+            precision_sum += relevant_count / rank
+
+    return model.CaseMetrics(
+        precision=relevant_count / len(top_k),
+        recall=relevant_count / len(relevant_ids),
+        hit=relevant_count > 0,
+        reciprocal_rank=1.0 / first_rank if first_rank else 0.0,
+        ndcg=dcg / _ideal_dcg(min(len(relevant_ids), k)),
+        map_score=precision_sum / len(relevant_ids),
+    )
+
+
 def aggregate_metrics(
     precisions: list[float],
     recalls: list[float],
@@ -120,7 +192,7 @@ def aggregate_metrics(
     count = len(precisions)
     mean_precision = sum(precisions) / count
     mean_recall = sum(recalls) / count
-    hit_rate = sum(1 for h in hits if h) / count
+    hit_rate = hits.count(True) / count
     mrr = sum(reciprocal_ranks) / count
 
     return (mean_precision, mean_recall, hit_rate, mrr)
@@ -160,12 +232,58 @@ def cosine_similarity(vec_a: list[float], vec_b: list[float]) -> float:
     """
     if not vec_a or not vec_b:
         return 0.0
-    dot = sum(a * b for a, b in zip(vec_a, vec_b))
-    mag_a = math.sqrt(sum(a * a for a in vec_a))
-    mag_b = math.sqrt(sum(b * b for b in vec_b))
-    if mag_a == 0.0 or mag_b == 0.0:
+    return _cosine_with_norms(vec_a, math.hypot(*vec_a), vec_b, math.hypot(*vec_b))
+
+
+def _cosine_with_norms(
+    vec_a: list[float],
+    norm_a: float,
+    vec_b: list[float],
+    norm_b: float,
+) -> float:
+    """Cosine similarity of two vectors whose norms are already known.
+
+    The dot product and norms run in C (map with operator.mul, math.hypot),
+    and adjacent_chunk_similarity computes each vector's norm once.
+    """
+    if norm_a == 0.0 or norm_b == 0.0:
         return 0.0
-    return dot / (mag_a * mag_b)
+    return sum(map(operator.mul, vec_a, vec_b)) / (norm_a * norm_b)
+
+
+def _unit_vectors(vectors: list[list[float]]) -> list[list[float]]:
+    """Scale each non-zero vector to unit length, dropping zero vectors."""
+    normed = [(vec, math.hypot(*vec)) for vec in vectors]
+    return [[x / norm for x in vec] for vec, norm in normed if norm != 0.0]
+
+
+def _vector_sum(vectors: list[list[float]]) -> list[float]:
+    """Element-wise sum of equal-length vectors."""
+    return [math.fsum(column) for column in zip(*vectors)]
+
+
+def _squared_norm(vec: list[float]) -> float:
+    """Squared Euclidean norm of a vector."""
+    return sum(map(operator.mul, vec, vec))
+
+
+def _pairwise_cosine_sum(vectors: list[list[float]]) -> float:
+    """Sum of cosine similarities over all unordered pairs of vectors.
+
+    With unit vectors u_i, sum(u_i . u_j for i < j) equals
+    (|sum(u_i)|^2 - sum(|u_i|^2)) / 2, so the cost is linear in the number of
+    vectors rather than quadratic. Zero vectors contribute nothing, as in
+    cosine_similarity.
+    """
+    units = _unit_vectors(vectors)
+    if len(units) < 2:
+        return 0.0
+    return (_squared_norm(_vector_sum(units)) - len(units)) / 2
+
+
+def _pair_count(size: int) -> int:
+    """Number of unordered pairs among size items."""
+    return size * (size - 1) // 2
 
 
 def ndcg_at_k(
@@ -185,16 +303,11 @@ def ndcg_at_k(
     """
     if k <= 0 or not relevant_ids:
         return 0.0
-    top_k = retrieved_ids[:k]
+    top_k = retrieved_ids if len(retrieved_ids) <= k else retrieved_ids[:k]
     if not top_k:
         return 0.0
-    dcg = sum(
-        1.0 / math.log2(i + 2)
-        for i, rid in enumerate(top_k)
-        if rid in relevant_ids
-    )
-    ideal_count = min(len(relevant_ids), k)
-    idcg = sum(1.0 / math.log2(i + 2) for i in range(ideal_count))
+    dcg = sum(_discount(i) for i, rid in enumerate(top_k) if rid in relevant_ids)
+    idcg = _ideal_dcg(min(len(relevant_ids), k))
     if idcg == 0.0:
         return 0.0
     return dcg / idcg
@@ -217,7 +330,7 @@ def average_precision_at_k(
     """
     if k <= 0 or not relevant_ids:
         return 0.0
-    top_k = retrieved_ids[:k]
+    top_k = retrieved_ids if len(retrieved_ids) <= k else retrieved_ids[:k]
     if not top_k:
         return 0.0
     relevant_count = 0
@@ -249,10 +362,13 @@ def complete_context_rate(
     """
     if not relevant_ids:
         return 1.0
-    if k <= 0:
+    # k results cannot cover more than k distinct relevant IDs
+    if len(relevant_ids) > min(k, len(retrieved_ids)):
         return 0.0
-    top_k = set(retrieved_ids[:k])
-    return 1.0 if relevant_ids.issubset(top_k) else 0.0
+    top_k = retrieved_ids if len(retrieved_ids) <= k else retrieved_ids[:k]
+    # Discards the top-k from a copy of relevant_ids in C, without hashing
+    # the top-k into a set of its own
+    return 0.0 if relevant_ids.difference(top_k) else 1.0
 
 
 def citation_precision(
@@ -270,9 +386,8 @@ def citation_precision(
     """
     if not cited_chunk_ids:
         return 0.0
-    relevant_count = sum(
-        1 for cid in cited_chunk_ids if cid in relevant_chunk_ids
-    )
+    # Repeated citations each count, so this stays a per-citation tally
+    relevant_count = sum(1 for cid in cited_chunk_ids if cid in relevant_chunk_ids)
     return relevant_count / len(cited_chunk_ids)
 
 
@@ -291,10 +406,7 @@ def citation_recall(
     """
     if not relevant_chunk_ids:
         return 0.0
-    cited_set = set(cited_chunk_ids)
-    cited_count = sum(
-        1 for rid in relevant_chunk_ids if rid in cited_set
-    )
+    cited_count = len(relevant_chunk_ids.intersection(cited_chunk_ids))
     return cited_count / len(relevant_chunk_ids)
 
 
@@ -311,9 +423,26 @@ def phantom_citation_count(
     Returns:
         Number of phantom (out-of-range) citations.
     """
-    return sum(
-        1 for idx in citation_indices if idx >= retrieved_chunk_count
-    )
+    return sum(1 for idx in citation_indices if idx >= retrieved_chunk_count)
+
+
+def hallucination_counts(
+    verdicts: list[model.ClaimVerdict],
+) -> tuple[float, int, int]:
+    """Hallucination rate and contradicted/fabricated claim counts.
+
+    Args:
+        verdicts: Verdict of each claim in one answer.
+
+    Returns:
+        Tuple of (hallucination_rate, contradiction_count, fabrication_count),
+        where the rate is the fraction of claims contradicted or fabricated.
+    """
+    if not verdicts:
+        return (0.0, 0, 0)
+    contradictions = verdicts.count(model.ClaimVerdict.CONTRADICTED)
+    fabrications = verdicts.count(model.ClaimVerdict.FABRICATED)
+    return ((contradictions + fabrications) / len(verdicts), contradictions, fabrications)
 
 
 def score_gap(
@@ -331,18 +460,20 @@ def score_gap(
     Returns:
         Mean GT score minus mean non-GT score, or None if either group is empty.
     """
-    gt_scores: list[float] = []
-    non_gt_scores: list[float] = []
+    gt_sum = 0.0
+    gt_count = 0
+    non_gt_sum = 0.0
+    non_gt_count = 0
     for rid, score in zip(retrieved_ids, retrieved_scores):
         if rid in relevant_ids:
-            gt_scores.append(score)
+            gt_sum += score
+            gt_count += 1
         else:
-            non_gt_scores.append(score)
-    if not gt_scores or not non_gt_scores:
+            non_gt_sum += score
+            non_gt_count += 1
+    if gt_count == 0 or non_gt_count == 0:
         return None
-    mean_gt = sum(gt_scores) / len(gt_scores)
-    mean_non_gt = sum(non_gt_scores) / len(non_gt_scores)
-    return mean_gt - mean_non_gt
+    return gt_sum / gt_count - non_gt_sum / non_gt_count
 
 
 def high_confidence_rate(
@@ -363,18 +494,19 @@ def high_confidence_rate(
         1.0 if min GT > max non-GT + margin, else 0.0.
         Returns 0.0 if either group is empty.
     """
-    gt_scores: list[float] = []
-    non_gt_scores: list[float] = []
+    min_gt = math.inf
+    max_non_gt = -math.inf
     for rid, score in zip(retrieved_ids, retrieved_scores):
         if rid in relevant_ids:
-            gt_scores.append(score)
+            min_gt = min(min_gt, score)
         else:
-            non_gt_scores.append(score)
-    if not gt_scores or not non_gt_scores:
+            max_non_gt = max(max_non_gt, score)
+        # min_gt only falls and max_non_gt only rises, so a miss is final
+        if min_gt <= max_non_gt + margin:
+            return 0.0
+    if min_gt == math.inf or max_non_gt == -math.inf:
         return 0.0
-    min_gt = min(gt_scores)
-    max_non_gt = max(non_gt_scores)
-    return 1.0 if min_gt > max_non_gt + margin else 0.0
+    return 1.0
 
 
 def mean_relevant_score(
@@ -445,11 +577,13 @@ def pearson_correlation(
         return None
     mean_x = sum(xs) / n
     mean_y = sum(ys) / n
-    var_x = sum((x - mean_x) ** 2 for x in xs)
-    var_y = sum((y - mean_y) ** 2 for y in ys)
+    dev_x = [x - mean_x for x in xs]
+    dev_y = [y - mean_y for y in ys]
+    var_x = _squared_norm(dev_x)
+    var_y = _squared_norm(dev_y)
     if var_x == 0.0 or var_y == 0.0:
         return None
-    cov = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    cov = sum(map(operator.mul, dev_x, dev_y))
     return cov / math.sqrt(var_x * var_y)
 
 
@@ -467,7 +601,8 @@ def bucket_generation_quality(
     Returns:
         Dict mapping bucket name to (mean_faithfulness, mean_relevancy).
     """
-    buckets: dict[str, list[tuple[float, float]]] = {}
+    # label -> [count, faithfulness sum, relevancy sum]
+    totals: dict[str, list[float]] = {}
     for recall, faithfulness, relevancy in results:
         if recall == 1.0:
             label = "perfect"
@@ -475,15 +610,14 @@ def bucket_generation_quality(
             label = "missed"
         else:
             label = "partial"
-        if label not in buckets:
-            buckets[label] = []
-        buckets[label].append((faithfulness, relevancy))
-    output: dict[str, tuple[float, float]] = {}
-    for label, pairs in buckets.items():
-        mean_f = sum(f for f, _ in pairs) / len(pairs)
-        mean_r = sum(r for _, r in pairs) / len(pairs)
-        output[label] = (mean_f, mean_r)
-    return output
+        bucket = totals.setdefault(label, [0, 0.0, 0.0])
+        bucket[0] += 1
+        bucket[1] += faithfulness
+        bucket[2] += relevancy
+    return {
+        label: (sum_f / count, sum_r / count)
+        for label, (count, sum_f, sum_r) in totals.items()
+    }
 
 
 def answer_consistency(
@@ -500,15 +634,7 @@ def answer_consistency(
     n = len(embeddings)
     if n < 2:
         return 0.0
-    total = 0.0
-    count = 0
-    for i in range(n):
-        for j in range(i + 1, n):
-            total += cosine_similarity(embeddings[i], embeddings[j])
-            count += 1
-    if count == 0:
-        return 0.0
-    return total / count
+    return _pairwise_cosine_sum(embeddings) / _pair_count(n)
 
 
 def aggregate_ndcg_map(
@@ -569,16 +695,10 @@ def intra_document_similarity(
     Returns:
         Mean intra-document similarity, or 0.0 if no valid pairs exist.
     """
-    total = 0.0
-    count = 0
-    for embeddings in embeddings_by_doc.values():
-        n = len(embeddings)
-        for i in range(n):
-            for j in range(i + 1, n):
-                total += cosine_similarity(embeddings[i], embeddings[j])
-                count += 1
+    count = sum(_pair_count(len(embeddings)) for embeddings in embeddings_by_doc.values())
     if count == 0:
         return 0.0
+    total = sum(_pairwise_cosine_sum(embeddings) for embeddings in embeddings_by_doc.values())
     return total / count
 
 
@@ -596,21 +716,22 @@ def inter_document_similarity(
     Returns:
         Mean inter-document similarity, or 0.0 if fewer than 2 documents.
     """
-    doc_keys = list(embeddings_by_doc.keys())
-    if len(doc_keys) < 2:
+    if len(embeddings_by_doc) < 2:
         return 0.0
-    total = 0.0
-    count = 0
-    for i in range(len(doc_keys)):
-        for j in range(i + 1, len(doc_keys)):
-            embs_a = embeddings_by_doc[doc_keys[i]]
-            embs_b = embeddings_by_doc[doc_keys[j]]
-            for vec_a in embs_a:
-                for vec_b in embs_b:
-                    total += cosine_similarity(vec_a, vec_b)
-                    count += 1
+    sizes = [len(embeddings) for embeddings in embeddings_by_doc.values()]
+    count = _pair_count(sum(sizes)) - sum(_pair_count(size) for size in sizes)
     if count == 0:
         return 0.0
+    # Sum of u_a . u_b over cross-document pairs, from per-document unit sums:
+    # (|sum of all|^2 - sum of |per-document|^2) / 2
+    doc_sums = [
+        doc_sum
+        for doc_sum in (
+            _vector_sum(_unit_vectors(embeddings)) for embeddings in embeddings_by_doc.values()
+        )
+        if doc_sum
+    ]
+    total = (_squared_norm(_vector_sum(doc_sums)) - sum(map(_squared_norm, doc_sums))) / 2
     return total / count
 
 
@@ -646,9 +767,10 @@ def adjacent_chunk_similarity(
     n = len(ordered_embeddings)
     if n < 2:
         return 0.0
+    norms = [math.hypot(*vec) for vec in ordered_embeddings]
     total = 0.0
     for i in range(n - 1):
-        total += cosine_similarity(
-            ordered_embeddings[i], ordered_embeddings[i + 1]
+        total += _cosine_with_norms(
+            ordered_embeddings[i], norms[i], ordered_embeddings[i + 1], norms[i + 1]
         )
     return total / (n - 1)
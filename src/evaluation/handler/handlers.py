@@ -1,9 +1,11 @@
 """Evaluation command and query handlers."""
 
+import asyncio
 import collections
 import logging
 
 from src import exceptions
+from src import settings as settings_module
 from src.chunk.adapter import repository as chunk_repository_module
 from src.chunk.domain import model as chunk_model
 from src.document.adapter import repository as document_repository_module
@@ -124,12 +126,16 @@ class RunEvaluationHandler:
         retrieval_service: retrieval.RetrievalService,
         rag_agent: rag_agent_module.RAGAgent | None = None,
         llm_judge: judge_module.LLMJudge | None = None,
+        max_concurrency: int | None = None,
     ) -> None:
         self._dataset_repository = dataset_repository
         self._run_repository = run_repository
         self._retrieval_service = retrieval_service
         self._rag_agent = rag_agent
         self._llm_judge = llm_judge
+        self._max_concurrency = (
+            max_concurrency or settings_module.settings.eval_max_concurrency
+        )
 
     async def handle(
         self, dataset_id: str, cmd: command.RunEvaluation
@@ -205,23 +211,37 @@ class RunEvaluationHandler:
     async def _evaluate_full_rag(
         self, dataset: model.EvaluationDataset, k: int
     ) -> tuple[list[model.TestCaseResult], model.GenerationMetrics]:
-        """Evaluate with full RAG pipeline including generation."""
+        """Evaluate with full RAG pipeline including generation.
+
+        Retrieval runs one test case at a time since it shares the database
+        session; answer generation and judging then run concurrently, with at
+        most max_concurrency test cases in flight.
+        """
         if not self._rag_agent or not self._llm_judge:
             raise exceptions.ValidationError(
                 "RAGAgent and LLMJudge required for FULL_RAG evaluation"
             )
 
-        results: list[model.TestCaseResult] = []
-        faithfulness_scores: list[float] = []
-        relevancy_scores: list[float] = []
-
+        retrieved_by_case: list[list[retrieval.RetrievedChunk]] = []
         for test_case in dataset.test_cases:
-            result, faithfulness, relevancy = await self._evaluate_single_rag(
-                dataset.notebook_id, test_case, k,
+            retrieved_by_case.append(
+                await self._retrieval_service.retrieve(
+                    notebook_id=dataset.notebook_id,
+                    query=test_case.question,
+                    max_chunks=k,
+                )
             )
-            results.append(result)
-            faithfulness_scores.append(faithfulness)
-            relevancy_scores.append(relevancy)
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        outcomes = await asyncio.gather(
+            *(
+                self._evaluate_single_rag_bounded(test_case, retrieved_chunks, k, semaphore)
+                for test_case, retrieved_chunks in zip(dataset.test_cases, retrieved_by_case)
+            )
+        )
+        results = [result for result, _, _ in outcomes]
+        faithfulness_scores = [faithfulness for _, faithfulness, _ in outcomes]
+        relevancy_scores = [relevancy for _, _, relevancy in outcomes]
 
         mean_f, mean_r = metric_module.aggregate_generation_metrics(
             faithfulness_scores, relevancy_scores,
@@ -232,52 +252,57 @@ class RunEvaluationHandler:
         )
         return results, generation_metrics
 
-    async def _evaluate_single_rag(
+    async def _evaluate_single_rag_bounded(
         self,
-        notebook_id: str,
         test_case: model.TestCase,
+        retrieved_chunks: list[retrieval.RetrievedChunk],
         k: int,
+        semaphore: asyncio.Semaphore,
     ) -> tuple[model.TestCaseResult, float, float]:
-        """Evaluate a single test case with full RAG pipeline."""
-        retrieved_chunks = await self._retrieval_service.retrieve(
-            notebook_id=notebook_id,
-            query=test_case.question,
-            max_chunks=k,
-        )
+        """Evaluate one test case while holding a concurrency slot."""
+        async with semaphore:
+            return await self._evaluate_single_rag(test_case, retrieved_chunks, k)
 
+    async def _evaluate_single_rag(
+        self,
+        test_case: model.TestCase,
+        retrieved_chunks: list[retrieval.RetrievedChunk],
+        k: int,
+    ) -> tuple[model.TestCaseResult, float, float]:
+        """Generate and judge an answer for a single retrieved test case."""
         answer_result = await self._rag_agent.answer(
             question=test_case.question,
             retrieved_chunks=retrieved_chunks,
         )
 
-        context_chunks = [rc.chunk for rc in retrieved_chunks]
-        faithfulness = await self._llm_judge.score_faithfulness(
+        evaluation = await self._llm_judge.score_all(
             question=test_case.question,
             answer=answer_result.answer,
-            context_chunks=context_chunks,
+            context_chunks=[rc.chunk for rc in retrieved_chunks],
         )
-        relevancy = await self._llm_judge.score_answer_relevancy(
-            question=test_case.question,
-            answer=answer_result.answer,
+        verdicts = evaluation.claim_verdicts()
+        hallucination_rate, contradictions, fabrications = (
+            metric_module.hallucination_counts(verdicts)
         )
 
         case_metrics = self._compute_case_metrics(
             test_case, retrieved_chunks, k,
         )
-        generation_case_metrics = model.GenerationCaseMetrics(
-            faithfulness=faithfulness,
-            answer_relevancy=relevancy,
-        )
 
         result = model.TestCaseResult.create(
             test_case_id=test_case.id,
             retrieved_chunk_ids=tuple(rc.chunk.id for rc in retrieved_chunks),
             retrieved_scores=tuple(rc.score for rc in retrieved_chunks),
             metrics=case_metrics,
-            generation_metrics=generation_case_metrics,
+            generation_metrics=evaluation.to_case_metrics(),
             generated_answer=answer_result.answer,
+            hallucination_rate=hallucination_rate,
+            contradiction_count=contradictions,
+            fabrication_count=fabrications,
+            total_claims=len(verdicts),
+            answer_completeness=evaluation.answer_completeness,
         )
-        return result, faithfulness, relevancy
+        return result, evaluation.faithfulness, evaluation.answer_relevancy
 
     @staticmethod
     def _build_retrieval_result(
@@ -290,14 +315,7 @@ class RunEvaluationHandler:
         retrieved_scores = [rc.score for rc in retrieved_chunks]
         relevant_ids = set(test_case.ground_truth_chunk_ids)
 
-        case_metrics = model.CaseMetrics(
-            precision=metric_module.precision_at_k(retrieved_ids, relevant_ids, k),
-            recall=metric_module.recall_at_k(retrieved_ids, relevant_ids, k),
-            hit=metric_module.hit_at_k(retrieved_ids, relevant_ids, k),
-            reciprocal_rank=metric_module.reciprocal_rank(retrieved_ids, relevant_ids, k),
-            ndcg=metric_module.ndcg_at_k(retrieved_ids, relevant_ids, k),
-            map_score=metric_module.average_precision_at_k(retrieved_ids, relevant_ids, k),
-        )
+        case_metrics = metric_module.case_metrics(retrieved_ids, relevant_ids, k)
 
         return model.TestCaseResult.create(
             test_case_id=test_case.id,
@@ -316,14 +334,7 @@ class RunEvaluationHandler:
         retrieved_ids = [rc.chunk.id for rc in retrieved_chunks]
         relevant_ids = set(test_case.ground_truth_chunk_ids)
 
-        return model.CaseMetrics(
-            precision=metric_module.precision_at_k(retrieved_ids, relevant_ids, k),
-            recall=metric_module.recall_at_k(retrieved_ids, relevant_ids, k),
-            hit=metric_module.hit_at_k(retrieved_ids, relevant_ids, k),
-            reciprocal_rank=metric_module.reciprocal_rank(retrieved_ids, relevant_ids, k),
-            ndcg=metric_module.ndcg_at_k(retrieved_ids, relevant_ids, k),
-            map_score=metric_module.average_precision_at_k(retrieved_ids, relevant_ids, k),
-        )
+        return metric_module.case_metrics(retrieved_ids, relevant_ids, k)
 
     @staticmethod
     def _compute_aggregate_metrics(
@@ -28,7 +28,8 @@ class ChunkSchema(database_module.Base):
     chunk_index: sqlalchemy.orm.Mapped[int] = sqlalchemy.orm.mapped_column(sqlalchemy.Integer, nullable=False)
     token_count: sqlalchemy.orm.Mapped[int] = sqlalchemy.orm.mapped_column(sqlalchemy.Integer, nullable=False)
     embedding: sqlalchemy.orm.Mapped[list[float] | None] = sqlalchemy.orm.mapped_column(
-        pgvector.sqlalchemy.Vector(settings_module.settings.embedding_dimensions),
+        # Half-precision storage: 2 bytes per dimension instead of 4
+        pgvector.sqlalchemy.HALFVEC(settings_module.settings.embedding_dimensions),
         nullable=True,
     )
     created_at: sqlalchemy.orm.Mapped[datetime.datetime] = sqlalchemy.orm.mapped_column(
@@ -44,6 +45,6 @@ class ChunkSchema(database_module.Base):
             embedding,
             postgresql_using="ivfflat",
             postgresql_with={"lists": 100},
-            postgresql_ops={"embedding": "vector_cosine_ops"},
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
         ),
     )
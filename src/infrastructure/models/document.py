@@ -21,6 +21,7 @@ class DocumentSchema(database_module.Base):
         index=True,
     )
     url: sqlalchemy.orm.Mapped[str] = sqlalchemy.orm.mapped_column(sqlalchemy.Text, nullable=False)
+    url_hash: sqlalchemy.orm.Mapped[int] = sqlalchemy.orm.mapped_column(sqlalchemy.BigInteger, nullable=False)
     title: sqlalchemy.orm.Mapped[str | None] = sqlalchemy.orm.mapped_column(sqlalchemy.String(500), nullable=True)
     status: sqlalchemy.orm.Mapped[str] = sqlalchemy.orm.mapped_column(
         sqlalchemy.String(20),
@@ -42,7 +43,8 @@ class DocumentSchema(database_module.Base):
         onupdate=sqlalchemy.func.now(),
     )
 
-    # Ensure unique URL per notebook
+    # Ensure unique URL per notebook; duplicate lookups go through the url_hash index
     __table_args__ = (
         sqlalchemy.UniqueConstraint("notebook_id", "url", name="uq_document_notebook_url"),
+        sqlalchemy.Index("ix_documents_notebook_url_hash", "notebook_id", "url_hash"),
     )
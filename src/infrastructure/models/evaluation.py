@@ -3,10 +3,14 @@
 import datetime
 
 import sqlalchemy
+import sqlalchemy.dialects.postgresql
 import sqlalchemy.orm
 
 from src import database as database_module
 
+# Lists of chunk ids and scores; JSONB on PostgreSQL so the driver decodes them.
+_JSON_LIST = sqlalchemy.JSON().with_variant(sqlalchemy.dialects.postgresql.JSONB(), "postgresql")
+
 
 class EvaluationDatasetSchema(database_module.Base):
     """SQLAlchemy ORM model for evaluation datasets."""
@@ -20,7 +24,6 @@ class EvaluationDatasetSchema(database_module.Base):
         sqlalchemy.String(32),
         sqlalchemy.ForeignKey("notebooks.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     name: sqlalchemy.orm.Mapped[str] = sqlalchemy.orm.mapped_column(
         sqlalchemy.String(255), nullable=False
@@ -60,6 +63,16 @@ class EvaluationDatasetSchema(database_module.Base):
         back_populates="dataset",
         cascade="all, delete-orphan",
         lazy="selectin",
+        order_by="EvaluationTestCaseSchema.created_at",
+    )
+
+    # Serves list_by_notebook's filter and newest-first order (scanned backwards)
+    __table_args__ = (
+        sqlalchemy.Index(
+            "ix_evaluation_datasets_notebook_id_created_at",
+            notebook_id,
+            created_at,
+        ),
     )
 
 
@@ -75,13 +88,12 @@ class EvaluationTestCaseSchema(database_module.Base):
         sqlalchemy.String(32),
         sqlalchemy.ForeignKey("evaluation_datasets.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     question: sqlalchemy.orm.Mapped[str] = sqlalchemy.orm.mapped_column(
         sqlalchemy.Text, nullable=False
     )
-    ground_truth_chunk_ids: sqlalchemy.orm.Mapped[str] = sqlalchemy.orm.mapped_column(
-        sqlalchemy.Text, nullable=False
+    ground_truth_chunk_ids: sqlalchemy.orm.Mapped[list[str]] = sqlalchemy.orm.mapped_column(
+        _JSON_LIST, nullable=False
     )
     source_chunk_id: sqlalchemy.orm.Mapped[str] = sqlalchemy.orm.mapped_column(
         sqlalchemy.String(32), nullable=False
@@ -100,6 +112,15 @@ class EvaluationTestCaseSchema(database_module.Base):
         back_populates="test_cases",
     )
 
+    # Serves the dataset_id filter and the created_at order of the test_cases load
+    __table_args__ = (
+        sqlalchemy.Index(
+            "ix_evaluation_test_cases_dataset_id_created_at",
+            dataset_id,
+            created_at,
+        ),
+    )
+
 
 class EvaluationRunSchema(database_module.Base):
     """SQLAlchemy ORM model for evaluation runs."""
@@ -113,7 +134,6 @@ class EvaluationRunSchema(database_module.Base):
         sqlalchemy.String(32),
         sqlalchemy.ForeignKey("evaluation_datasets.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     status: sqlalchemy.orm.Mapped[str] = sqlalchemy.orm.mapped_column(
         sqlalchemy.String(20), nullable=False, default="pending"
@@ -194,6 +214,15 @@ class EvaluationRunSchema(database_module.Base):
         lazy="selectin",
     )
 
+    # Serves list_by_dataset's filter and newest-first order (scanned backwards)
+    __table_args__ = (
+        sqlalchemy.Index(
+            "ix_evaluation_runs_dataset_id_created_at",
+            dataset_id,
+            created_at,
+        ),
+    )
+
 
 class EvaluationTestCaseResultSchema(database_module.Base):
     """SQLAlchemy ORM model for evaluation test case results."""
@@ -212,11 +241,11 @@ class EvaluationTestCaseResultSchema(database_module.Base):
     test_case_id: sqlalchemy.orm.Mapped[str] = sqlalchemy.orm.mapped_column(
         sqlalchemy.String(32), nullable=False
     )
-    retrieved_chunk_ids: sqlalchemy.orm.Mapped[str] = sqlalchemy.orm.mapped_column(
-        sqlalchemy.Text, nullable=False
+    retrieved_chunk_ids: sqlalchemy.orm.Mapped[list[str]] = sqlalchemy.orm.mapped_column(
+        _JSON_LIST, nullable=False
     )
-    retrieved_scores: sqlalchemy.orm.Mapped[str] = sqlalchemy.orm.mapped_column(
-        sqlalchemy.Text, nullable=False
+    retrieved_scores: sqlalchemy.orm.Mapped[list[float]] = sqlalchemy.orm.mapped_column(
+        _JSON_LIST, nullable=False
     )
     precision: sqlalchemy.orm.Mapped[float] = sqlalchemy.orm.mapped_column(
         sqlalchemy.Float, nullable=False
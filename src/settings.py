@@ -33,8 +33,20 @@ class Settings(pydantic_settings.BaseSettings):
     chunk_size: int = 1000
     chunk_overlap: int = 200
 
+    # Ingestion
+    ingestion_max_workers: int = 4
+    ingestion_queue_size: int = 1000
+
+    # Source listing
+    source_total_cache_size: int = 1024
+    source_total_cache_ttl_seconds: float = 30.0
+
     # Evaluation
     eval_model: str = "openai:gpt-4o-mini"
+    eval_max_concurrency: int = 10
+    # Directory for cached judge/generator responses; unset disables caching
+    eval_response_cache_dir: str | None = None
+    eval_response_cache_ttl_seconds: float = 14 * 24 * 60 * 60
 
 
 settings = Settings()
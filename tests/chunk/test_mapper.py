@@ -0,0 +1,56 @@
+"""Tests for chunk mapper."""
+
+import datetime
+
+import pgvector
+
+from src.chunk.domain.mapper import ChunkMapper
+from src.infrastructure.models.chunk import ChunkSchema
+
+
+def _record(embedding: object) -> ChunkSchema:
+    return ChunkSchema(
+        id="chunk1",
+        document_id="doc1",
+        content="text",
+        char_start=0,
+        char_end=4,
+        chunk_index=0,
+        token_count=1,
+        embedding=embedding,
+        created_at=datetime.datetime.now(datetime.UTC),
+    )
+
+
+class TestChunkMapper:
+    """Tests for ChunkMapper."""
+
+    def test_to_entity_converts_halfvec_embedding_to_floats(self) -> None:
+        # Arrange
+        record = _record(pgvector.HalfVector([0.5, -0.25, 1.0]))
+
+        # Act
+        chunk = ChunkMapper.to_entity(record)
+
+        # Assert
+        assert chunk.embedding == [0.5, -0.25, 1.0]
+
+    def test_to_entity_keeps_list_embedding(self) -> None:
+        # Arrange
+        record = _record([0.1, 0.2])
+
+        # Act
+        chunk = ChunkMapper.to_entity(record)
+
+        # Assert
+        assert chunk.embedding == [0.1, 0.2]
+
+    def test_to_entity_without_embedding(self) -> None:
+        # Arrange
+        record = _record(None)
+
+        # Act
+        chunk = ChunkMapper.to_entity(record)
+
+        # Assert
+        assert chunk.embedding is None
@@ -0,0 +1,74 @@
+"""Tests for chunk repository."""
+
+import datetime
+import uuid
+
+import pytest
+
+from src.chunk.adapter.repository import ChunkRepository
+from src.chunk.domain.model import Chunk
+from src.document.adapter.repository import DocumentRepository
+from src.document.domain.model import Document
+from src.notebook.adapter.repository import NotebookRepository
+from src.notebook.domain.model import Notebook
+
+
+class TestChunkRepository:
+    """Tests for ChunkRepository."""
+
+    @pytest.fixture
+    async def document(self, test_session) -> Document:
+        """Create a test document inside a notebook."""
+        notebook = Notebook.create(name="Test Notebook", description="For chunk tests")
+        await NotebookRepository(test_session).save(notebook)
+        document = Document.create(notebook_id=notebook.id, url="https://example.com/chunks")
+        await DocumentRepository(test_session).save(document)
+        return document
+
+    @pytest.fixture
+    def repository(self, test_session) -> ChunkRepository:
+        """Create repository instance."""
+        return ChunkRepository(test_session)
+
+    def _make_chunk(self, document_id: str, index: int) -> Chunk:
+        return Chunk(
+            id=uuid.uuid4().hex,
+            document_id=document_id,
+            content=f"chunk {index}",
+            char_start=index * 10,
+            char_end=index * 10 + 7,
+            chunk_index=index,
+            token_count=2,
+            embedding=None,
+            created_at=datetime.datetime.now(datetime.UTC),
+        )
+
+    @pytest.mark.asyncio
+    async def test_save_batch_inserts_all_chunks(self, repository, document):
+        """Test save_batch inserts every chunk in one call."""
+        chunks = [self._make_chunk(document.id, i) for i in range(3)]
+
+        saved = await repository.save_batch(chunks)
+        listed = await repository.list_by_document(document.id)
+
+        assert saved == chunks
+        assert [chunk.id for chunk in listed] == [chunk.id for chunk in chunks]
+        assert [chunk.content for chunk in listed] == ["chunk 0", "chunk 1", "chunk 2"]
+
+    @pytest.mark.asyncio
+    async def test_save_batch_empty(self, repository):
+        """Test save_batch with no chunks is a no-op."""
+        assert await repository.save_batch([]) == []
+
+    @pytest.mark.asyncio
+    async def test_save_batch_after_delete_by_document(self, repository, document):
+        """Test replacing a document's chunks by deleting then batch inserting."""
+        await repository.save_batch([self._make_chunk(document.id, 0)])
+        replacement = [self._make_chunk(document.id, i) for i in range(2)]
+
+        deleted = await repository.delete_by_document(document.id)
+        await repository.save_batch(replacement)
+        listed = await repository.list_by_document(document.id)
+
+        assert deleted == 1
+        assert [chunk.id for chunk in listed] == [chunk.id for chunk in replacement]
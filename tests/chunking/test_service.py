@@ -1,5 +1,7 @@
 """Tests for chunking service."""
 
+import dataclasses
+
 import pytest
 
 from src.document.service.chunking.service import ChunkingService
@@ -82,3 +84,80 @@ This is the fourth paragraph to ensure multiple chunks."""
 
         for chunk in chunks:
             assert chunk.verify_position(content) is True
+
+    def test_chunk_position_accuracy_with_crlf_line_endings(self):
+        """Test positions stay accurate when lines end with \\r\\n."""
+        service = ChunkingService(chunk_size=20, chunk_overlap=5)
+        content = "\r\n".join(f"Line number {i} with a few words." for i in range(20))
+
+        chunks = service.chunk(content)
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert chunk.verify_position(content) is True
+
+    def test_services_share_encoding(self):
+        """Test that services with the same encoding reuse one Encoding object."""
+        first = ChunkingService()
+        second = ChunkingService(chunk_size=50)
+
+        assert first._encoding is second._encoding
+
+    def test_chunk_batch_matches_individual_chunking(self):
+        """Test chunk_batch returns the same chunks as chunking each content alone."""
+        service = ChunkingService(chunk_size=20, chunk_overlap=5)
+        contents = [
+            "\n".join(f"First document line {i}." for i in range(10)),
+            "",
+            "   \n  ",
+            "A short second document.",
+            "\n".join(f"Third document sentence number {i}." for i in range(15)),
+        ]
+
+        batched = service.chunk_batch(contents)
+
+        assert batched == [service.chunk(content) for content in contents]
+
+    def test_chunk_short_multiline_content_is_single_chunk(self):
+        """Test short multi-line content is returned whole without segmenting."""
+        service = ChunkingService(chunk_size=100, chunk_overlap=10)
+        content = "First line.\nSecond line.\n\nThird paragraph.\n  \n"
+
+        chunks = service.chunk(content)
+
+        assert len(chunks) == 1
+        assert chunks[0].char_start == 0
+        assert chunks[0].content == content.rstrip()
+        assert chunks[0].token_count == service.count_tokens(content.rstrip())
+
+    def test_chunk_short_content_over_token_limit_is_split(self):
+        """Test short-by-length content that exceeds the token limit is still split."""
+        service = ChunkingService(chunk_size=10, chunk_overlap=2)
+        content = "\n".join("🙂🙂🙂" for _ in range(4))
+
+        chunks = service.chunk(content)
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert content[chunk.char_start:chunk.char_end] == chunk.content
+
+    def test_chunked_content_is_immutable(self):
+        """Test ChunkedContent fields cannot be reassigned."""
+        chunk = ChunkingService().chunk("Immutable chunk content.")[0]
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            chunk.content = "changed"  # type: ignore[misc]
+
+    def test_segments_split_only_on_newlines(self):
+        """Test form feeds and other line separators stay inside a segment."""
+        service = ChunkingService(chunk_size=20, chunk_overlap=5)
+        content = "Page one\fPage two\nNext\x0bline end\n\nTail"
+
+        segments = service._split_into_segments(content)
+
+        assert segments == [
+            (0, "Page one\fPage two\n"),
+            (18, "Next\x0bline end\n"),
+            (32, "\n"),
+            (33, "Tail"),
+        ]
@@ -58,6 +58,11 @@ class TestDocumentHandlerBuilders:
         handler = deps.build_list_sources_handler(mock_session)
         assert isinstance(handler, document_handlers.ListSourcesHandler)
 
+    def test_source_handlers_share_source_totals(self, mock_session: mock.MagicMock) -> None:
+        add_handler, _ = deps.build_add_source_handler(mock_session)
+        list_handler = deps.build_list_sources_handler(mock_session)
+        assert add_handler._source_totals is list_handler._source_totals
+
 
 class TestConversationHandlerBuilders:
     """Tests for conversation handler factory functions."""
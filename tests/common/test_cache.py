@@ -0,0 +1,48 @@
+"""Tests for TTLCache."""
+
+from unittest import mock
+
+from src.common import cache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_get_returns_cached_value(self) -> None:
+        ttl_cache: cache.TTLCache[str, int] = cache.TTLCache(maxsize=2, ttl_seconds=10)
+
+        ttl_cache.set("a", 1)
+
+        assert ttl_cache.get("a") == 1
+        assert ttl_cache.get("missing") is None
+
+    def test_entries_expire_after_ttl(self) -> None:
+        ttl_cache: cache.TTLCache[str, int] = cache.TTLCache(maxsize=2, ttl_seconds=10)
+        with mock.patch("time.monotonic", return_value=100.0):
+            ttl_cache.set("a", 1)
+
+        with mock.patch("time.monotonic", return_value=110.0):
+            assert ttl_cache.get("a") is None
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        ttl_cache: cache.TTLCache[str, int] = cache.TTLCache(maxsize=2, ttl_seconds=10)
+        ttl_cache.set("a", 1)
+        ttl_cache.set("b", 2)
+        ttl_cache.get("a")
+
+        ttl_cache.set("c", 3)
+
+        assert ttl_cache.get("a") == 1
+        assert ttl_cache.get("b") is None
+        assert ttl_cache.get("c") == 3
+
+    def test_invalidate_and_clear(self) -> None:
+        ttl_cache: cache.TTLCache[str, int] = cache.TTLCache(maxsize=4, ttl_seconds=10)
+        ttl_cache.set("a", 1)
+        ttl_cache.set("b", 2)
+
+        ttl_cache.invalidate("a")
+        assert ttl_cache.get("a") is None
+
+        ttl_cache.clear()
+        assert ttl_cache.get("b") is None
@@ -0,0 +1,22 @@
+"""Tests for text utilities."""
+
+from src.common import text
+
+
+class TestClipMiddle:
+    """Tests for clip_middle."""
+
+    def test_short_text_is_unchanged(self) -> None:
+        assert text.clip_middle("short", max_chars=10) == "short"
+
+    def test_long_text_keeps_head_and_tail(self) -> None:
+        # Arrange
+        content = "H" * 50 + "M" * 100 + "T" * 50
+        max_chars = 60 + len(text.TRUNCATION_MARKER)
+
+        # Act
+        clipped = text.clip_middle(content, max_chars)
+
+        # Assert
+        assert clipped == "H" * 30 + text.TRUNCATION_MARKER + "T" * 30
+        assert len(clipped) == max_chars
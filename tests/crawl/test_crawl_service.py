@@ -5,6 +5,7 @@ from unittest import mock
 
 import pytest
 
+from src.common import cache
 from src.crawl.domain import model
 from src.crawl.domain.status import CrawlStatus
 from src.crawl.service.crawl_service import CrawlService
@@ -62,10 +63,15 @@ def _make_mock_link_discovery(
 def _make_mock_background_ingestion() -> mock.Mock:
     """Create a mock background ingestion service."""
     service = mock.Mock()
-    service.trigger_ingestion = mock.Mock()
+    service.trigger_ingestion = mock.AsyncMock()
     return service
 
 
+def _make_source_totals() -> cache.TTLCache[str, int]:
+    """Create an empty cache of per-notebook source totals."""
+    return cache.TTLCache(maxsize=8, ttl_seconds=60)
+
+
 class TestCrawlService:
     """Tests for CrawlService.execute."""
 
@@ -88,6 +94,7 @@ class TestCrawlService:
             document_repository=doc_repo,
             link_discovery=link_discovery,
             background_ingestion=bg_ingestion,
+            source_totals=_make_source_totals(),
         )
 
         # Act
@@ -99,6 +106,31 @@ class TestCrawlService:
         # Seed URL should be created as document
         assert doc_repo.save.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_created_document_invalidates_source_total(self) -> None:
+        # Arrange
+        job = model.CrawlJob.create(
+            notebook_id="nb1",
+            seed_url="https://example.com",
+            max_depth=1,
+            max_pages=10,
+        )
+        source_totals = _make_source_totals()
+        source_totals.set("nb1", 3)
+        service = CrawlService(
+            crawl_repository=_make_mock_crawl_repo(job),
+            document_repository=_make_mock_doc_repo(),
+            link_discovery=_make_mock_link_discovery({}),
+            background_ingestion=_make_mock_background_ingestion(),
+            source_totals=source_totals,
+        )
+
+        # Act
+        await service.execute(job.id)
+
+        # Assert
+        assert source_totals.get("nb1") is None
+
     @pytest.mark.asyncio
     async def test_discovers_nested_links(self) -> None:
         # Arrange
@@ -128,6 +160,7 @@ class TestCrawlService:
             document_repository=doc_repo,
             link_discovery=link_discovery,
             background_ingestion=bg_ingestion,
+            source_totals=_make_source_totals(),
         )
 
         # Act
@@ -165,6 +198,7 @@ class TestCrawlService:
             document_repository=doc_repo,
             link_discovery=link_discovery,
             background_ingestion=bg_ingestion,
+            source_totals=_make_source_totals(),
         )
 
         # Act
@@ -202,6 +236,7 @@ class TestCrawlService:
             document_repository=doc_repo,
             link_discovery=link_discovery,
             background_ingestion=bg_ingestion,
+            source_totals=_make_source_totals(),
         )
 
         # Act
@@ -240,6 +275,7 @@ class TestCrawlService:
             document_repository=doc_repo,
             link_discovery=link_discovery,
             background_ingestion=bg_ingestion,
+            source_totals=_make_source_totals(),
         )
 
         # Act
@@ -270,6 +306,7 @@ class TestCrawlService:
             document_repository=doc_repo,
             link_discovery=link_discovery,
             background_ingestion=bg_ingestion,
+            source_totals=_make_source_totals(),
         )
 
         # Act - should not raise, but complete with what it has
@@ -306,6 +343,7 @@ class TestCrawlService:
             document_repository=doc_repo,
             link_discovery=link_discovery,
             background_ingestion=bg_ingestion,
+            source_totals=_make_source_totals(),
         )
 
         # Act
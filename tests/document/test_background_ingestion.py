@@ -1,4 +1,4 @@
-"""Tests for BackgroundIngestionService.wait_for_all()."""
+"""Tests for BackgroundIngestionService."""
 
 import asyncio
 from unittest import mock
@@ -44,8 +44,8 @@ class TestBackgroundIngestionServiceWaitForAll:
         doc2 = mock.MagicMock()
         doc2.id = "doc-2"
 
-        service.trigger_ingestion(doc1)
-        service.trigger_ingestion(doc2)
+        await service.trigger_ingestion(doc1)
+        await service.trigger_ingestion(doc2)
 
         assert service.is_processing("doc-1")
         assert service.is_processing("doc-2")
@@ -66,7 +66,7 @@ class TestBackgroundIngestionServiceWaitForAll:
         doc = mock.MagicMock()
         doc.id = "doc-fail"
 
-        service.trigger_ingestion(doc)
+        await service.trigger_ingestion(doc)
         await service.wait_for_all()
 
     @pytest.mark.asyncio
@@ -80,7 +80,85 @@ class TestBackgroundIngestionServiceWaitForAll:
         doc = mock.MagicMock()
         doc.id = "doc-cleanup"
 
-        service.trigger_ingestion(doc)
+        await service.trigger_ingestion(doc)
         await service.wait_for_all()
 
         assert not service.is_processing("doc-cleanup")
+
+
+class TestBackgroundIngestionServiceWorkerPool:
+    """Tests for the bounded worker pool of BackgroundIngestionService."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_processing_bounded_by_max_workers(
+        self, mock_pipeline: mock.MagicMock
+    ) -> None:
+        # Arrange
+        in_flight = 0
+        peak = 0
+
+        async def slow_process(doc_id: str) -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        mock_pipeline.process = mock.AsyncMock(side_effect=slow_process)
+        service = ingestion_module.BackgroundIngestionService(
+            pipeline=mock_pipeline, max_workers=2
+        )
+
+        # Act
+        for i in range(6):
+            doc = mock.MagicMock()
+            doc.id = f"doc-{i}"
+            await service.trigger_ingestion(doc)
+        await service.wait_for_all()
+
+        # Assert
+        assert peak == 2
+        assert mock_pipeline.process.await_count == 6
+
+    @pytest.mark.asyncio
+    async def test_full_queue_waits_for_room(
+        self, mock_pipeline: mock.MagicMock
+    ) -> None:
+        # Arrange
+        mock_pipeline.process = mock.AsyncMock(return_value=None)
+        service = ingestion_module.BackgroundIngestionService(
+            pipeline=mock_pipeline, max_workers=1, max_queue_size=1
+        )
+        first = mock.MagicMock()
+        first.id = "doc-first"
+        second = mock.MagicMock()
+        second.id = "doc-second"
+
+        # Act
+        await service.trigger_ingestion(first)
+        await service.trigger_ingestion(second)
+        await service.wait_for_all()
+
+        # Assert
+        assert [call.args[0] for call in mock_pipeline.process.await_args_list] == [
+            "doc-first",
+            "doc-second",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_workers_restart_after_queue_drains(
+        self, mock_pipeline: mock.MagicMock
+    ) -> None:
+        mock_pipeline.process = mock.AsyncMock(return_value=None)
+        service = ingestion_module.BackgroundIngestionService(pipeline=mock_pipeline)
+        first = mock.MagicMock()
+        first.id = "doc-1"
+        second = mock.MagicMock()
+        second.id = "doc-2"
+
+        await service.trigger_ingestion(first)
+        await service.wait_for_all()
+        await service.trigger_ingestion(second)
+        await service.wait_for_all()
+
+        assert mock_pipeline.process.await_count == 2
@@ -0,0 +1,113 @@
+"""Tests for document handlers."""
+
+from unittest import mock
+
+import pytest
+
+from src import exceptions
+from src.common import cache, pagination
+from src.document.domain import model
+from src.document.handler import handlers
+from src.document.schema import query
+
+
+def _make_source_totals() -> cache.TTLCache[str, int]:
+    return cache.TTLCache(maxsize=8, ttl_seconds=60)
+
+
+def _make_document_repo(total: int = 3) -> mock.AsyncMock:
+    repo = mock.AsyncMock()
+    document = model.Document.create(notebook_id="nb1", url="https://example.com")
+
+    async def list_verified(
+        notebook_id: str, qry: query.ListSources, known_total: int | None = None
+    ) -> pagination.PaginationSchema[model.Document]:
+        return pagination.PaginationSchema.create(
+            items=[document],
+            total=total if known_total is None else known_total,
+            page=qry.page,
+            size=qry.size,
+        )
+
+    repo.list_by_notebook_verified = mock.AsyncMock(side_effect=list_verified)
+    return repo
+
+
+class TestListSourcesHandler:
+    """Tests for ListSourcesHandler."""
+
+    @pytest.mark.asyncio
+    async def test_first_page_counts_and_caches_total(self) -> None:
+        # Arrange
+        repo = _make_document_repo(total=3)
+        source_totals = _make_source_totals()
+        handler = handlers.ListSourcesHandler(
+            document_repository=repo, source_totals=source_totals
+        )
+        qry = query.ListSources(notebook_id="nb1", page=1, size=1)
+
+        # Act
+        result = await handler.handle(qry)
+
+        # Assert
+        repo.list_by_notebook_verified.assert_awaited_once_with("nb1", qry, known_total=None)
+        assert result.total == 3
+        assert source_totals.get("nb1") == 3
+
+    @pytest.mark.asyncio
+    async def test_later_page_reuses_cached_total(self) -> None:
+        # Arrange
+        repo = _make_document_repo(total=3)
+        source_totals = _make_source_totals()
+        source_totals.set("nb1", 7)
+        handler = handlers.ListSourcesHandler(
+            document_repository=repo, source_totals=source_totals
+        )
+        qry = query.ListSources(notebook_id="nb1", page=2, size=1)
+
+        # Act
+        result = await handler.handle(qry)
+
+        # Assert
+        repo.list_by_notebook_verified.assert_awaited_once_with("nb1", qry, known_total=7)
+        assert result.total == 7
+
+    @pytest.mark.asyncio
+    async def test_later_page_does_not_refresh_cached_total(self) -> None:
+        # Arrange
+        repo = _make_document_repo(total=3)
+        source_totals = mock.MagicMock(spec=cache.TTLCache)
+        source_totals.get.return_value = 7
+        handler = handlers.ListSourcesHandler(
+            document_repository=repo, source_totals=source_totals
+        )
+
+        # Act
+        await handler.handle(query.ListSources(notebook_id="nb1", page=2, size=1))
+
+        # Assert
+        source_totals.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_later_page_counts_when_cache_is_empty(self) -> None:
+        repo = _make_document_repo(total=3)
+        handler = handlers.ListSourcesHandler(
+            document_repository=repo, source_totals=_make_source_totals()
+        )
+        qry = query.ListSources(notebook_id="nb1", page=2, size=1)
+
+        result = await handler.handle(qry)
+
+        repo.list_by_notebook_verified.assert_awaited_once_with("nb1", qry, known_total=None)
+        assert result.total == 3
+
+    @pytest.mark.asyncio
+    async def test_missing_notebook_raises_not_found(self) -> None:
+        repo = mock.AsyncMock()
+        repo.list_by_notebook_verified = mock.AsyncMock(return_value=None)
+        handler = handlers.ListSourcesHandler(
+            document_repository=repo, source_totals=_make_source_totals()
+        )
+
+        with pytest.raises(exceptions.NotFoundError):
+            await handler.handle(query.ListSources(notebook_id="missing"))
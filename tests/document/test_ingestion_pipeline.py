@@ -0,0 +1,93 @@
+"""Tests for IngestionPipeline embedding generation."""
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+from src.chunk.domain import model as chunk_model
+from src.document.service import ingestion_pipeline as ingestion_module
+
+
+def _make_chunks(count: int) -> list[chunk_model.Chunk]:
+    return [
+        chunk_model.Chunk.create(
+            document_id="doc-1",
+            content=f"chunk {i}",
+            char_start=i * 10,
+            char_end=i * 10 + 7,
+            chunk_index=i,
+            token_count=2,
+        )
+        for i in range(count)
+    ]
+
+
+def _make_pipeline(
+    embedding_provider: mock.MagicMock, batch_size: int, max_concurrency: int
+) -> ingestion_module.IngestionPipeline:
+    return ingestion_module.IngestionPipeline(
+        content_extractor=mock.MagicMock(),
+        embedding_provider=embedding_provider,
+        chunking_service=mock.MagicMock(),
+        batch_size=batch_size,
+        max_concurrency=max_concurrency,
+    )
+
+
+class TestGenerateEmbeddings:
+    """Tests for IngestionPipeline._generate_embeddings."""
+
+    @pytest.mark.asyncio
+    async def test_embeddings_follow_chunk_order(self) -> None:
+        # Arrange
+        async def embed_batch(texts: list[str]) -> list[list[float]]:
+            await asyncio.sleep(0.01 * (len(texts) % 3))
+            return [[float(text.split()[1])] for text in texts]
+
+        provider = mock.MagicMock()
+        provider.embed_batch = mock.AsyncMock(side_effect=embed_batch)
+        pipeline = _make_pipeline(provider, batch_size=3, max_concurrency=2)
+        chunks = _make_chunks(8)
+
+        # Act
+        result = await pipeline._generate_embeddings(chunks)
+
+        # Assert
+        assert result == [chunk.with_embedding([float(i)]) for i, chunk in enumerate(chunks)]
+        assert provider.embed_batch.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_in_flight_batches_bounded_by_max_concurrency(self) -> None:
+        # Arrange
+        in_flight = 0
+        peak = 0
+
+        async def embed_batch(texts: list[str]) -> list[list[float]]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [[0.0] for _ in texts]
+
+        provider = mock.MagicMock()
+        provider.embed_batch = mock.AsyncMock(side_effect=embed_batch)
+        pipeline = _make_pipeline(provider, batch_size=1, max_concurrency=2)
+
+        # Act
+        await pipeline._generate_embeddings(_make_chunks(6))
+
+        # Assert
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_no_chunks_skips_provider(self) -> None:
+        provider = mock.MagicMock()
+        provider.embed_batch = mock.AsyncMock()
+        pipeline = _make_pipeline(provider, batch_size=10, max_concurrency=4)
+
+        result = await pipeline._generate_embeddings([])
+
+        assert result == []
+        provider.embed_batch.assert_not_awaited()
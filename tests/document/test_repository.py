@@ -2,10 +2,13 @@
 
 import pytest
 
+from src import exceptions
 from src.common import ListQuery
 from src.document.adapter.repository import DocumentRepository
+from src.document.domain import mapper as document_mapper_module
 from src.document.domain.model import Document
 from src.document.domain.status import DocumentStatus
+from src.infrastructure.models.document import DocumentSchema
 from src.notebook.adapter.repository import NotebookRepository
 from src.notebook.domain.model import Notebook
 
@@ -77,6 +80,21 @@ class TestDocumentRepository:
         )
         assert found is None
 
+    @pytest.mark.asyncio
+    async def test_save_stores_url_hash(self, repository, notebook, test_session):
+        """Test saving a document stores the signed 64-bit hash of its URL."""
+        document = Document.create(
+            notebook_id=notebook.id,
+            url="https://example.com/hashed",
+        )
+
+        await repository.save(document)
+        record = await test_session.get(DocumentSchema, document.id)
+
+        expected = document_mapper_module.url_hash("https://example.com/hashed")
+        assert record.url_hash == expected
+        assert -(2**63) <= expected < 2**63
+
     @pytest.mark.asyncio
     async def test_delete_document(self, repository, notebook):
         """Test deleting a document."""
@@ -137,6 +155,179 @@ class TestDocumentRepository:
         assert len(result.items) == 2
         assert result.pages == 3
 
+    @pytest.mark.asyncio
+    async def test_list_documents_matches_find_by_id(self, repository, notebook):
+        """Test listed documents equal the ones loaded individually."""
+        document = Document.create(
+            notebook_id=notebook.id,
+            url="https://example.com/listed",
+            title="Listed",
+        )
+        await repository.save(document)
+
+        result = await repository.list_by_notebook(
+            notebook_id=notebook.id,
+            query=ListQuery(page=1, size=10),
+        )
+        found = await repository.find_by_id(document.id)
+
+        assert result.items == [found]
+        assert result.items[0].status is DocumentStatus.PENDING
+
+    @pytest.mark.asyncio
+    async def test_url_exists_in_notebook(self, repository, notebook):
+        """Test URL lookup reports existing and missing URLs."""
+        document = Document.create(
+            notebook_id=notebook.id,
+            url="https://example.com/exists",
+        )
+        await repository.save(document)
+
+        assert await repository.url_exists_in_notebook(
+            notebook.id, "https://example.com/exists"
+        ) is True
+        assert await repository.url_exists_in_notebook(
+            notebook.id, "https://example.com/missing"
+        ) is False
+
+    @pytest.mark.asyncio
+    async def test_url_exists_in_missing_notebook_returns_none(self, repository):
+        """Test URL lookup returns None when the notebook does not exist."""
+        result = await repository.url_exists_in_notebook(
+            "nonexistent", "https://example.com"
+        )
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_list_by_notebook_verified(self, repository, notebook):
+        """Test verified listing returns the same page as list_by_notebook."""
+        for i in range(3):
+            document = Document.create(
+                notebook_id=notebook.id,
+                url=f"https://example.com/verified{i}",
+            )
+            await repository.save(document)
+        query = ListQuery(page=1, size=2)
+
+        verified = await repository.list_by_notebook_verified(notebook.id, query)
+        expected = await repository.list_by_notebook(notebook.id, query)
+
+        assert verified == expected
+        assert verified.total == 3
+
+    @pytest.mark.asyncio
+    async def test_list_by_notebook_verified_with_known_total(self, repository, notebook):
+        """Test a known total is returned as-is instead of being counted."""
+        document = Document.create(
+            notebook_id=notebook.id,
+            url="https://example.com/known-total",
+        )
+        await repository.save(document)
+
+        result = await repository.list_by_notebook_verified(
+            notebook.id, ListQuery(page=2, size=1), known_total=42
+        )
+
+        assert result is not None
+        assert result.total == 42
+
+    @pytest.mark.asyncio
+    async def test_list_by_notebook_verified_empty_notebook(self, repository, notebook):
+        """Test verified listing of an existing notebook without documents."""
+        result = await repository.list_by_notebook_verified(
+            notebook.id, ListQuery(page=1, size=10)
+        )
+
+        assert result is not None
+        assert result.total == 0
+        assert result.items == []
+
+    @pytest.mark.asyncio
+    async def test_list_by_notebook_verified_past_last_page(self, repository, notebook):
+        """Test a page past the end is empty but still carries the total."""
+        document = Document.create(
+            notebook_id=notebook.id,
+            url="https://example.com/past-end",
+        )
+        await repository.save(document)
+
+        result = await repository.list_by_notebook_verified(
+            notebook.id, ListQuery(page=3, size=1)
+        )
+
+        assert result is not None
+        assert result.total == 1
+        assert result.items == []
+
+    @pytest.mark.asyncio
+    async def test_list_by_notebook_verified_missing_notebook(self, repository):
+        """Test verified listing returns None when the notebook does not exist."""
+        result = await repository.list_by_notebook_verified(
+            "nonexistent", ListQuery(page=1, size=10)
+        )
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_list_documents_with_cursor_walks_all_pages(self, repository, notebook):
+        """Test keyset pagination visits every document once, newest first."""
+        for i in range(5):
+            document = Document.create(
+                notebook_id=notebook.id,
+                url=f"https://example.com/cursor{i}",
+            )
+            await repository.save(document)
+        expected = await repository.list_by_notebook(
+            notebook_id=notebook.id,
+            query=ListQuery(page=1, size=10),
+        )
+
+        visited = []
+        cursor = None
+        while True:
+            result = await repository.list_by_notebook(
+                notebook_id=notebook.id,
+                query=ListQuery(size=2, cursor=cursor),
+            )
+            visited.extend(result.items)
+            if result.next_cursor is None:
+                break
+            cursor = result.next_cursor
+
+        assert visited == expected.items
+
+    @pytest.mark.asyncio
+    async def test_list_documents_cursor_stops_on_last_full_page(self, repository, notebook):
+        """Test no cursor is emitted when the last page is exactly full."""
+        for i in range(4):
+            document = Document.create(
+                notebook_id=notebook.id,
+                url=f"https://example.com/even{i}",
+            )
+            await repository.save(document)
+
+        first = await repository.list_by_notebook(
+            notebook_id=notebook.id,
+            query=ListQuery(page=1, size=2),
+        )
+        second = await repository.list_by_notebook(
+            notebook_id=notebook.id,
+            query=ListQuery(size=2, cursor=first.next_cursor),
+        )
+
+        assert first.page == 1
+        assert len(second.items) == 2
+        assert second.next_cursor is None
+        assert second.page is None
+
+    @pytest.mark.asyncio
+    async def test_list_documents_with_invalid_cursor_raises(self, repository, notebook):
+        """Test a malformed cursor is rejected as a validation error."""
+        with pytest.raises(exceptions.ValidationError):
+            await repository.list_by_notebook(
+                notebook_id=notebook.id,
+                query=ListQuery(size=2, cursor="not-a-cursor"),
+            )
+
     @pytest.mark.asyncio
     async def test_update_document_status(self, repository, notebook):
         """Test updating document status."""
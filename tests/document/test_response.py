@@ -0,0 +1,21 @@
+"""Tests for document response schemas."""
+
+from src.document.domain.model import Document
+from src.document.schema import response
+
+
+class TestDocumentDetail:
+    """Tests for DocumentDetail."""
+
+    def test_from_entity_matches_validated_construction(self) -> None:
+        # Arrange
+        document = Document.create(notebook_id="nb1", url="https://example.com/a")
+
+        # Act
+        detail = response.DocumentDetail.from_entity(document)
+
+        # Assert
+        expected = response.DocumentDetail.model_validate(detail.model_dump())
+        assert detail == expected
+        assert detail.status == document.status.value
+        assert detail.model_dump(mode="json")["status"] == "pending"
@@ -1,6 +1,5 @@
 """Tests for LLMJudge citation support scoring."""
 
-import json
 from unittest import mock
 
 import pytest
@@ -20,9 +19,8 @@ class TestScoreCitationSupport:
     async def test_returns_parsed_score(self) -> None:
         # Arrange
         j = _make_judge()
-        llm_output = json.dumps({"score": 0.85, "reasoning": "Source supports claim."})
         mock_result = mock.MagicMock()
-        mock_result.output = llm_output
+        mock_result.output = judge.ScoreOutput(score=0.85, reasoning="Source supports claim.")
 
         with mock.patch.object(j._citation_agent, "run", return_value=mock_result):
             # Act
@@ -57,9 +55,8 @@ class TestScoreCitationSupport:
     async def test_score_clamped_to_max_one(self) -> None:
         # Arrange
         j = _make_judge()
-        llm_output = json.dumps({"score": 1.5, "reasoning": "Over max."})
         mock_result = mock.MagicMock()
-        mock_result.output = llm_output
+        mock_result.output = judge.ScoreOutput(score=1.5, reasoning="Over max.")
 
         with mock.patch.object(j._citation_agent, "run", return_value=mock_result):
             # Act
@@ -75,26 +72,8 @@ class TestScoreCitationSupport:
     async def test_score_clamped_to_min_zero(self) -> None:
         # Arrange
         j = _make_judge()
-        llm_output = json.dumps({"score": -0.5, "reasoning": "Below min."})
         mock_result = mock.MagicMock()
-        mock_result.output = llm_output
-
-        with mock.patch.object(j._citation_agent, "run", return_value=mock_result):
-            # Act
-            score = await j.score_citation_support(
-                claim_with_citation="Test claim",
-                cited_chunk_content="Test content",
-            )
-
-        # Assert
-        assert score == 0.0
-
-    @pytest.mark.asyncio
-    async def test_invalid_json_returns_zero(self) -> None:
-        # Arrange
-        j = _make_judge()
-        mock_result = mock.MagicMock()
-        mock_result.output = "not valid json"
+        mock_result.output = judge.ScoreOutput(score=-0.5, reasoning="Below min.")
 
         with mock.patch.object(j._citation_agent, "run", return_value=mock_result):
             # Act
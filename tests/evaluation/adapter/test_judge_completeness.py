@@ -1,6 +1,5 @@
 """Tests for LLMJudge answer completeness scoring."""
 
-import json
 from unittest import mock
 
 import pytest
@@ -33,13 +32,14 @@ class TestScoreAnswerCompleteness:
     async def test_returns_parsed_score(self) -> None:
         # Arrange
         j = _make_judge()
-        llm_output = json.dumps({"score": 0.92, "reasoning": "Comprehensive answer."})
         mock_result = mock.MagicMock()
-        mock_result.output = llm_output
+        mock_result.output = judge.EvaluationOutput(
+            faithfulness=0.0, relevancy=0.0, completeness=0.92
+        )
 
         chunk = _make_chunk("AI is artificial intelligence, a branch of computer science.")
 
-        with mock.patch.object(j._completeness_agent, "run", return_value=mock_result):
+        with mock.patch.object(j._evaluation_agent, "run", return_value=mock_result):
             # Act
             score = await j.score_answer_completeness(
                 question="What is AI?",
@@ -56,7 +56,7 @@ class TestScoreAnswerCompleteness:
         j = _make_judge()
 
         with mock.patch.object(
-            j._completeness_agent,
+            j._evaluation_agent,
             "run",
             side_effect=RuntimeError("LLM unavailable"),
         ):
@@ -74,11 +74,12 @@ class TestScoreAnswerCompleteness:
     async def test_score_clamped_to_max_one(self) -> None:
         # Arrange
         j = _make_judge()
-        llm_output = json.dumps({"score": 1.3, "reasoning": "Over max."})
         mock_result = mock.MagicMock()
-        mock_result.output = llm_output
+        mock_result.output = judge.EvaluationOutput(
+            faithfulness=0.0, relevancy=0.0, completeness=1.3
+        )
 
-        with mock.patch.object(j._completeness_agent, "run", return_value=mock_result):
+        with mock.patch.object(j._evaluation_agent, "run", return_value=mock_result):
             # Act
             score = await j.score_answer_completeness(
                 question="Test?",
@@ -93,11 +94,12 @@ class TestScoreAnswerCompleteness:
     async def test_score_clamped_to_min_zero(self) -> None:
         # Arrange
         j = _make_judge()
-        llm_output = json.dumps({"score": -0.2, "reasoning": "Below min."})
         mock_result = mock.MagicMock()
-        mock_result.output = llm_output
+        mock_result.output = judge.EvaluationOutput(
+            faithfulness=0.0, relevancy=0.0, completeness=-0.2
+        )
 
-        with mock.patch.object(j._completeness_agent, "run", return_value=mock_result):
+        with mock.patch.object(j._evaluation_agent, "run", return_value=mock_result):
             # Act
             score = await j.score_answer_completeness(
                 question="Test?",
@@ -112,16 +114,17 @@ class TestScoreAnswerCompleteness:
     async def test_multiple_context_chunks_formatted(self) -> None:
         # Arrange
         j = _make_judge()
-        llm_output = json.dumps({"score": 0.75, "reasoning": "Partial coverage."})
         mock_result = mock.MagicMock()
-        mock_result.output = llm_output
+        mock_result.output = judge.EvaluationOutput(
+            faithfulness=0.0, relevancy=0.0, completeness=0.75
+        )
 
         chunks = [
             _make_chunk("AI is artificial intelligence."),
             _make_chunk("Machine learning is a subset of AI."),
         ]
 
-        with mock.patch.object(j._completeness_agent, "run", return_value=mock_result) as mock_run:
+        with mock.patch.object(j._evaluation_agent, "run", return_value=mock_result) as mock_run:
             # Act
             score = await j.score_answer_completeness(
                 question="What is AI?",
@@ -0,0 +1,252 @@
+"""Tests for evaluation repositories."""
+
+import pytest
+import sqlalchemy
+
+from src.common import pagination
+from src.evaluation.adapter import repository as repository_module
+from src.evaluation.adapter.repository import DatasetRepository, RunRepository
+from src.evaluation.domain import model
+from src.notebook.adapter.repository import NotebookRepository
+from src.notebook.domain.model import Notebook
+
+
+def _make_test_case(index: int) -> model.TestCase:
+    return model.TestCase.create(
+        question=f"Question {index}?",
+        ground_truth_chunk_ids=(f"chunk-{index}",),
+        source_chunk_id=f"chunk-{index}",
+        difficulty=model.QuestionDifficulty.FACTUAL,
+    )
+
+
+def _make_result(test_case: model.TestCase, precision: float) -> model.TestCaseResult:
+    return model.TestCaseResult.create(
+        test_case_id=test_case.id,
+        retrieved_chunk_ids=test_case.ground_truth_chunk_ids,
+        retrieved_scores=(0.9,),
+        metrics=model.CaseMetrics(
+            precision=precision, recall=1.0, hit=True, reciprocal_rank=1.0
+        ),
+    )
+
+
+class TestDatasetRepository:
+    """Tests for DatasetRepository."""
+
+    @pytest.fixture
+    async def notebook(self, test_session) -> Notebook:
+        """Create a notebook to own the datasets."""
+        notebook = Notebook.create(name="Eval Notebook", description="For evaluation tests")
+        await NotebookRepository(test_session).save(notebook)
+        return notebook
+
+    @pytest.fixture
+    def repository(self, test_session) -> DatasetRepository:
+        """Create repository instance."""
+        return DatasetRepository(test_session)
+
+    @pytest.mark.asyncio
+    async def test_save_with_test_cases_round_trip(self, repository, notebook):
+        """Test every test case is stored with the dataset."""
+        dataset = model.EvaluationDataset.create(notebook_id=notebook.id, name="ds")
+        test_cases = tuple(_make_test_case(i) for i in range(3))
+        dataset = dataset.mark_generating().mark_completed(test_cases)
+
+        saved = await repository.save_with_test_cases(dataset)
+        found = await repository.find_by_id(dataset.id)
+
+        assert saved == dataset
+        assert found.status == model.DatasetStatus.COMPLETED
+        assert {tc.id for tc in found.test_cases} == {tc.id for tc in test_cases}
+        assert found.test_cases[0].difficulty == model.QuestionDifficulty.FACTUAL
+
+    @pytest.mark.asyncio
+    async def test_save_with_test_cases_updates_existing_rows(self, repository, notebook):
+        """Test saving again overwrites existing test cases instead of failing."""
+        dataset = model.EvaluationDataset.create(notebook_id=notebook.id, name="ds")
+        test_case = _make_test_case(0)
+        dataset = dataset.mark_generating().mark_completed((test_case,))
+        await repository.save_with_test_cases(dataset)
+        edited = test_case.model_copy(update={"question": "Edited?"})
+
+        await repository.save_with_test_cases(dataset.model_copy(update={"test_cases": (edited,)}))
+        found = await repository.find_by_id(dataset.id)
+
+        assert [tc.question for tc in found.test_cases] == ["Edited?"]
+
+    @pytest.mark.asyncio
+    async def test_find_by_id_orders_test_cases_by_creation(self, repository, notebook):
+        """Test test cases come back oldest first regardless of write order."""
+        dataset = model.EvaluationDataset.create(notebook_id=notebook.id, name="ds")
+        older, newer = _make_test_case(0), _make_test_case(1)
+        dataset = dataset.mark_generating().mark_completed((newer, older))
+        await repository.save_with_test_cases(dataset)
+
+        found = await repository.find_by_id(dataset.id)
+
+        assert [tc.id for tc in found.test_cases] == [older.id, newer.id]
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_dataset(self, repository, notebook):
+        """Test deleting a dataset reports success and removes it."""
+        dataset = model.EvaluationDataset.create(notebook_id=notebook.id, name="ds")
+        await repository.save_with_test_cases(dataset)
+
+        deleted = await repository.delete(dataset.id)
+
+        assert deleted is True
+        assert await repository.find_by_id(dataset.id) is None
+
+    @pytest.mark.asyncio
+    async def test_delete_missing_dataset_returns_false(self, repository):
+        """Test deleting an unknown dataset reports nothing was deleted."""
+        assert await repository.delete("missing") is False
+
+    @pytest.mark.asyncio
+    async def test_list_by_notebook_streams_across_batches(
+        self, repository, notebook, monkeypatch
+    ):
+        """Test listing returns every dataset, newest first, when streamed in small batches."""
+        monkeypatch.setattr(repository_module, "LIST_YIELD_PER", 2)
+        names = ["a", "b", "c", "d", "e"]
+        for name in names:
+            dataset = model.EvaluationDataset.create(notebook_id=notebook.id, name=name)
+            await repository.save_with_test_cases(
+                dataset.mark_generating().mark_completed((_make_test_case(0),))
+            )
+
+        datasets = await repository.list_by_notebook(notebook.id)
+
+        assert [ds.name for ds in datasets] == names[::-1]
+        assert all(len(ds.test_cases) == 1 for ds in datasets)
+
+    @pytest.mark.asyncio
+    async def test_list_page_by_notebook_returns_requested_page(self, repository, notebook):
+        """Test paging returns the page's datasets, newest first, with the full count."""
+        names = ["a", "b", "c"]
+        for name in names:
+            dataset = model.EvaluationDataset.create(notebook_id=notebook.id, name=name)
+            await repository.save_with_test_cases(dataset)
+
+        page = await repository.list_page_by_notebook(
+            notebook.id, pagination.ListQuery(page=2, size=2)
+        )
+
+        assert [ds.name for ds in page.items] == ["a"]
+        assert page.total == 3
+        assert page.pages == 2
+
+    @pytest.mark.asyncio
+    async def test_count_by_notebook(self, repository, notebook, test_session):
+        """Test counting datasets only counts the notebook's own."""
+        other = Notebook.create(name="Other", description="Unrelated")
+        await NotebookRepository(test_session).save(other)
+        for notebook_id in (notebook.id, notebook.id, other.id):
+            dataset = model.EvaluationDataset.create(notebook_id=notebook_id, name="ds")
+            await repository.save_with_test_cases(dataset)
+
+        count = await repository.count_by_notebook(notebook.id)
+
+        assert count == 2
+
+    @pytest.mark.asyncio
+    async def test_list_by_notebook_loads_test_cases_in_one_query(
+        self, repository, notebook, test_session, test_engine
+    ):
+        """Test listing datasets fetches all their test cases in one batched query."""
+        for name in ("a", "b", "c"):
+            dataset = model.EvaluationDataset.create(notebook_id=notebook.id, name=name)
+            dataset = dataset.mark_generating().mark_completed((_make_test_case(0),))
+            await repository.save_with_test_cases(dataset)
+        test_session.expunge_all()
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        sqlalchemy.event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+        try:
+            datasets = await repository.list_by_notebook(notebook.id)
+        finally:
+            sqlalchemy.event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+        assert [len(ds.test_cases) for ds in datasets] == [1, 1, 1]
+        assert len(statements) == 2
+
+
+class TestRunRepository:
+    """Tests for RunRepository."""
+
+    @pytest.fixture
+    async def dataset(self, test_session) -> model.EvaluationDataset:
+        """Create a completed dataset to run against."""
+        notebook = Notebook.create(name="Eval Notebook", description="For evaluation tests")
+        await NotebookRepository(test_session).save(notebook)
+        dataset = model.EvaluationDataset.create(notebook_id=notebook.id, name="ds")
+        test_cases = tuple(_make_test_case(i) for i in range(2))
+        dataset = dataset.mark_generating().mark_completed(test_cases)
+        return await DatasetRepository(test_session).save_with_test_cases(dataset)
+
+    @pytest.fixture
+    def repository(self, test_session) -> RunRepository:
+        """Create repository instance."""
+        return RunRepository(test_session)
+
+    @pytest.mark.asyncio
+    async def test_save_with_results_round_trip(self, repository, dataset):
+        """Test every result is stored with the run."""
+        run = model.EvaluationRun.create(dataset_id=dataset.id)
+        results = tuple(_make_result(tc, 0.5) for tc in dataset.test_cases)
+        run = run.mark_running().model_copy(update={"results": results})
+
+        saved = await repository.save_with_results(run)
+        found = await repository.find_by_id(run.id)
+
+        assert saved == run
+        assert {r.id for r in found.results} == {r.id for r in results}
+        assert all(r.precision == 0.5 for r in found.results)
+
+    @pytest.mark.asyncio
+    async def test_save_with_results_large_run_without_copy_support(self, repository, dataset):
+        """Test runs above the COPY threshold still save through upserts on SQLite."""
+        run = model.EvaluationRun.create(dataset_id=dataset.id)
+        test_case = dataset.test_cases[0]
+        results = tuple(
+            _make_result(test_case, 0.5)
+            for _ in range(repository_module.COPY_THRESHOLD_ROWS + 1)
+        )
+        run = run.mark_running().model_copy(update={"results": results})
+
+        await repository.save_with_results(run)
+        found = await repository.find_by_id(run.id)
+
+        assert len(found.results) == len(results)
+
+    @pytest.mark.asyncio
+    async def test_list_by_ids_loads_results_in_one_query(
+        self, repository, dataset, test_session, test_engine
+    ):
+        """Test comparing runs fetches all their results in one batched query."""
+        run_ids = []
+        for precision in (0.5, 1.0):
+            run = model.EvaluationRun.create(dataset_id=dataset.id)
+            results = tuple(_make_result(tc, precision) for tc in dataset.test_cases)
+            await repository.save_with_results(
+                run.mark_running().model_copy(update={"results": results})
+            )
+            run_ids.append(run.id)
+        test_session.expunge_all()
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        sqlalchemy.event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+        try:
+            runs = await repository.list_by_ids(run_ids)
+        finally:
+            sqlalchemy.event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+        assert sorted(len(run.results) for run in runs) == [2, 2]
+        assert len(statements) == 2
@@ -0,0 +1,197 @@
+"""Tests for the evaluation LLM response cache."""
+
+from unittest import mock
+
+import pytest
+
+from src.evaluation.adapter import judge, response_cache
+
+
+def _make_agent(output: object) -> mock.MagicMock:
+    """Create an agent stub whose run returns the given output."""
+    result = mock.MagicMock()
+    result.output = output
+    agent = mock.MagicMock()
+    agent.output_type = str
+    agent.model_settings = {"temperature": 0.0}
+    agent.run = mock.AsyncMock(return_value=result)
+    return agent
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    @pytest.mark.asyncio
+    async def test_second_run_is_served_from_disk(self, tmp_path) -> None:
+        # Arrange
+        cache = response_cache.ResponseCache(directory=str(tmp_path), ttl_seconds=60)
+        agent = _make_agent("output")
+
+        # Act
+        first = await cache.run(agent, "test", "system", "prompt")
+        second = await cache.run(agent, "test", "system", "prompt")
+
+        # Assert
+        assert first == second == "output"
+        agent.run.assert_awaited_once_with("prompt")
+
+    @pytest.mark.asyncio
+    async def test_cache_survives_new_instance(self, tmp_path) -> None:
+        # Arrange
+        agent = _make_agent("output")
+        await response_cache.ResponseCache(str(tmp_path), ttl_seconds=60).run(
+            agent, "test", "system", "prompt"
+        )
+        fresh_agent = _make_agent("different")
+
+        # Act
+        output = await response_cache.ResponseCache(str(tmp_path), ttl_seconds=60).run(
+            fresh_agent, "test", "system", "prompt"
+        )
+
+        # Assert
+        assert output == "output"
+        fresh_agent.run.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refetched(self, tmp_path) -> None:
+        # Arrange
+        cache = response_cache.ResponseCache(directory=str(tmp_path), ttl_seconds=-1)
+        agent = _make_agent("output")
+
+        # Act
+        await cache.run(agent, "test", "system", "prompt")
+        await cache.run(agent, "test", "system", "prompt")
+
+        # Assert
+        assert agent.run.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_corrupt_entry_is_treated_as_miss(self, tmp_path) -> None:
+        # Arrange
+        cache = response_cache.ResponseCache(directory=str(tmp_path), ttl_seconds=60)
+        agent = _make_agent("output")
+        await cache.run(agent, "test", "system", "prompt")
+        for entry in tmp_path.glob("*.json"):
+            entry.write_text("{not json")
+
+        # Act
+        output = await cache.run(agent, "test", "system", "prompt")
+
+        # Assert
+        assert output == "output"
+        assert agent.run.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_changed_model_settings_misses(self, tmp_path) -> None:
+        # Arrange
+        cache = response_cache.ResponseCache(directory=str(tmp_path), ttl_seconds=60)
+        agent = _make_agent("output")
+        await cache.run(agent, "test", "system", "prompt")
+        agent.model_settings = {"temperature": 0.7}
+
+        # Act
+        await cache.run(agent, "test", "system", "prompt")
+
+        # Assert
+        assert agent.run.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_changed_output_schema_misses(self, tmp_path) -> None:
+        # Arrange
+        cache = response_cache.ResponseCache(directory=str(tmp_path), ttl_seconds=60)
+        agent = _make_agent(judge.ScoreOutput(score=0.5))
+        agent.output_type = judge.ScoreOutput
+        await cache.run(agent, "test", "system", "prompt")
+        agent.output_type = judge.EvaluationOutput
+        agent.run.return_value.output = judge.EvaluationOutput(
+            faithfulness=0.5, relevancy=0.5, completeness=0.5
+        )
+
+        # Act
+        await cache.run(agent, "test", "system", "prompt")
+
+        # Assert
+        assert agent.run.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_write_leaves_no_temp_file(self, tmp_path) -> None:
+        # Arrange
+        cache = response_cache.ResponseCache(directory=str(tmp_path), ttl_seconds=60)
+        agent = _make_agent("output")
+
+        # Act
+        with mock.patch.object(
+            response_cache.os, "replace", side_effect=OSError("disk full")
+        ):
+            output = await cache.run(agent, "test", "system", "prompt")
+
+        # Assert
+        assert output == "output"
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_structured_output_round_trips(self, tmp_path) -> None:
+        # Arrange
+        cache = response_cache.ResponseCache(directory=str(tmp_path), ttl_seconds=60)
+        output = judge.ScoreOutput(score=0.5, reasoning="partial")
+        agent = _make_agent(output)
+        agent.output_type = judge.ScoreOutput
+        await cache.run(agent, "test", "system", "prompt")
+
+        # Act
+        cached = await cache.run(agent, "test", "system", "prompt")
+
+        # Assert
+        assert cached == output
+        agent.run.assert_awaited_once()
+
+    def test_key_depends_on_every_part(self) -> None:
+        # Arrange
+        make_key = response_cache.ResponseCache.make_key
+
+        # Act
+        keys = {
+            make_key("model-a", "system", "prompt"),
+            make_key("model-b", "system", "prompt"),
+            make_key("model-a", "other", "prompt"),
+            make_key("model-a", "system", "other"),
+            make_key("model-a", "systemprompt", ""),
+            make_key("model-a", "system", "prompt", model_settings="{}"),
+            make_key("model-a", "system", "prompt", output_schema="{}"),
+        }
+
+        # Assert
+        assert len(keys) == 7
+
+    def test_build_without_directory_disables_cache(self) -> None:
+        assert response_cache.build_response_cache(None, ttl_seconds=60) is None
+
+
+class TestJudgeWithResponseCache:
+    """Tests for LLMJudge reading through the response cache."""
+
+    @pytest.mark.asyncio
+    async def test_rerun_with_new_judge_skips_llm_call(self, tmp_path) -> None:
+        # Arrange
+        output = judge.EvaluationOutput(faithfulness=0.9, relevancy=0.8, completeness=0.7)
+        first = judge.LLMJudge(
+            eval_model="test",
+            response_cache=response_cache.ResponseCache(str(tmp_path), ttl_seconds=60),
+        )
+        second = judge.LLMJudge(
+            eval_model="test",
+            response_cache=response_cache.ResponseCache(str(tmp_path), ttl_seconds=60),
+        )
+        mock_result = mock.MagicMock()
+        mock_result.output = output
+        with mock.patch.object(first._evaluation_agent, "run", return_value=mock_result):
+            await first.score_faithfulness("q", "a", [])
+
+        with mock.patch.object(second._evaluation_agent, "run") as mock_run:
+            # Act
+            score = await second.score_faithfulness("q", "a", [])
+
+        # Assert
+        assert score == 0.9
+        mock_run.assert_not_awaited()
@@ -0,0 +1,120 @@
+"""Tests for retrying transient LLM failures."""
+
+from unittest import mock
+
+import pydantic_ai.exceptions
+import pytest
+
+from src.evaluation.adapter import judge, retry
+
+
+def _rate_limited() -> pydantic_ai.exceptions.ModelHTTPError:
+    """Create the error pydantic-ai raises for an HTTP 429."""
+    return pydantic_ai.exceptions.ModelHTTPError(status_code=429, model_name="test")
+
+
+def _no_delay(max_attempts: int = 3) -> retry.RetryPolicy:
+    """Create a retry policy that does not sleep between attempts."""
+    return retry.RetryPolicy(
+        max_attempts=max_attempts, initial_delay_seconds=0.0, max_delay_seconds=0.0
+    )
+
+
+class TestIsTransient:
+    """Tests for is_transient."""
+
+    @pytest.mark.parametrize("status_code", [408, 429, 500, 503])
+    def test_retryable_statuses_are_transient(self, status_code: int) -> None:
+        exc = pydantic_ai.exceptions.ModelHTTPError(status_code=status_code, model_name="test")
+        assert retry.is_transient(exc)
+
+    @pytest.mark.parametrize("status_code", [400, 401, 404, 409])
+    def test_client_errors_are_not_transient(self, status_code: int) -> None:
+        exc = pydantic_ai.exceptions.ModelHTTPError(status_code=status_code, model_name="test")
+        assert not retry.is_transient(exc)
+
+    def test_connection_failure_is_transient(self) -> None:
+        exc = pydantic_ai.exceptions.ModelAPIError(model_name="test", message="reset")
+        assert retry.is_transient(exc)
+
+    def test_unrelated_error_is_not_transient(self) -> None:
+        assert not retry.is_transient(ValueError("bad output"))
+
+
+class TestInferModel:
+    """Tests for infer_model."""
+
+    def test_openai_client_does_not_retry_on_its_own(self, monkeypatch) -> None:
+        # Arrange
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+        # Act
+        model = retry.infer_model("openai:gpt-4o-mini")
+
+        # Assert
+        assert model.client.max_retries == 0
+
+    def test_test_model_passes_through(self) -> None:
+        # Act
+        model = retry.infer_model("test")
+
+        # Assert
+        assert model.model_name == "test"
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy.run."""
+
+    @pytest.mark.asyncio
+    async def test_transient_failures_are_retried(self) -> None:
+        # Arrange
+        call = mock.AsyncMock(side_effect=[_rate_limited(), _rate_limited(), "ok"])
+
+        # Act
+        result = await _no_delay().run(call)
+
+        # Assert
+        assert result == "ok"
+        assert call.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_last_transient_failure_is_raised(self) -> None:
+        # Arrange
+        call = mock.AsyncMock(side_effect=_rate_limited())
+
+        # Act & Assert
+        with pytest.raises(pydantic_ai.exceptions.ModelHTTPError):
+            await _no_delay(max_attempts=3).run(call)
+        assert call.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_non_transient_failure_is_not_retried(self) -> None:
+        # Arrange
+        call = mock.AsyncMock(side_effect=ValueError("bad output"))
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await _no_delay().run(call)
+        call.assert_awaited_once()
+
+
+class TestJudgeRetries:
+    """Tests for LLMJudge recovering from transient failures."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_call_recovers(self) -> None:
+        # Arrange
+        j = judge.LLMJudge(eval_model="test", retry_policy=_no_delay())
+        mock_result = mock.MagicMock()
+        mock_result.output = judge.EvaluationOutput(
+            faithfulness=0.8, relevancy=0.7, completeness=0.6
+        )
+
+        with mock.patch.object(
+            j._evaluation_agent, "run", side_effect=[_rate_limited(), mock_result]
+        ):
+            # Act
+            score = await j.score_faithfulness("q", "a", [])
+
+        # Assert
+        assert score == 0.8
@@ -49,6 +49,17 @@ class TestCitationPrecision:
         assert result == 0.0
 
 
+    def test_repeated_citations_each_count(self) -> None:
+        # Arrange
+        cited = ["a", "a", "x"]
+        relevant = {"a"}
+
+        # Act
+        result = metric.citation_precision(cited, relevant)
+
+        # Assert
+        assert abs(result - 2.0 / 3) < 1e-9
+
 class TestCitationRecall:
     def test_all_relevant_are_cited(self) -> None:
         # Arrange
@@ -105,6 +116,17 @@ class TestCitationRecall:
         # Assert
         assert result == 0.0
 
+    def test_repeated_citations_count_once(self) -> None:
+        # Arrange
+        cited = ["a", "a", "a"]
+        relevant = {"a", "b"}
+
+        # Act
+        result = metric.citation_recall(cited, relevant)
+
+        # Assert
+        assert result == 0.5
+
 
 class TestPhantomCitationCount:
     def test_no_phantom_citations(self) -> None:
@@ -108,6 +108,28 @@ class TestInterDocumentSimilarity:
         # Assert
         assert result == 0.0
 
+    def test_matches_mean_of_cross_document_pairs(self) -> None:
+        # Arrange
+        embeddings_by_doc = {
+            "doc1": [[1.0, 0.0], [0.6, 0.8]],
+            "doc2": [[0.0, 1.0]],
+            "doc3": [[0.0, 0.0], [-1.0, 0.0]],
+        }
+        docs = list(embeddings_by_doc.values())
+        pair_scores = [
+            metric.cosine_similarity(vec_a, vec_b)
+            for i, doc_a in enumerate(docs)
+            for doc_b in docs[i + 1 :]
+            for vec_a in doc_a
+            for vec_b in doc_b
+        ]
+
+        # Act
+        result = metric.inter_document_similarity(embeddings_by_doc)
+
+        # Assert
+        assert math.isclose(result, sum(pair_scores) / len(pair_scores), rel_tol=1e-9)
+
 
 class TestSeparationRatio:
     def test_good_separation(self) -> None:
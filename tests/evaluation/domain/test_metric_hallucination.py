@@ -0,0 +1,43 @@
+"""Tests for hallucination metrics."""
+
+from src.evaluation.domain import metric, model
+
+
+class TestHallucinationCounts:
+    def test_counts_contradicted_and_fabricated_claims(self) -> None:
+        # Arrange
+        verdicts = [
+            model.ClaimVerdict.SUPPORTED,
+            model.ClaimVerdict.CONTRADICTED,
+            model.ClaimVerdict.FABRICATED,
+            model.ClaimVerdict.FABRICATED,
+        ]
+
+        # Act
+        result = metric.hallucination_counts(verdicts)
+
+        # Assert
+        assert result == (0.75, 1, 2)
+
+    def test_partial_and_unverifiable_are_not_hallucinations(self) -> None:
+        # Arrange
+        verdicts = [
+            model.ClaimVerdict.PARTIALLY_SUPPORTED,
+            model.ClaimVerdict.UNVERIFIABLE,
+        ]
+
+        # Act
+        result = metric.hallucination_counts(verdicts)
+
+        # Assert
+        assert result == (0.0, 0, 0)
+
+    def test_no_claims_returns_zero(self) -> None:
+        # Arrange
+        verdicts: list[model.ClaimVerdict] = []
+
+        # Act
+        result = metric.hallucination_counts(verdicts)
+
+        # Assert
+        assert result == (0.0, 0, 0)
@@ -83,6 +83,17 @@ class TestNdcgAtK:
         assert result == 0.0
 
 
+    def test_ranks_deeper_than_discount_table(self) -> None:
+        # Arrange
+        retrieved = [f"c{i}" for i in range(300)]
+        relevant = set(retrieved[:200])
+
+        # Act
+        result = metric.ndcg_at_k(retrieved, relevant, k=300)
+
+        # Assert
+        assert abs(result - 1.0) < 1e-9
+
 class TestAveragePrecisionAtK:
     def test_perfect_ranking_returns_one(self) -> None:
         # Arrange
@@ -1,11 +1,16 @@
 """Tests for SyntheticTestGenerator difficulty classification."""
 
-import json
+import asyncio
+import collections
+import random
 from unittest import mock
 
+import pydantic
 import pytest
 
+from src import settings as settings_module
 from src.chunk.domain import model as chunk_model
+from src.common import text
 from src.evaluation.adapter import generator
 from src.evaluation.domain import model
 
@@ -27,13 +32,12 @@ def _make_generator() -> generator.SyntheticTestGenerator:
     return generator.SyntheticTestGenerator(eval_model="test")
 
 
-class TestParseQuestionsWithDifficulty:
-    """Tests for _parse_questions with difficulty classification."""
+class TestQuestionTuplesWithDifficulty:
+    """Tests for _question_tuples over structured generator output."""
 
-    def test_valid_json_with_difficulty_returns_tuples(self) -> None:
+    def test_questions_with_difficulty_return_tuples(self) -> None:
         # Arrange
-        gen = _make_generator()
-        raw = json.dumps({
+        output = generator.GeneratedQuestions.model_validate({
             "questions": [
                 {"text": "What is AI?", "difficulty": "factual"},
                 {"text": "How does AI compare to ML?", "difficulty": "analytical"},
@@ -41,7 +45,7 @@ class TestParseQuestionsWithDifficulty:
         })
 
         # Act
-        result = gen._parse_questions(raw, expected_count=2)
+        result = generator.SyntheticTestGenerator._question_tuples(output)
 
         # Assert
         assert result == [
@@ -51,8 +55,7 @@ class TestParseQuestionsWithDifficulty:
 
     def test_all_difficulty_levels_parsed_correctly(self) -> None:
         # Arrange
-        gen = _make_generator()
-        raw = json.dumps({
+        output = generator.GeneratedQuestions.model_validate({
             "questions": [
                 {"text": "q1", "difficulty": "factual"},
                 {"text": "q2", "difficulty": "analytical"},
@@ -62,7 +65,7 @@ class TestParseQuestionsWithDifficulty:
         })
 
         # Act
-        result = gen._parse_questions(raw, expected_count=4)
+        result = generator.SyntheticTestGenerator._question_tuples(output)
 
         # Assert
         assert result == [
@@ -74,8 +77,7 @@ class TestParseQuestionsWithDifficulty:
 
     def test_missing_difficulty_returns_none(self) -> None:
         # Arrange
-        gen = _make_generator()
-        raw = json.dumps({
+        output = generator.GeneratedQuestions.model_validate({
             "questions": [
                 {"text": "What is AI?"},
                 {"text": "How does AI work?"},
@@ -83,7 +85,7 @@ class TestParseQuestionsWithDifficulty:
         })
 
         # Act
-        result = gen._parse_questions(raw, expected_count=2)
+        result = generator.SyntheticTestGenerator._question_tuples(output)
 
         # Assert
         assert result == [
@@ -91,115 +93,143 @@ class TestParseQuestionsWithDifficulty:
             ("How does AI work?", None),
         ]
 
-    def test_invalid_difficulty_value_returns_none_with_warning(self) -> None:
+    def test_invalid_difficulty_value_is_rejected(self) -> None:
+        # Act & Assert
+        with pytest.raises(pydantic.ValidationError):
+            generator.GeneratedQuestions.model_validate({
+                "questions": [{"text": "What is AI?", "difficulty": "impossible"}]
+            })
+
+    def test_empty_text_questions_filtered_out(self) -> None:
         # Arrange
-        gen = _make_generator()
-        raw = json.dumps({
+        output = generator.GeneratedQuestions.model_validate({
             "questions": [
-                {"text": "What is AI?", "difficulty": "impossible"},
+                {"text": "  ", "difficulty": "factual"},
+                {"text": "Valid?", "difficulty": "factual"},
             ]
         })
 
         # Act
-        with mock.patch.object(generator.logger, "warning") as mock_warn:
-            result = gen._parse_questions(raw, expected_count=1)
+        result = generator.SyntheticTestGenerator._question_tuples(output)
 
         # Assert
-        assert result == [("What is AI?", None)]
-        mock_warn.assert_called_once()
+        assert result == [("Valid?", model.QuestionDifficulty.FACTUAL)]
 
-    def test_backward_compatible_with_plain_string_list(self) -> None:
-        # Arrange
-        gen = _make_generator()
-        raw = json.dumps({
-            "questions": ["What is AI?", "How does AI work?"]
-        })
 
+class TestFormatQuestionPrompt:
+    """Tests for format_question_prompt."""
+
+    def test_prompt_contains_count_and_passage(self) -> None:
         # Act
-        result = gen._parse_questions(raw, expected_count=2)
+        prompt = generator.format_question_prompt(count=3, content="AI is a field.")
 
         # Assert
-        assert result == [
-            ("What is AI?", None),
-            ("How does AI work?", None),
-        ]
+        assert "generate exactly 3 questions" in prompt
+        assert prompt.endswith("Passage:\nAI is a field.")
+
+
+class TestDeduplicateQuestions:
+    """Tests for collapsing duplicate generated questions."""
+
+    def test_normalize_ignores_case_punctuation_and_spacing(self) -> None:
+        assert generator.normalize_question("  What is  AI? ") == generator.normalize_question(
+            "what is ai"
+        )
 
-    def test_mixed_format_questions_handled(self) -> None:
+    @pytest.mark.asyncio
+    async def test_duplicate_questions_across_chunks_are_merged(self) -> None:
         # Arrange
         gen = _make_generator()
-        raw = json.dumps({
-            "questions": [
-                {"text": "What is AI?", "difficulty": "factual"},
-                "How does AI work?",
-            ]
-        })
-
-        # Act
-        result = gen._parse_questions(raw, expected_count=2)
+        chunk_a = _make_chunk("AI is about intelligence.")
+        chunk_b = _make_chunk("AI is a field of study.")
+        result_a = mock.MagicMock()
+        result_a.output = generator.GeneratedQuestions.model_validate(
+            {"questions": [{"text": "What is AI?", "difficulty": "factual"}]}
+        )
+        result_b = mock.MagicMock()
+        result_b.output = generator.GeneratedQuestions.model_validate(
+            {"questions": [{"text": "what is AI"}, {"text": "Why study AI?"}]}
+        )
+
+        with mock.patch.object(gen._agent, "run", side_effect=[result_a, result_b]):
+            # Act
+            test_cases = await gen.generate_test_cases(
+                chunks=[chunk_a, chunk_b], questions_per_chunk=2
+            )
 
         # Assert
-        assert result == [
-            ("What is AI?", model.QuestionDifficulty.FACTUAL),
-            ("How does AI work?", None),
-        ]
+        assert [tc.question for tc in test_cases] == ["What is AI?", "Why study AI?"]
+        assert test_cases[0].ground_truth_chunk_ids == (chunk_a.id, chunk_b.id)
+        assert test_cases[0].source_chunk_id == chunk_a.id
+        assert test_cases[0].difficulty == model.QuestionDifficulty.FACTUAL
+
 
-    def test_uppercase_difficulty_parsed_correctly(self) -> None:
+class TestQuestionPrompt:
+    """Tests for the per-chunk question prompt."""
+
+    def test_oversized_chunk_is_clipped(self) -> None:
         # Arrange
-        gen = _make_generator()
-        raw = json.dumps({
-            "questions": [
-                {"text": "What is AI?", "difficulty": "FACTUAL"},
-            ]
-        })
+        chunk = _make_chunk("a" * text.MAX_CHUNK_CHARS + "tail")
 
         # Act
-        result = gen._parse_questions(raw, expected_count=1)
+        prompt = generator.SyntheticTestGenerator._question_prompt(chunk, count=2)
 
         # Assert
-        assert result == [("What is AI?", model.QuestionDifficulty.FACTUAL)]
+        passage = prompt.split("Passage:\n")[1]
+        assert len(passage) == text.MAX_CHUNK_CHARS
+        assert "[truncated]" in passage
+        assert passage.endswith("tail")
 
-    def test_markdown_code_block_with_difficulty(self) -> None:
+
+class TestSampleChunks:
+    """Tests for reservoir sampling of chunks."""
+
+    def test_small_list_is_returned_whole(self) -> None:
         # Arrange
-        gen = _make_generator()
-        raw = '```json\n' + json.dumps({
-            "questions": [
-                {"text": "What is AI?", "difficulty": "analytical"},
-            ]
-        }) + '\n```'
+        chunks = [_make_chunk(f"Passage {i}.") for i in range(3)]
 
         # Act
-        result = gen._parse_questions(raw, expected_count=1)
+        sampled = generator.SyntheticTestGenerator.sample_chunks(chunks, max_sample=5)
 
         # Assert
-        assert result == [
-            ("What is AI?", model.QuestionDifficulty.ANALYTICAL),
-        ]
+        assert sampled == chunks
 
-    def test_empty_text_questions_filtered_out(self) -> None:
+    def test_stream_is_sampled_to_reservoir_size(self) -> None:
         # Arrange
-        gen = _make_generator()
-        raw = json.dumps({
-            "questions": [
-                {"text": "", "difficulty": "factual"},
-                {"text": "Valid?", "difficulty": "factual"},
-            ]
-        })
+        chunks = [_make_chunk(f"Passage {i}.") for i in range(100)]
 
         # Act
-        result = gen._parse_questions(raw, expected_count=2)
+        sampled = generator.SyntheticTestGenerator.sample_chunks(iter(chunks), max_sample=10)
 
         # Assert
-        assert result == [("Valid?", model.QuestionDifficulty.FACTUAL)]
+        assert len(sampled) == 10
+        assert len({chunk.id for chunk in sampled}) == 10
+        assert {chunk.id for chunk in sampled} <= {chunk.id for chunk in chunks}
+
+    def test_non_positive_sample_size_returns_empty(self) -> None:
+        # Act
+        sampled = generator.SyntheticTestGenerator.sample_chunks_stream(
+            iter([_make_chunk()]), max_sample=0
+        )
+
+        # Assert
+        assert sampled == []
 
-    def test_invalid_json_returns_empty_list(self) -> None:
+    def test_every_chunk_is_equally_likely(self) -> None:
         # Arrange
-        gen = _make_generator()
+        random.seed(7)
+        chunks = [_make_chunk(f"Passage {i}.") for i in range(10)]
+        trials = 3000
+        counts: collections.Counter[str] = collections.Counter()
 
         # Act
-        result = gen._parse_questions("not json at all", expected_count=2)
+        for _ in range(trials):
+            sampled = generator.SyntheticTestGenerator.sample_chunks_stream(chunks, 3)
+            counts.update(chunk.id for chunk in sampled)
 
         # Assert
-        assert result == []
+        expected = trials * 3 / len(chunks)
+        assert all(abs(counts[chunk.id] - expected) < expected * 0.15 for chunk in chunks)
 
 
 class TestGenerateTestCasesWithDifficulty:
@@ -211,7 +241,7 @@ class TestGenerateTestCasesWithDifficulty:
         gen = _make_generator()
         chunk = _make_chunk("AI is a broad field of computer science.")
 
-        llm_response = json.dumps({
+        llm_response = generator.GeneratedQuestions.model_validate({
             "questions": [
                 {"text": "What is AI?", "difficulty": "factual"},
                 {"text": "How might AI evolve?", "difficulty": "inferential"},
@@ -246,8 +276,8 @@ class TestGenerateTestCasesWithDifficulty:
         gen = _make_generator()
         chunk = _make_chunk("AI is a broad field.")
 
-        llm_response = json.dumps({
-            "questions": ["What is AI?", "Define AI."]
+        llm_response = generator.GeneratedQuestions.model_validate({
+            "questions": [{"text": "What is AI?"}, {"text": "Define AI."}]
         })
 
         mock_result = mock.MagicMock()
@@ -274,12 +304,12 @@ class TestGenerateTestCasesWithDifficulty:
         chunk_a = _make_chunk("AI is about intelligence.")
         chunk_b = _make_chunk("ML is a subset of AI.")
 
-        llm_response_a = json.dumps({
+        llm_response_a = generator.GeneratedQuestions.model_validate({
             "questions": [
                 {"text": "What is AI?", "difficulty": "factual"},
             ]
         })
-        llm_response_b = json.dumps({
+        llm_response_b = generator.GeneratedQuestions.model_validate({
             "questions": [
                 {"text": "How does ML relate to AI?", "difficulty": "analytical"},
             ]
@@ -307,3 +337,42 @@ class TestGenerateTestCasesWithDifficulty:
         assert test_cases[0].source_chunk_id == chunk_a.id
         assert test_cases[1].difficulty == model.QuestionDifficulty.ANALYTICAL
         assert test_cases[1].source_chunk_id == chunk_b.id
+
+
+class TestGenerateTestCasesConcurrency:
+    """Tests for concurrent question generation across chunks."""
+
+    def test_default_limit_comes_from_settings(self) -> None:
+        # Act
+        gen = generator.SyntheticTestGenerator(eval_model="test")
+
+        # Assert
+        assert gen._max_concurrency == settings_module.settings.eval_max_concurrency
+
+    @pytest.mark.asyncio
+    async def test_in_flight_calls_bounded_by_max_concurrency(self) -> None:
+        # Arrange
+        gen = generator.SyntheticTestGenerator(eval_model="test", max_concurrency=2)
+        chunks = [_make_chunk(f"Passage {i}.") for i in range(6)]
+        in_flight = 0
+        peak = 0
+
+        async def fake_run(prompt: str) -> mock.MagicMock:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            passage = prompt.split("Passage:\n")[1].split("\n")[0]
+            result = mock.MagicMock()
+            result.output = generator.GeneratedQuestions.model_validate({"questions": [{"text": passage}]})
+            return result
+
+        with mock.patch.object(gen._agent, "run", side_effect=fake_run):
+            # Act
+            test_cases = await gen.generate_test_cases(chunks=chunks, questions_per_chunk=1)
+
+        # Assert
+        assert peak == 2
+        assert [tc.question for tc in test_cases] == [f"Passage {i}." for i in range(6)]
+        assert [tc.source_chunk_id for tc in test_cases] == [chunk.id for chunk in chunks]
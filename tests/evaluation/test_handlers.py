@@ -1,11 +1,13 @@
 """Tests for evaluation handlers."""
 
+import asyncio
 import datetime
 from unittest import mock
 
 import pytest
 
 from src import exceptions
+from src.evaluation.adapter import judge as judge_module
 from src.evaluation.adapter import repository as evaluation_repository_module
 from src.evaluation.domain import model
 from src.evaluation.handler import handlers
@@ -381,8 +383,15 @@ class TestRunEvaluationHandlerFullRag:
         answer_mock.answer = "AI is artificial intelligence."
         rag_agent.answer.return_value = answer_mock
 
-        llm_judge.score_faithfulness.return_value = 0.9
-        llm_judge.score_answer_relevancy.return_value = 0.8
+        llm_judge.score_all.return_value = judge_module.AnswerEvaluation(
+            faithfulness=0.9,
+            answer_relevancy=0.8,
+            answer_completeness=0.7,
+            claims=(
+                {"claim_text": "c1", "verdict": "supported", "supporting_chunks": [1]},
+                {"claim_text": "c2", "verdict": "fabricated", "supporting_chunks": []},
+            ),
+        )
 
         run_repository.save.return_value = None
         run_repository.save_with_results.side_effect = lambda run: run
@@ -402,6 +411,62 @@ class TestRunEvaluationHandlerFullRag:
         assert detail.results[0].generated_answer == "AI is artificial intelligence."
         assert detail.results[0].faithfulness == 0.9
         assert detail.results[0].answer_relevancy == 0.8
+        assert detail.results[0].answer_completeness == 0.7
+        assert detail.results[0].hallucination_rate == 0.5
+        assert detail.results[0].contradiction_count == 0
+        assert detail.results[0].fabrication_count == 1
+        assert detail.results[0].total_claims == 2
+        llm_judge.score_all.assert_awaited_once()
+
+    @pytest.mark.asyncio()
+    async def test_full_rag_generates_answers_concurrently_in_order(
+        self,
+        dataset_repository: mock.AsyncMock,
+        run_repository: mock.AsyncMock,
+        retrieval_service: mock.AsyncMock,
+        rag_agent: mock.AsyncMock,
+        llm_judge: mock.AsyncMock,
+    ) -> None:
+        # Arrange
+        handler = handlers.RunEvaluationHandler(
+            dataset_repository=dataset_repository,
+            run_repository=run_repository,
+            retrieval_service=retrieval_service,
+            rag_agent=rag_agent,
+            llm_judge=llm_judge,
+            max_concurrency=2,
+        )
+        test_cases = tuple(_make_test_case(f"tc{i}") for i in range(4))
+        dataset_repository.find_by_id.return_value = _make_dataset("ds-001", test_cases)
+        retrieval_service.retrieve.return_value = [self._make_retrieved_chunk("chunk1", 0.95)]
+        in_flight = 0
+        peak = 0
+
+        async def answer(question: str, retrieved_chunks: list) -> mock.MagicMock:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            answer_mock = mock.MagicMock()
+            answer_mock.answer = f"Answer to {question}"
+            return answer_mock
+
+        rag_agent.answer.side_effect = answer
+        llm_judge.score_all.return_value = judge_module.AnswerEvaluation(
+            faithfulness=0.9, answer_relevancy=0.8,
+        )
+        run_repository.save_with_results.side_effect = lambda run: run
+        cmd = command.RunEvaluation(k=5, evaluation_type=model.EvaluationType.FULL_RAG)
+
+        # Act
+        detail = await handler.handle("ds-001", cmd)
+
+        # Assert
+        assert [r.generated_answer for r in detail.results] == [
+            f"Answer to {tc.question}" for tc in test_cases
+        ]
+        assert peak == 2
 
     @pytest.mark.asyncio()
     async def test_retrieval_only_still_works_without_generation(
@@ -1,11 +1,15 @@
 """Tests for LLMJudge adapter."""
 
-import json
+import asyncio
 from unittest import mock
 
+import pydantic
+import pydantic_ai.exceptions
 import pytest
 
+from src.chunk.domain import model as chunk_model
 from src.evaluation.adapter import judge
+from src.evaluation.domain import model
 
 
 def _make_judge() -> judge.LLMJudge:
@@ -13,110 +17,113 @@ def _make_judge() -> judge.LLMJudge:
     return judge.LLMJudge(eval_model="test")
 
 
-class TestParseScore:
-    """Tests for LLMJudge._parse_score."""
+class TestAgentSettings:
+    """Tests for the judge agents' generation settings."""
 
-    def test_valid_json_returns_score(self) -> None:
+    def test_agents_decode_greedily_with_bounded_output(self) -> None:
         # Arrange
         j = _make_judge()
-        output = json.dumps({"score": 0.85, "reasoning": "Well grounded."})
 
         # Act
-        result = j._parse_score(output)
+        settings = [j._evaluation_agent.model_settings, j._citation_agent.model_settings]
 
         # Assert
-        assert result == 0.85
+        assert [s["temperature"] for s in settings] == [0.0, 0.0]
+        assert [s["max_tokens"] for s in settings] == [
+            judge.EVALUATION_MAX_TOKENS,
+            judge.CITATION_MAX_TOKENS,
+        ]
 
-    def test_markdown_wrapped_json_returns_score(self) -> None:
-        # Arrange
-        j = _make_judge()
-        output = "```json\n" + json.dumps({"score": 0.7, "reasoning": "ok"}) + "\n```"
 
+    def test_agents_share_one_model(self) -> None:
         # Act
-        result = j._parse_score(output)
-
-        # Assert
-        assert result == 0.7
-
-    def test_invalid_json_returns_zero(self) -> None:
-        # Arrange
         j = _make_judge()
 
-        # Act
-        result = j._parse_score("not valid json")
-
         # Assert
-        assert result == 0.0
+        assert j._evaluation_agent.model is j._citation_agent.model
 
-    def test_missing_score_key_returns_zero(self) -> None:
-        # Arrange
-        j = _make_judge()
-        output = json.dumps({"reasoning": "no score here"})
-
-        # Act
-        result = j._parse_score(output)
 
-        # Assert
-        assert result == 0.0
+class TestToAnswerEvaluation:
+    """Tests for LLMJudge._to_answer_evaluation."""
 
-    def test_score_above_one_clamped(self) -> None:
+    def test_scores_are_mapped_to_metrics(self) -> None:
         # Arrange
         j = _make_judge()
-        output = json.dumps({"score": 1.5, "reasoning": "too high"})
+        output = judge.EvaluationOutput(faithfulness=0.9, relevancy=0.8, completeness=0.7)
 
         # Act
-        result = j._parse_score(output)
+        evaluation = j._to_answer_evaluation(output)
 
         # Assert
-        assert result == 1.0
+        assert evaluation.faithfulness == 0.9
+        assert evaluation.answer_relevancy == 0.8
+        assert evaluation.answer_completeness == 0.7
 
-    def test_score_below_zero_clamped(self) -> None:
+    def test_scores_outside_range_are_clamped(self) -> None:
         # Arrange
         j = _make_judge()
-        output = json.dumps({"score": -0.3, "reasoning": "too low"})
+        output = judge.EvaluationOutput(faithfulness=1.5, relevancy=-0.3, completeness=1.0)
 
         # Act
-        result = j._parse_score(output)
+        evaluation = j._to_answer_evaluation(output)
 
         # Assert
-        assert result == 0.0
+        assert evaluation.faithfulness == 1.0
+        assert evaluation.answer_relevancy == 0.0
+        assert evaluation.answer_completeness == 1.0
 
-    def test_integer_score_converted_to_float(self) -> None:
+    def test_claims_are_converted_to_dicts(self) -> None:
         # Arrange
         j = _make_judge()
-        output = json.dumps({"score": 1, "reasoning": "perfect"})
+        output = judge.EvaluationOutput(
+            faithfulness=1.0,
+            relevancy=1.0,
+            completeness=1.0,
+            claims=[
+                judge.ClaimOutput(
+                    claim_text="c",
+                    verdict=model.ClaimVerdict.SUPPORTED,
+                    supporting_chunks=[1],
+                )
+            ],
+        )
 
         # Act
-        result = j._parse_score(output)
+        evaluation = j._to_answer_evaluation(output)
 
         # Assert
-        assert result == 1.0
-        assert isinstance(result, float)
+        assert evaluation.claims == (
+            {"claim_text": "c", "verdict": "supported", "supporting_chunks": [1], "reasoning": ""},
+        )
 
-    def test_score_string_value_returns_zero(self) -> None:
-        # Arrange
-        j = _make_judge()
-        output = json.dumps({"score": "high", "reasoning": "not a number"})
 
-        # Act
-        result = j._parse_score(output)
+class TestEvaluationOutput:
+    """Tests for the structured judge output schema."""
 
-        # Assert
-        assert result == 0.0
+    def test_unknown_verdict_is_rejected(self) -> None:
+        # Act & Assert
+        with pytest.raises(pydantic.ValidationError):
+            judge.ClaimOutput.model_validate({"claim_text": "c", "verdict": "maybe"})
+
+    def test_non_numeric_score_is_rejected(self) -> None:
+        # Act & Assert
+        with pytest.raises(pydantic.ValidationError):
+            judge.EvaluationOutput.model_validate(
+                {"faithfulness": "high", "relevancy": 0.5, "completeness": 0.5}
+            )
 
 
 class TestScoreFaithfulness:
-    """Tests for LLMJudge.score_faithfulness with mocked agent."""
+    """Tests for LLMJudge.score_faithfulness with mocked evaluation agent."""
 
     @pytest.mark.asyncio
     async def test_returns_parsed_score(self) -> None:
         # Arrange
         j = _make_judge()
-        llm_output = json.dumps({"score": 0.9, "reasoning": "Grounded in context."})
         mock_result = mock.MagicMock()
-        mock_result.output = llm_output
-
-        from src.chunk.domain import model as chunk_model
+        mock_result.output = judge.EvaluationOutput(
+            faithfulness=0.9, relevancy=0.7, completeness=0.6
+        )
 
         chunk = chunk_model.Chunk.create(
             document_id="doc1",
@@ -127,7 +134,7 @@ class TestScoreFaithfulness:
             token_count=5,
         )
 
-        with mock.patch.object(j._faithfulness_agent, "run", return_value=mock_result):
+        with mock.patch.object(j._evaluation_agent, "run", return_value=mock_result):
             # Act
             score = await j.score_faithfulness(
                 question="What is AI?",
@@ -144,7 +151,7 @@ class TestScoreFaithfulness:
         j = _make_judge()
 
         with mock.patch.object(
-            j._faithfulness_agent,
+            j._evaluation_agent,
             "run",
             side_effect=RuntimeError("LLM unavailable"),
         ):
@@ -160,21 +167,23 @@ class TestScoreFaithfulness:
 
 
 class TestScoreAnswerRelevancy:
-    """Tests for LLMJudge.score_answer_relevancy with mocked agent."""
+    """Tests for LLMJudge.score_answer_relevancy with mocked evaluation agent."""
 
     @pytest.mark.asyncio
     async def test_returns_parsed_score(self) -> None:
         # Arrange
         j = _make_judge()
-        llm_output = json.dumps({"score": 0.8, "reasoning": "Relevant."})
         mock_result = mock.MagicMock()
-        mock_result.output = llm_output
+        mock_result.output = judge.EvaluationOutput(
+            faithfulness=0.5, relevancy=0.8, completeness=0.4
+        )
 
-        with mock.patch.object(j._relevancy_agent, "run", return_value=mock_result):
+        with mock.patch.object(j._evaluation_agent, "run", return_value=mock_result):
             # Act
             score = await j.score_answer_relevancy(
                 question="What is AI?",
                 answer="AI is a branch of computer science.",
+                context_chunks=[],
             )
 
         # Assert
@@ -186,7 +195,7 @@ class TestScoreAnswerRelevancy:
         j = _make_judge()
 
         with mock.patch.object(
-            j._relevancy_agent,
+            j._evaluation_agent,
             "run",
             side_effect=RuntimeError("LLM unavailable"),
         ):
@@ -194,7 +203,229 @@ class TestScoreAnswerRelevancy:
             score = await j.score_answer_relevancy(
                 question="What is AI?",
                 answer="Something irrelevant.",
+                context_chunks=[],
             )
 
         # Assert
         assert score == 0.0
+
+
+class TestScoreBatch:
+    """Tests for LLMJudge.score_batch."""
+
+    @pytest.mark.asyncio
+    async def test_scores_every_case_in_order(self) -> None:
+        # Arrange
+        j = _make_judge()
+        outputs = {
+            "q1": judge.EvaluationOutput(faithfulness=0.9, relevancy=0.8, completeness=0.7),
+            "q2": judge.EvaluationOutput(faithfulness=0.4, relevancy=0.3, completeness=0.2),
+        }
+
+        async def fake_run(prompt: str) -> mock.MagicMock:
+            question = prompt.split("Question: ")[1].split("\n")[0]
+            result = mock.MagicMock()
+            result.output = outputs[question]
+            return result
+
+        cases = [("q1", "a1", []), ("q2", "a2", [])]
+
+        with mock.patch.object(j._evaluation_agent, "run", side_effect=fake_run) as mock_run:
+            # Act
+            results = await j.score_batch(cases)
+
+        # Assert
+        assert [r.faithfulness for r in results] == [0.9, 0.4]
+        assert [r.answer_relevancy for r in results] == [0.8, 0.3]
+        assert [r.answer_completeness for r in results] == [0.7, 0.2]
+        assert mock_run.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_returns_empty_list(self) -> None:
+        # Arrange
+        j = _make_judge()
+
+        # Act
+        results = await j.score_batch([])
+
+        # Assert
+        assert results == []
+
+
+class TestScoreAll:
+    """Tests for LLMJudge.score_all combined evaluation."""
+
+    @pytest.mark.asyncio
+    async def test_all_metrics_share_one_llm_call(self) -> None:
+        # Arrange
+        j = _make_judge()
+        mock_result = mock.MagicMock()
+        mock_result.output = judge.EvaluationOutput(
+            faithfulness=0.9,
+            relevancy=0.8,
+            completeness=0.7,
+            claims=[judge.ClaimOutput(claim_text="c", verdict=model.ClaimVerdict.SUPPORTED)],
+        )
+
+        with mock.patch.object(j._evaluation_agent, "run", return_value=mock_result) as mock_run:
+            # Act
+            faithfulness, relevancy = await asyncio.gather(
+                j.score_faithfulness("q", "a", []),
+                j.score_answer_relevancy("q", "a", []),
+            )
+            completeness = await j.score_answer_completeness("q", "a", [])
+            claims = await j.analyze_hallucinations("q", "a", [])
+
+        # Assert
+        assert (faithfulness, relevancy, completeness) == (0.9, 0.8, 0.7)
+        assert claims == {
+            "claims": [
+                {"claim_text": "c", "verdict": "supported", "supporting_chunks": [], "reasoning": ""}
+            ]
+        }
+        mock_run.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_call_is_not_cached(self) -> None:
+        # Arrange
+        j = _make_judge()
+        mock_result = mock.MagicMock()
+        mock_result.output = judge.EvaluationOutput(
+            faithfulness=0.6, relevancy=0.0, completeness=0.0
+        )
+
+        with mock.patch.object(
+            j._evaluation_agent,
+            "run",
+            side_effect=[RuntimeError("LLM unavailable"), mock_result],
+        ):
+            # Act
+            first = await j.score_all("q", "a", [])
+            second = await j.score_all("q", "a", [])
+
+        # Assert
+        assert first == judge.AnswerEvaluation()
+        assert second.faithfulness == 0.6
+
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_poison_cache(self) -> None:
+        # Arrange
+        j = _make_judge()
+        release = asyncio.Event()
+        mock_result = mock.MagicMock()
+        mock_result.output = judge.EvaluationOutput(
+            faithfulness=0.7, relevancy=0.6, completeness=0.5
+        )
+
+        async def slow_run(prompt: str) -> mock.MagicMock:
+            await release.wait()
+            return mock_result
+
+        with mock.patch.object(j._evaluation_agent, "run", side_effect=slow_run) as mock_run:
+            # Act
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(j.score_all("q", "a", []), timeout=0.01)
+            release.set()
+            evaluation = await j.score_all("q", "a", [])
+
+        # Assert
+        assert evaluation.faithfulness == 0.7
+        mock_run.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_call_is_not_cached(self) -> None:
+        # Arrange
+        j = _make_judge()
+        mock_result = mock.MagicMock()
+        mock_result.output = judge.EvaluationOutput(
+            faithfulness=0.7, relevancy=0.6, completeness=0.5
+        )
+
+        with mock.patch.object(
+            j._evaluation_agent,
+            "run",
+            side_effect=[asyncio.CancelledError(), mock_result],
+        ):
+            # Act
+            with pytest.raises(asyncio.CancelledError):
+                await j.score_all("q", "a", [])
+            evaluation = await j.score_all("q", "a", [])
+
+        # Assert
+        assert evaluation.faithfulness == 0.7
+
+    @pytest.mark.asyncio
+    async def test_truncated_output_is_logged_as_truncation(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        # Arrange
+        j = _make_judge()
+
+        with mock.patch.object(
+            j._evaluation_agent,
+            "run",
+            side_effect=pydantic_ai.exceptions.IncompleteToolCall("token limit exceeded"),
+        ):
+            # Act
+            evaluation = await j.score_all("q", "a", [])
+
+        # Assert
+        assert evaluation == judge.AnswerEvaluation()
+        assert "truncated" in caplog.text
+        assert "Failed to evaluate answer" not in caplog.text
+
+
+class TestEvaluationPrompt:
+    """Tests for the combined evaluation prompt layout."""
+
+    @pytest.mark.asyncio
+    async def test_context_precedes_question_and_answer(self) -> None:
+        # Arrange
+        j = _make_judge()
+        mock_result = mock.MagicMock()
+        mock_result.output = judge.EvaluationOutput(
+            faithfulness=1.0, relevancy=1.0, completeness=1.0
+        )
+        chunk = chunk_model.Chunk.create(
+            document_id="doc1",
+            content="Shared context.",
+            char_start=0,
+            char_end=15,
+            chunk_index=0,
+            token_count=3,
+        )
+
+        with mock.patch.object(j._evaluation_agent, "run", return_value=mock_result) as mock_run:
+            # Act
+            await j.score_all("First question?", "First answer.", [chunk])
+            await j.score_all("Second question?", "Second answer.", [chunk])
+
+        # Assert
+        first, second = (call.args[0] for call in mock_run.call_args_list)
+        shared_prefix = "Context Chunks:\n[1] Shared context.\n\nQuestion: "
+        assert first.startswith(shared_prefix)
+        assert second.startswith(shared_prefix)
+
+    def test_context_is_formatted_once_per_chunk_set(self) -> None:
+        # Arrange
+        j = _make_judge()
+        chunks = [
+            chunk_model.Chunk.create(
+                document_id="doc1",
+                content=f"Chunk {i}.",
+                char_start=0,
+                char_end=8,
+                chunk_index=i,
+                token_count=2,
+            )
+            for i in range(2)
+        ]
+
+        # Act
+        first = j._format_context(chunks)
+        second = j._format_context(list(chunks))
+
+        # Assert
+        assert first == "[1] Chunk 0.\n\n[2] Chunk 1."
+        assert second is first
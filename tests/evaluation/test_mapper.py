@@ -1,7 +1,6 @@
 """Tests for evaluation domain mappers."""
 
 import datetime
-import json
 
 from src.evaluation.domain import mapper
 from src.evaluation.domain import model
@@ -34,7 +33,7 @@ class TestDatasetMapperTestCaseToRecord:
             id="tc1",
             dataset_id="ds1",
             question="What is AI?",
-            ground_truth_chunk_ids=json.dumps(["chunk1", "chunk2"]),
+            ground_truth_chunk_ids=["chunk1", "chunk2"],
             source_chunk_id="chunk1",
             difficulty="analytical",
             created_at=now,
@@ -90,7 +89,7 @@ class TestDatasetMapperToEntity:
             id="tc1",
             dataset_id="ds1",
             question="How does AI work?",
-            ground_truth_chunk_ids=json.dumps(["chunk1"]),
+            ground_truth_chunk_ids=["chunk1"],
             source_chunk_id="chunk1",
             difficulty="inferential",
             created_at=now,
@@ -122,7 +121,7 @@ class TestDatasetMapperToEntity:
             id="tc2",
             dataset_id="ds2",
             question="What is ML?",
-            ground_truth_chunk_ids=json.dumps(["chunk2"]),
+            ground_truth_chunk_ids=["chunk2"],
             source_chunk_id="chunk2",
             difficulty=None,
             created_at=now,
@@ -157,7 +156,7 @@ class TestDatasetMapperToEntity:
                 id=f"tc{i}",
                 dataset_id="ds3",
                 question=f"Question {i}",
-                ground_truth_chunk_ids=json.dumps([f"chunk{i}"]),
+                ground_truth_chunk_ids=[f"chunk{i}"],
                 source_chunk_id=f"chunk{i}",
                 difficulty=diff,
                 created_at=now + datetime.timedelta(seconds=i),
@@ -362,8 +361,8 @@ class TestRunMapperToEntity:
             id="res1",
             run_id="run4",
             test_case_id="tc1",
-            retrieved_chunk_ids=json.dumps(["c1", "c2"]),
-            retrieved_scores=json.dumps([0.9, 0.8]),
+            retrieved_chunk_ids=["c1", "c2"],
+            retrieved_scores=[0.9, 0.8],
             precision=0.5,
             recall=1.0,
             hit=True,
@@ -503,3 +502,54 @@ class TestRunMapperRoundTrip:
         assert restored_result.generated_answer == "Generated response text."
         assert restored_result.faithfulness == 0.95
         assert restored_result.answer_relevancy == 0.90
+
+
+class TestRunMapperResultToEntity:
+    """Tests for RunMapper.result_to_entity."""
+
+    def test_matches_validated_result(self) -> None:
+        # Arrange
+        result = model.TestCaseResult(
+            id="res1",
+            test_case_id="tc1",
+            retrieved_chunk_ids=("c1", "c2"),
+            retrieved_scores=(0.9, 0.8),
+            precision=0.5,
+            recall=1.0,
+            hit=True,
+            reciprocal_rank=1.0,
+            ndcg=0.7,
+            map_score=0.6,
+            citation_support_score=0.4,
+            total_claims=3,
+        )
+        record = mapper.RunMapper.result_to_record(result=result, run_id="run1")
+
+        # Act
+        restored = mapper.RunMapper.result_to_entity(record)
+
+        # Assert
+        assert restored == result
+
+    def test_missing_ranking_scores_default_to_zero(self) -> None:
+        # Arrange
+        record = evaluation_schema.EvaluationTestCaseResultSchema(
+            id="res1",
+            run_id="run1",
+            test_case_id="tc1",
+            retrieved_chunk_ids=["c1"],
+            retrieved_scores=[0.9],
+            precision=1.0,
+            recall=1.0,
+            hit=True,
+            reciprocal_rank=1.0,
+            ndcg=None,
+            map_score=None,
+        )
+
+        # Act
+        restored = mapper.RunMapper.result_to_entity(record)
+
+        # Assert
+        assert (restored.ndcg, restored.map_score) == (0.0, 0.0)
+        assert restored.retrieved_chunk_ids == ("c1",)
@@ -1,6 +1,7 @@
 """Tests for retrieval evaluation metric functions."""
 
 from src.evaluation.domain import metric as metric_module
+from src.evaluation.domain import model
 
 
 class TestPrecisionAtK:
@@ -152,6 +153,39 @@ class TestReciprocalRank:
         assert result == 0.0
 
 
+class TestCaseMetrics:
+    """Tests for case_metrics function."""
+
+    def test_matches_individual_metrics(self) -> None:
+        """One pass gives the same values as the per-metric functions."""
+        retrieved, relevant, k = ["x", "a", "y", "b", "c"], {"a", "b", "z"}, 4
+
+        result = metric_module.case_metrics(retrieved, relevant, k)
+
+        assert result.precision == metric_module.precision_at_k(retrieved, relevant, k)
+        assert result.recall == metric_module.recall_at_k(retrieved, relevant, k)
+        assert result.hit is metric_module.hit_at_k(retrieved, relevant, k)
+        assert result.reciprocal_rank == metric_module.reciprocal_rank(retrieved, relevant, k)
+        assert result.ndcg == metric_module.ndcg_at_k(retrieved, relevant, k)
+        assert result.map_score == metric_module.average_precision_at_k(retrieved, relevant, k)
+
+    def test_no_relevant_found(self) -> None:
+        result = metric_module.case_metrics(["x", "y"], {"a"}, k=2)
+        assert result == model.CaseMetrics(
+            precision=0.0, recall=0.0, hit=False, reciprocal_rank=0.0
+        )
+
+    def test_empty_relevant(self) -> None:
+        result = metric_module.case_metrics(["a", "b"], set(), k=2)
+        assert result.precision == 0.0
+        assert result.hit is False
+
+    def test_k_zero(self) -> None:
+        result = metric_module.case_metrics(["a"], {"a"}, k=0)
+        assert result.recall == 0.0
+        assert result.map_score == 0.0
+
+
 class TestAggregateMetrics:
     """Tests for aggregate_metrics function."""
 